@@ -7,8 +7,12 @@ import time
 import re
 import concurrent.futures
 from functools import lru_cache
-import threading
 import random
+from spooled_text import text_prefix, is_blank, iter_text_lines
+from job_scheduler import longest_first, predict_makespan, format_stage_timing, PrioritySemaphore
+from llm_cache import create_chat_completion, stream_chat_completion
+from llm_batch import chat_request, request_custom_id, run_chat_batch
+from script_stream import ParagraphStreamWriter
 
 # 환경 변수 로드
 load_dotenv()
@@ -19,8 +23,26 @@ MAX_RETRIES = 3
 BASE_RETRY_DELAY = 1  # 초 단위
 MAX_WORKERS = 3  # 병렬 처리 워커 수
 
-# API 호출 세마포어 추가
-api_semaphore = threading.Semaphore(3)  # 최대 3개 동시 요청
+# 소스 분석 비용 추정 설정 (긴 소스부터 분석하여 전체 소요 시간 단축)
+ANALYSIS_BASE_SECONDS = 20.0  # 응답 생성 시간 (출력 길이가 비슷하므로 소스마다 거의 일정)
+ANALYSIS_SECONDS_PER_1K_CHARS = 0.5  # 입력 길이에 따른 추가 시간
+ANALYSIS_MAX_CHARS = 15000  # 원문 그대로 분석할 최대 길이 (더 긴 소스는 구간별 요점 정리 후 분석)
+
+# 긴 소스 map-reduce 분석 설정 (구간별 요점 정리 → 요점 전체로 소스 분석)
+MAP_CHUNK_CHARS = 24000  # 구간 하나의 목표 길이 (목표를 넘긴 뒤 첫 구조 경계에서 자름)
+MAP_MAX_CHUNKS = 16  # 소스 하나의 최대 구간 수 (넘으면 구간 길이를 늘림)
+MAP_MAX_CHUNK_CHARS = 100000  # 구간 길이 상한 (이 길이로도 다 담지 못하는 뒷부분은 생략)
+MAP_WORKERS = MAP_MAX_CHUNKS  # 소스 하나에서 동시에 제출할 구간 요약 수 (실제 동시 호출 수는 api_semaphore로 제한)
+MAP_MODEL = "gpt-4o-mini"  # 구간 요점 추출 모델 (짧은 응답으로 지연 최소화)
+MAP_MAX_TOKENS = 800  # 구간 요점 최대 길이
+MAP_CHUNK_SECONDS = 8.0  # 구간 요약 호출 하나의 예상 시간 (작업 비용 추정용)
+# 구간을 나눌 구조 경계 - 마크다운 제목, PDF 페이지 표시, DOCX 표 시작, 위키피디아 목차
+CHUNK_BOUNDARY_PATTERN = re.compile(r'^(#{1,6} |--- 페이지 \d+ ---$|표 \d+:$|목차: )')
+
+# API 호출 세마포어 추가 (소스 분석, 구간 요약, 스크립트 생성이 모두 이 한도를 공유)
+# 기본값 10은 약 200k자 소스의 구간(24k자씩 9개)을 한 번에 요약할 수 있는 크기
+API_MAX_CONCURRENT = int(os.getenv("OPENAI_MAX_CONCURRENT", "10"))  # 최대 동시 요청 수
+api_semaphore = PrioritySemaphore(API_MAX_CONCURRENT)
 
 def api_call_with_retry(func: Callable, *args, **kwargs) -> Any:
     """
@@ -34,25 +56,74 @@ def api_call_with_retry(func: Callable, *args, **kwargs) -> Any:
     Returns:
         함수 호출 결과
     """
-    with api_semaphore:
-        for attempt in range(MAX_RETRIES):
-            try:
-                # 첫 번째 시도가 아니면 약간의 지연 추가
-                if attempt > 0:
-                    # 지수 백오프 + 무작위성(jitter) 추가
-                    base_delay = BASE_RETRY_DELAY * (2 ** attempt)
-                    jitter = random.uniform(0, 0.5 * base_delay)
-                    delay = base_delay + jitter
-                    print(f"⚠️ API 호출 실패 ({attempt+1}/{MAX_RETRIES}), {delay:.2f}초 후 재시도")
-                    time.sleep(delay)
-                
-                return func(*args, **kwargs)
-            except Exception as e:
-                if attempt == MAX_RETRIES - 1:
-                    # 마지막 시도였다면 예외 발생
-                    raise
-                
-                print(f"⚠️ API 호출 실패 ({attempt+1}/{MAX_RETRIES}): {str(e)}")
+    with api_semaphore.slot():
+        return call_with_retries(func, *args, **kwargs)
+
+def map_call_with_retry(func: Callable, *args, **kwargs) -> Any:
+    """구간 요약(map) 호출용 재시도 래퍼 (같은 api_semaphore를 쓰되 빈 슬롯을 먼저 받음)"""
+    with api_semaphore.slot(priority=True):
+        return call_with_retries(func, *args, **kwargs)
+
+def call_with_retries(func: Callable, *args, **kwargs) -> Any:
+    """지수 백오프 + 무작위 지연으로 최대 MAX_RETRIES번 호출 (마지막 실패는 예외 발생)"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            # 첫 번째 시도가 아니면 약간의 지연 추가
+            if attempt > 0:
+                # 지수 백오프 + 무작위성(jitter) 추가
+                base_delay = BASE_RETRY_DELAY * (2 ** attempt)
+                jitter = random.uniform(0, 0.5 * base_delay)
+                delay = base_delay + jitter
+                print(f"⚠️ API 호출 실패 ({attempt+1}/{MAX_RETRIES}), {delay:.2f}초 후 재시도")
+                time.sleep(delay)
+            
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == MAX_RETRIES - 1:
+                # 마지막 시도였다면 예외 발생
+                raise
+            
+            print(f"⚠️ API 호출 실패 ({attempt+1}/{MAX_RETRIES}): {str(e)}")
+
+def chat_completion(prompt: str, model: str = "gpt-4o", temperature: float = 0.7,
+                    max_tokens: Optional[int] = None) -> str:
+    """
+    사용자 메시지 하나로 채팅 완성 호출 (재시도, 동시 요청 제한, LLM 응답 디스크 캐시 적용)
+    
+    Args:
+        prompt: 프롬프트
+        model: 모델 이름
+        temperature: 샘플링 온도
+        max_tokens: 최대 출력 토큰 수 (None이면 지정하지 않음)
+        
+    Returns:
+        응답 텍스트
+    """
+    return create_chat_completion(client, api_call_with_retry, model,
+                                  [{"role": "user", "content": prompt}], temperature, max_tokens)
+
+def chat_completion_to_file(prompt: str, output_path: str,
+                            on_paragraph: Optional[Callable[[int, str], None]] = None,
+                            model: str = "gpt-4o", temperature: float = 0.7,
+                            max_tokens: Optional[int] = None) -> str:
+    """
+    스트리밍 채팅 완성 호출 - 응답을 받는 대로 파일에 기록하고 문단이 끝날 때마다 on_paragraph 호출
+    
+    Args:
+        prompt: 프롬프트
+        output_path: 응답을 기록할 파일 경로
+        on_paragraph: 문단 완성 이벤트 처리 함수 (문단 번호, 문단 텍스트)
+        model: 모델 이름
+        temperature: 샘플링 온도
+        max_tokens: 최대 출력 토큰 수 (None이면 지정하지 않음)
+        
+    Returns:
+        전체 응답 텍스트
+    """
+    with ParagraphStreamWriter(output_path, on_paragraph) as writer:
+        return stream_chat_completion(client, api_call_with_retry, model,
+                                      [{"role": "user", "content": prompt}], temperature,
+                                      writer.feed, on_restart=writer.reset, max_tokens=max_tokens)
 
 def process_korean_text(text: str) -> str:
     """
@@ -105,7 +176,7 @@ def process_korean_text(text: str) -> str:
     return text
 
 
-def advanced_summarize_texts(texts: List[str], topic: str, structure: str, style: str = "international_relations_expert", output_dir: str = "output_analysis", additional_instructions: str = "", content_types: List[str] = ["longform", "shortform1", "shortform2"]) -> Dict[str, str]:
+def advanced_summarize_texts(texts: List[str], topic: str, structure: str, style: str = "international_relations_expert", output_dir: str = "output_analysis", additional_instructions: str = "", content_types: List[str] = ["longform", "shortform1", "shortform2"], batch_analysis: bool = False, on_longform_paragraph: Optional[Callable[[int, str], None]] = None) -> Dict[str, str]:
     """
     여러 텍스트를 통합 요약하고, 주제와 논리 구조에 맞는 콘텐츠 스크립트 생성
     향상된 버전: 국제관계/지정학/세계사 전문가 관점 강화, 한국어 스크립트 작성
@@ -120,6 +191,8 @@ def advanced_summarize_texts(texts: List[str], topic: str, structure: str, style
         output_dir: 중간 분석 결과물 저장 디렉토리
         additional_instructions: 스크립트 작성에 대한 추가 지시사항
         content_types: 생성할 콘텐츠 유형 리스트 (롱폼, 숏폼1, 숏폼2, 숏폼3)
+        batch_analysis: 소스별 분석을 배치 API로 처리할지 여부 (느리지만 저렴, 중단 후 재실행 시 이어서 진행)
+        on_longform_paragraph: 지정하면 롱폼 스크립트를 스트리밍으로 생성하고 문단이 완성될 때마다 호출 (문단 번호, 문단 텍스트)
         
     Returns:
         생성된 스크립트 딕셔너리 {'longform': 롱폼스크립트, 'shortform1': 숏폼스크립트1, 'shortform2': 숏폼스크립트2, ...}
@@ -139,7 +212,7 @@ def advanced_summarize_texts(texts: List[str], topic: str, structure: str, style
     print(f"📊 총 {len(texts)}개 소스 분석 중...")
     
     # 1. 각 소스별 국제관계/지정학/세계사 전문가 관점 분석 (병렬 처리)
-    source_summaries = analyze_sources_parallel(texts, topic, output_dir)
+    source_summaries = analyze_sources_parallel(texts, topic, output_dir, batch=batch_analysis)
     
     # 분석 결과가 없는 경우 종료
     if len(source_summaries) == 0:
@@ -160,71 +233,124 @@ def advanced_summarize_texts(texts: List[str], topic: str, structure: str, style
     # 결과 딕셔너리 초기화
     result = {content_type: "" for content_type in content_types}
     
-    # 3. 선택적 콘텐츠 생성
+    # 3. 선택적 콘텐츠 생성 - 스크립트들은 통합 분석에만 의존하므로 동시에 생성 (동시 호출 수는 api_semaphore로 제한)
+    script_jobs = {}
     if "longform" in content_types:
-        # 롱폼 스크립트 생성
+        # 롱폼 스크립트 생성 (가장 오래 걸리므로 먼저 제출)
         print("📝 국제관계/지정학/세계사 전문가 스타일의 롱폼 스크립트 생성 중...")
-        longform_script = create_longform_script(integrated_analysis, topic, structure, additional_instructions, output_dir)
-        # result["longform"] = create_longform_script(integrated_analysis, topic, structure, additional_instructions, output_dir)
-        if longform_script:
-            result["longform"] = process_korean_text(longform_script)
+        script_jobs["longform"] = (create_longform_script, (integrated_analysis, topic, structure, additional_instructions, output_dir,
+                                                            on_longform_paragraph is not None, on_longform_paragraph))
     
     # 숏폼 스크립트 생성
     shortform_indices = [int(content_type.replace("shortform", "")) for content_type in content_types if content_type.startswith("shortform")]
     
     for idx in shortform_indices:
         print(f"📝 숏폼 스크립트 #{idx} 생성 중...")
-        shortform_script = create_shortform_script(integrated_analysis, topic, idx, output_dir)
-        # result[f"shortform{idx}"] = create_shortform_script(integrated_analysis, topic, idx, output_dir)
-        if shortform_script:
-            result[f"shortform{idx}"] = process_korean_text(shortform_script)
+        script_jobs[f"shortform{idx}"] = (create_shortform_script, (integrated_analysis, topic, idx, output_dir))
+    
+    if script_jobs:
+        stage_started = time.time()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(script_jobs)) as executor:
+            future_to_type = {executor.submit(func, *args): content_type for content_type, (func, args) in script_jobs.items()}
+            for future in concurrent.futures.as_completed(future_to_type):
+                content_type = future_to_type[future]
+                # 스크립트 하나가 실패해도 나머지 결과는 유지
+                try:
+                    script = future.result()
+                except Exception as e:
+                    print(f"❌ {content_type} 스크립트 생성 중 오류: {str(e)}")
+                    continue
+                if script:
+                    result[content_type] = process_korean_text(script)
+                    print(f"✅ {content_type} 스크립트 생성 완료")
+                else:
+                    print(f"⚠️ {content_type} 스크립트 생성 실패")
+        print(f"⏱️ 스크립트 {len(script_jobs)}개 동시 생성: {time.time() - stage_started:.1f}초")
     
     print("✅ 모든 스크립트 생성 완료")
     return result
 
-def analyze_sources_parallel(texts: List[str], topic: str, output_dir: str) -> List[Dict[str, Any]]:
+def estimate_analysis_seconds(char_count: int) -> float:
+    """소스 하나의 분석 시간 추정 (긴 소스는 구간 요약 단계 포함, 작업 순서 결정용)"""
+    seconds = ANALYSIS_BASE_SECONDS + min(char_count, ANALYSIS_MAX_CHARS) / 1000 * ANALYSIS_SECONDS_PER_1K_CHARS
+    if char_count > ANALYSIS_MAX_CHARS:
+        chunk_count = min(MAP_MAX_CHUNKS, -(-char_count // MAP_CHUNK_CHARS))
+        seconds += -(-chunk_count // API_MAX_CONCURRENT) * MAP_CHUNK_SECONDS
+    return seconds
+
+def split_source_chunks(text: str, chunk_chars: int = MAP_CHUNK_CHARS) -> List[str]:
     """
-    병렬 처리를 사용하여 각 소스를 분석
+    긴 소스를 구조 경계(제목, 페이지 표시, 표, 빈 줄)에서 여러 구간으로 나누기
+    
+    구간 수가 MAP_MAX_CHUNKS를 넘지 않도록 필요하면 구간 길이를 늘리며,
+    SpooledText는 파일에서 한 줄씩 읽어 전체를 메모리에 올리지 않습니다.
     
     Args:
-        texts: 파싱된 소스 텍스트 리스트
-        topic: 콘텐츠 주제
-        output_dir: 결과물 저장 디렉토리
+        text: 소스 텍스트 (대용량 소스는 SpooledText)
+        chunk_chars: 구간 목표 길이
         
     Returns:
-        각 소스의 분석 결과 리스트
+        구간 텍스트 목록 (마지막 구간까지 담지 못한 뒷부분은 생략)
     """
-    source_summaries = []
+    chunk_chars = min(max(chunk_chars, -(-len(text) // MAP_MAX_CHUNKS)), MAP_MAX_CHUNK_CHARS)
+    hard_limit = int(chunk_chars * 1.25)  # 구조 경계가 없을 때 강제로 자르는 길이
+    chunks = []
+    current = []
+    size = 0
     
-    # 텍스트가 빈 경우 건너뛰는 필터링
-    valid_texts = [(i, text) for i, text in enumerate(texts) if text.strip()]
+    def flush() -> None:
+        nonlocal current, size
+        chunk = "\n".join(current).strip()
+        if chunk:
+            chunks.append(chunk)
+        current, size = [], 0
     
-    if not valid_texts:
-        print("⚠️ 분석할 유효한 텍스트가 없습니다.")
-        return []
+    for line in iter_text_lines(text):
+        is_boundary = not line.strip() or CHUNK_BOUNDARY_PATTERN.match(line)
+        if current and ((size >= chunk_chars and is_boundary) or size + len(line) > hard_limit):
+            flush()
+        # 줄바꿈 없이 매우 긴 줄은 글자 수로 나눔
+        while len(line) > hard_limit and len(chunks) < MAP_MAX_CHUNKS:
+            current.append(line[:chunk_chars])
+            flush()
+            line = line[chunk_chars:]
+        if len(chunks) >= MAP_MAX_CHUNKS:
+            break
+        current.append(line)
+        size += len(line) + 1
+    if len(chunks) < MAP_MAX_CHUNKS:
+        flush()
+    return chunks
 
-    # 작업량에 따라 워커 수 동적 조정
-    worker_count = min(MAX_WORKERS, len(valid_texts))
-    
-    # 많은 텍스트나 큰 텍스트인 경우 워커 수 감소
-    if len(valid_texts) > 5 or any(len(text) > 10000 for _, text in valid_texts):
-        worker_count = max(1, worker_count - 1)
-    
-    print(f"📊 총 {len(valid_texts)}개 소스 분석 중... (워커: {worker_count}개)")
+def build_chunk_prompt(index: int, chunk_number: int, chunk_count: int, chunk: str, topic: str) -> str:
+    """긴 소스의 구간 하나에 대한 요점 추출 프롬프트"""
+    return f"""
+다음은 소스 #{index+1}의 일부(구간 {chunk_number}/{chunk_count})입니다. 주제는 "{topic}"입니다.
+이 구간에서 국제관계/지정학/세계사 분석에 필요한 내용을 한국어 요점으로 빠짐없이 정리하세요:
+- 관련 국가, 인물, 기관 등 주요 행위자
+- 사건, 날짜, 수치, 지명 등 구체적 사실
+- 조약, 협정, 정책, 주장과 그 근거
+- 원문의 중요한 인용이나 평가
 
-    # 분석 함수 정의
-    def analyze_source(index_text_tuple: Tuple[int, str]) -> Dict[str, Any]:
-        index, text = index_text_tuple
-        try:
-            print(f"📝 소스 #{index+1} 국제관계/지정학/세계사 전문가 관점 분석 중...")
-            
-            # 텍스트가 너무 긴 경우 앞부분만 사용
-            max_chars = 15000  # 약 15,000자 제한
-            truncated_text = text[:max_chars] if len(text) > max_chars else text
-            if len(text) > max_chars:
-                truncated_text += "\n\n[텍스트가 너무 길어 나머지는 생략되었습니다]"
-                
-            summary_prompt = f"""
+추측이나 일반론은 넣지 말고 구간에 있는 내용만 정리하세요.
+
+구간 내용:
+{chunk}
+"""
+
+def build_source_analysis_prompt(index: int, topic: str, source_content: str) -> str:
+    """
+    소스 하나에 대한 국제관계/지정학/세계사 전문가 분석 프롬프트
+    
+    Args:
+        index: 소스 인덱스 (0부터)
+        topic: 콘텐츠 주제
+        source_content: 원문 또는 구간별 요점
+        
+    Returns:
+        프롬프트
+    """
+    return f"""
 당신은 국제관계, 지정학, 세계사 분야의 최고 전문가로, 소스 내용을 한국어로 분석합니다.
 
 소스 #{index+1}에 대한 심층 국제정치/지정학/세계사 분석을 한국어로 제공해주세요. 주제는 "{topic}"입니다.
@@ -279,42 +405,179 @@ def analyze_sources_parallel(texts: List[str], topic: str, output_dir: str) -> L
    - 국제관계 변화의 핵심 전환점들
 
 소스 내용:
-{truncated_text}
+{source_content}
 """
-            # OpenAI API 호출 (재시도 로직 포함)
-            def make_api_call():
-                res = client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[{"role": "user", "content": summary_prompt}],
-                    temperature=0.3,
-                )
-                return res.choices[0].message.content.strip()
-            
-            analysis = api_call_with_retry(make_api_call)
+
+def truncated_source_content(text: str) -> str:
+    """원문 앞부분 (SpooledText는 앞부분만 파일에서 읽음, 너무 긴 경우 생략 표시 추가)"""
+    source_content = text_prefix(text, ANALYSIS_MAX_CHARS)
+    if len(text) > ANALYSIS_MAX_CHARS:
+        source_content += "\n\n[텍스트가 너무 길어 나머지는 생략되었습니다]"
+    return source_content
+
+def save_source_analysis(index: int, analysis: str, output_dir: str) -> Dict[str, Any]:
+    """소스 분석 결과를 파일로 저장하고 결과 딕셔너리 반환"""
+    source_file = os.path.join(output_dir, f"source_{index+1}_intl_analysis.txt")
+    with open(source_file, "w", encoding="utf-8") as f:
+        f.write(f"소스 #{index+1} 국제관계/지정학/세계사 전문가 분석\n")
+        f.write("="*50 + "\n\n")
+        f.write(analysis)
+    
+    return {
+        "index": index+1,
+        "analysis": analysis,
+        "success": True
+    }
+
+def failed_source_analysis(index: int, text: str, error: str) -> Dict[str, Any]:
+    """분석 실패 결과 (소스 내용 일부 포함)"""
+    return {
+        "index": index+1,
+        "analysis": f"[분석 실패: {error}]\n\n소스 내용 일부:\n{text_prefix(text, 500)}...",
+        "success": False
+    }
+
+def summarize_source_chunk(index: int, chunk_number: int, chunk_count: int, chunk: str, topic: str) -> str:
+    """
+    긴 소스의 구간 하나에서 분석에 필요한 요점 추출 (map 단계)
+    
+    Args:
+        index: 소스 인덱스 (0부터)
+        chunk_number: 구간 번호 (1부터)
+        chunk_count: 전체 구간 수
+        chunk: 구간 텍스트
+        topic: 콘텐츠 주제
+        
+    Returns:
+        구간 요점 (한국어)
+    """
+    chunk_prompt = build_chunk_prompt(index, chunk_number, chunk_count, chunk, topic)
+    return create_chat_completion(client, map_call_with_retry, MAP_MODEL,
+                                  [{"role": "user", "content": chunk_prompt}], 0.2, MAP_MAX_TOKENS)
+
+def summarize_long_source(index: int, text: str, topic: str) -> Optional[str]:
+    """
+    긴 소스를 구간으로 나누어 동시에 요점 정리 (구간 요점은 원래 순서대로 이어 붙임)
+    
+    구간 요약 호출도 소스 분석과 같은 api_semaphore 한도 안에서 실행되며, 슬롯이 비면 기다리는 소스 분석보다
+    먼저 배정되어 이미 시작된 소스의 요약이 빨리 끝납니다.
+    
+    Args:
+        index: 소스 인덱스 (0부터)
+        text: 소스 텍스트 (대용량 소스는 SpooledText)
+        topic: 콘텐츠 주제
+        
+    Returns:
+        소스 분석에 사용할 구간별 요점 텍스트 또는 None (모든 구간 요약 실패)
+    """
+    chunks = split_source_chunks(text)
+    covered = sum(len(chunk) for chunk in chunks)
+    print(f"🧩 소스 #{index+1} 구간 분할 분석: {len(text):,}자 → {len(chunks)}개 구간")
+    
+    notes = [None] * len(chunks)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAP_WORKERS, len(chunks)) or 1) as executor:
+        futures = {
+            executor.submit(summarize_source_chunk, index, number + 1, len(chunks), chunk, topic): number
+            for number, chunk in enumerate(chunks)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            number = futures[future]
+            try:
+                notes[number] = future.result()
+            except Exception as e:
+                print(f"⚠️ 소스 #{index+1} 구간 {number+1}/{len(chunks)} 요약 실패: {str(e)}")
+    
+    return combine_chunk_notes(len(text), covered, notes)
+
+def combine_chunk_notes(char_count: int, covered: int, notes: List[Optional[str]]) -> Optional[str]:
+    """
+    구간별 요점을 원래 순서대로 이어 붙여 소스 분석 입력 생성 (reduce 단계 입력)
+    
+    Args:
+        char_count: 소스 전체 글자 수
+        covered: 구간에 담긴 글자 수 (전체보다 적으면 뒷부분 생략 표시)
+        notes: 구간 순서대로의 요점 (실패한 구간은 None)
+        
+    Returns:
+        요점 텍스트 또는 None (모든 구간 요약 실패)
+    """
+    succeeded = [number for number, note in enumerate(notes) if note]
+    if not succeeded:
+        return None
+    
+    sections = [f"[구간 {number+1}/{len(notes)}]\n{notes[number]}" for number in succeeded]
+    header = f"[긴 소스({char_count:,}자)를 {len(notes)}개 구간으로 나누어 정리한 요점입니다. 전체 내용을 바탕으로 분석하세요.]"
+    if len(succeeded) < len(notes):
+        header += f"\n[{len(notes) - len(succeeded)}개 구간은 요약하지 못해 빠져 있습니다]"
+    if covered < char_count * 0.95:
+        header += "\n[텍스트가 너무 길어 뒷부분은 생략되었습니다]"
+    return header + "\n\n" + "\n\n".join(sections)
+
+def analyze_sources_parallel(texts: List[str], topic: str, output_dir: str, batch: bool = False) -> List[Dict[str, Any]]:
+    """
+    병렬 처리를 사용하여 각 소스를 분석
+    
+    Args:
+        texts: 파싱된 소스 텍스트 리스트 (대용량 소스는 SpooledText)
+        topic: 콘텐츠 주제
+        output_dir: 결과물 저장 디렉토리
+        batch: True면 즉시 호출 대신 배치 API로 분석 (analyze_sources_batch)
+        
+    Returns:
+        각 소스의 분석 결과 리스트
+    """
+    source_summaries = []
+    
+    # 텍스트가 빈 경우 건너뛰는 필터링
+    valid_texts = [(i, text) for i, text in enumerate(texts) if not is_blank(text)]
+    
+    if not valid_texts:
+        print("⚠️ 분석할 유효한 텍스트가 없습니다.")
+        return []
+    
+    if batch:
+        return analyze_sources_batch(valid_texts, topic, output_dir)
+
+    # 작업량에 따라 워커 수 동적 조정
+    worker_count = min(MAX_WORKERS, len(valid_texts))
+    
+    # 많은 텍스트나 큰 텍스트인 경우 워커 수 감소
+    if len(valid_texts) > 5 or any(len(text) > 10000 for _, text in valid_texts):
+        worker_count = max(1, worker_count - 1)
+    
+    print(f"📊 총 {len(valid_texts)}개 소스 분석 중... (워커: {worker_count}개)")
+    
+    # 글자 수로 분석 시간을 추정해 긴 소스부터 제출 (마지막에 긴 소스 하나만 남는 상황 방지)
+    stage_started = time.time()
+    costs = [estimate_analysis_seconds(len(text)) for _, text in valid_texts]
+    valid_texts = [valid_texts[i] for i in longest_first(costs)]
+    predicted_seconds = predict_makespan(costs, worker_count)
+    print(f"📐 예상 분석 시간: {predicted_seconds:.0f}초 (긴 소스부터 분석)")
+
+    # 분석 함수 정의
+    def analyze_source(index_text_tuple: Tuple[int, str]) -> Dict[str, Any]:
+        index, text = index_text_tuple
+        try:
+            print(f"📝 소스 #{index+1} 국제관계/지정학/세계사 전문가 관점 분석 중...")
             
-            # 분석 결과 저장
-            source_file = os.path.join(output_dir, f"source_{index+1}_intl_analysis.txt")
-            with open(source_file, "w", encoding="utf-8") as f:
-                f.write(f"소스 #{index+1} 국제관계/지정학/세계사 전문가 분석\n")
-                f.write("="*50 + "\n\n")
-                f.write(analysis)
+            # 긴 소스는 구간별 요점을 동시에 정리(map)한 뒤 요점 전체로 분석(reduce)
+            source_content = None
+            if len(text) > ANALYSIS_MAX_CHARS:
+                source_content = summarize_long_source(index, text, topic)
+            if source_content is None:
+                # 짧은 소스이거나 구간 요약이 모두 실패한 경우 원문 앞부분 사용
+                source_content = truncated_source_content(text)
+                
+            summary_prompt = build_source_analysis_prompt(index, topic, source_content)
+            analysis = chat_completion(summary_prompt, temperature=0.3)
             
             print(f"✅ 소스 #{index+1} 국제관계/지정학 분석 완료")
-            
-            return {
-                "index": index+1,
-                "analysis": analysis,
-                "success": True
-            }
+            return save_source_analysis(index, analysis, output_dir)
             
         except Exception as e:
             print(f"⚠️ 소스 #{index+1} 분석 중 오류: {e}")
             # 실패한 경우에도 간단한 요약 시도
-            return {
-                "index": index+1,
-                "analysis": f"[분석 실패: {str(e)}]\n\n소스 내용 일부:\n{text[:500]}...",
-                "success": False
-            }
+            return failed_source_analysis(index, text, str(e))
     
     # 병렬 처리 실행
     with concurrent.futures.ThreadPoolExecutor(max_workers=worker_count) as executor:
@@ -375,6 +638,78 @@ def analyze_sources_parallel(texts: List[str], topic: str, output_dir: str) -> L
     # 성공한 분석 개수 확인
     success_count = sum(1 for s in source_summaries if s.get("success", False))
     print(f"📊 {len(source_summaries)}개 소스 중 {success_count}개 성공적으로 분석 완료")
+    print(format_stage_timing("소스 분석", predicted_seconds, time.time() - stage_started))
+    
+    return source_summaries
+
+def analyze_sources_batch(valid_texts: List[Tuple[int, str]], topic: str, output_dir: str) -> List[Dict[str, Any]]:
+    """
+    배치 API로 각 소스를 분석 - 긴 소스의 구간 요약(map)과 소스 분석(reduce)을 각각 배치 작업 하나로 제출
+    
+    요청별 결과와 진행 중인 배치 ID를 요청 묶음별 상태 파일(cache/llm_batches)에 기록하므로, 중간에 중단되어도
+    다시 실행하면 (새 출력 폴더에서도) 완료된 요청은 건너뛰고 진행 중이던 배치 작업을 이어서 기다립니다.
+    
+    Args:
+        valid_texts: (소스 인덱스, 텍스트) 튜플 리스트 (빈 텍스트 제외)
+        topic: 콘텐츠 주제
+        output_dir: 결과물 저장 디렉토리
+        
+    Returns:
+        각 소스의 분석 결과 리스트 (analyze_sources_parallel과 같은 형식)
+    """
+    stage_started = time.time()
+    print(f"📦 배치 API로 {len(valid_texts)}개 소스 분석 중... (중단 후 다시 실행하면 이어서 진행)")
+    
+    # 1. 긴 소스의 구간 요약 요청을 한 배치로 제출
+    map_requests = {}
+    source_chunks = {}  # 소스 인덱스 -> (구간에 담긴 글자 수, 구간별 요청 식별자)
+    for index, text in valid_texts:
+        if len(text) <= ANALYSIS_MAX_CHARS:
+            continue
+        chunks = split_source_chunks(text)
+        print(f"🧩 소스 #{index+1} 구간 분할 분석: {len(text):,}자 → {len(chunks)}개 구간")
+        custom_ids = []
+        for number, chunk in enumerate(chunks):
+            body = chat_request(build_chunk_prompt(index, number + 1, len(chunks), chunk, topic),
+                                MAP_MODEL, 0.2, MAP_MAX_TOKENS)
+            custom_id = request_custom_id(f"source-{index+1}-chunk-{number+1}", body)
+            map_requests[custom_id] = body
+            custom_ids.append(custom_id)
+        source_chunks[index] = (sum(len(chunk) for chunk in chunks), custom_ids)
+    
+    map_results = {}
+    if map_requests:
+        map_results = run_chat_batch(map_requests)
+    
+    # 2. 소스 분석 요청을 한 배치로 제출 (구간 요약이 모두 실패한 소스는 원문 앞부분 사용)
+    analysis_requests = {}
+    source_request_ids = {}
+    for index, text in valid_texts:
+        source_content = None
+        if index in source_chunks:
+            covered, custom_ids = source_chunks[index]
+            source_content = combine_chunk_notes(len(text), covered, [map_results.get(custom_id) for custom_id in custom_ids])
+        if source_content is None:
+            source_content = truncated_source_content(text)
+        body = chat_request(build_source_analysis_prompt(index, topic, source_content), "gpt-4o", 0.3)
+        custom_id = request_custom_id(f"source-{index+1}", body)
+        analysis_requests[custom_id] = body
+        source_request_ids[index] = custom_id
+    
+    analysis_results = run_chat_batch(analysis_requests)
+    
+    # 3. 요청 식별자로 결과를 소스에 다시 연결
+    source_summaries = []
+    for index, text in sorted(valid_texts):
+        analysis = analysis_results.get(source_request_ids[index])
+        if analysis:
+            source_summaries.append(save_source_analysis(index, analysis, output_dir))
+        else:
+            print(f"⚠️ 소스 #{index+1} 배치 분석 결과 없음")
+            source_summaries.append(failed_source_analysis(index, text, "배치 분석 결과 없음"))
+    
+    success_count = sum(1 for s in source_summaries if s.get("success", False))
+    print(f"📊 {len(source_summaries)}개 소스 중 {success_count}개 배치 분석 완료 ({time.time() - stage_started:.1f}초)")
     
     return source_summaries
 
@@ -439,16 +774,7 @@ def create_integrated_analysis(source_summaries: List[Dict[str, Any]], topic: st
 """
     
     try:
-        def make_api_call():
-            res = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": integration_prompt}],
-                temperature=0.4,
-            )
-            return res.choices[0].message.content.strip()
-        
-        # 재시도 로직으로 API 호출
-        integrated_analysis = api_call_with_retry(make_api_call)
+        integrated_analysis = chat_completion(integration_prompt, temperature=0.4)
         
         # 통합 분석 결과 저장
         with open(os.path.join(output_dir, "integrated_intl_analysis.txt"), "w", encoding="utf-8") as f:
@@ -489,7 +815,8 @@ def create_fallback_integrated_analysis(source_summaries: List[Dict[str, Any]])
     
     return fallback_analysis
 
-def create_longform_script(integrated_analysis: str, topic: str, structure: str, additional_instructions: str, output_dir: str) -> str:
+def create_longform_script(integrated_analysis: str, topic: str, structure: str, additional_instructions: str, output_dir: str,
+                           stream: bool = False, on_paragraph: Optional[Callable[[int, str], None]] = None) -> str:
     """
     통합 분석을 바탕으로 9-11분 길이의 롱폼 스크립트 생성
     
@@ -499,6 +826,8 @@ def create_longform_script(integrated_analysis: str, topic: str, structure: str,
         structure: 논리 구조
         additional_instructions: 추가 지시사항
         output_dir: 결과물 저장 디렉토리
+        stream: True면 생성되는 대로 final_longform_script.txt에 기록하고 문단 완성 이벤트 발생
+        on_paragraph: 문단 완성 이벤트 처리 함수 (문단 번호, 포맷 전 문단 텍스트)
         
     Returns:
         최종 롱폼 스크립트 텍스트
@@ -551,23 +880,18 @@ def create_longform_script(integrated_analysis: str, topic: str, structure: str,
 """
     
     try:
-        # API 호출 함수
-        def make_api_call():
-            res = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": script_prompt}],
-                temperature=0.7,
-                max_tokens=4000,
-            )
-            return res.choices[0].message.content.strip()
-        
-        final_script = api_call_with_retry(make_api_call)
+        script_file = os.path.join(output_dir, "final_longform_script.txt")
+        if stream:
+            # 완성된 문단부터 이벤트(프로젝트 폴더 기록, 진행 표시)를 보낼 수 있도록 스트리밍
+            final_script = chat_completion_to_file(script_prompt, script_file, on_paragraph,
+                                                   temperature=0.7, max_tokens=4000)
+        else:
+            final_script = chat_completion(script_prompt, temperature=0.7, max_tokens=4000)
         
         # 스크립트 포맷팅 개선
         final_script = format_script(final_script)
         
-        # 결과물 저장
-        script_file = os.path.join(output_dir, "final_longform_script.txt")
+        # 결과물 저장 (스트리밍한 경우 포맷팅한 최종본으로 교체)
         with open(script_file, "w", encoding="utf-8") as f:
             f.write(final_script)
             
@@ -635,17 +959,7 @@ def create_shortform_script(integrated_analysis: str, topic: str, shortform_numb
 """
     
     try:
-        # API 호출 함수
-        def make_api_call():
-            res = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": script_prompt}],
-                temperature=0.8,
-                max_tokens=1000,
-            )
-            return res.choices[0].message.content.strip()
-        
-        shortform_script = api_call_with_retry(make_api_call)
+        shortform_script = chat_completion(script_prompt, temperature=0.8, max_tokens=1000)
         
         # 스크립트 포맷팅 개선
         shortform_script = format_script(shortform_script)
@@ -0,0 +1,355 @@
+import asyncio
+import codecs
+import re
+import threading
+import time
+import random
+import logging
+import concurrent.futures
+from typing import Dict, List, Optional, Any, Tuple, Iterable
+from urllib.parse import urlparse
+
+import httpx
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 기본 설정
+DEFAULT_MAX_IN_FLIGHT = 32  # 전체 동시 요청 수 제한
+DEFAULT_PER_HOST_LIMIT = 4  # 호스트별 동시 요청 수 제한 (서버 예의)
+DEFAULT_TIMEOUT = 15.0  # 초 단위
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 응답 본문 제한 설정
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024  # 응답 본문 최대 크기 (압축 해제 후, 초과분은 잘라냄)
+DOWNLOAD_CHUNK_BYTES = 64 * 1024  # 스트리밍 읽기 단위
+CHARSET_SNIFF_BYTES = 64 * 1024  # 인코딩 추정에 사용할 본문 앞부분 크기
+BINARY_SNIFF_BYTES = 1024  # 바이너리 여부(NUL 바이트) 확인 범위
+TEXT_CONTENT_TYPES = {  # text/* 외에 허용할 문서 형식
+    "application/xhtml+xml", "application/xml", "application/rss+xml", "application/atom+xml"
+}
+CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+def is_http2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부 확인"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def is_brotli_available() -> bool:
+    """brotli 압축 해제 패키지(brotli 또는 brotlicffi) 설치 여부 확인"""
+    for module_name in ("brotli", "brotlicffi"):
+        try:
+            __import__(module_name)
+            return True
+        except ImportError:
+            continue
+    return False
+
+def get_accept_encoding() -> str:
+    """요청에 사용할 Accept-Encoding 값 (brotli는 해제할 수 있을 때만 요청)"""
+    return "gzip, deflate, br" if is_brotli_available() else "gzip, deflate"
+
+def get_content_type_error(content_type: Optional[str]) -> Optional[str]:
+    """
+    텍스트 문서가 아닌 응답이면 오류 메시지 반환 (본문을 받기 전에 확인)
+
+    Args:
+        content_type: Content-Type 헤더 값 (없으면 허용하고 본문으로 확인)
+
+    Returns:
+        오류 메시지 또는 None (허용되는 형식)
+    """
+    if not content_type:
+        return None
+    mime_type = content_type.split(";")[0].strip().lower()
+    if mime_type.startswith("text/") or mime_type in TEXT_CONTENT_TYPES:
+        return None
+    return f"지원하지 않는 콘텐츠 형식: {mime_type}"
+
+def get_declared_charset(content_type: Optional[str]) -> Optional[str]:
+    """Content-Type 헤더에 명시된 charset (알 수 없는 이름이면 None)"""
+    match = CHARSET_PATTERN.search(content_type or "")
+    if not match:
+        return None
+    try:
+        return codecs.lookup(match.group(1)).name
+    except LookupError:
+        return None
+
+def detect_encoding(content: bytes) -> str:
+    """응답 헤더에 charset이 없을 때 본문 앞부분(CHARSET_SNIFF_BYTES)으로 인코딩 추정"""
+    sample = content[:CHARSET_SNIFF_BYTES]
+    if len(content) > CHARSET_SNIFF_BYTES:
+        # 잘린 멀티바이트 문자가 추정을 방해하지 않도록 마지막 줄바꿈에서 자름
+        cut = sample.rfind(b"\n")
+        if cut > CHARSET_SNIFF_BYTES // 2:
+            sample = sample[:cut]
+    try:
+        from charset_normalizer import from_bytes
+        best = from_bytes(sample).best()
+        if best and best.encoding:
+            return best.encoding
+    except ImportError:
+        pass
+    return "utf-8"
+
+def decode_body(body: bytes, content_type: Optional[str]) -> Tuple[str, str]:
+    """
+    응답 본문 디코딩 - 헤더 charset, HTML meta charset, 앞부분 추정 순으로 인코딩 결정
+
+    Args:
+        body: 압축 해제된 응답 본문
+        content_type: Content-Type 헤더 값
+
+    Returns:
+        (디코딩된 텍스트, 사용한 인코딩)
+
+    Raises:
+        ValueError: 바이너리 응답인 경우 (Content-Type이 잘못 표시된 파일 등)
+    """
+    encoding = get_declared_charset(content_type)
+    if not encoding:
+        if b"\x00" in body[:BINARY_SNIFF_BYTES]:
+            raise ValueError("텍스트가 아닌 바이너리 응답입니다")
+        meta_match = META_CHARSET_PATTERN.search(body[:CHARSET_SNIFF_BYTES])
+        if meta_match:
+            try:
+                encoding = codecs.lookup(meta_match.group(1).decode("ascii")).name
+            except (LookupError, UnicodeDecodeError):
+                encoding = None
+    if not encoding:
+        encoding = detect_encoding(body)
+    return body.decode(encoding, errors="replace"), encoding
+
+def read_limited(chunks: Iterable[bytes], max_bytes: int) -> Tuple[bytes, bool]:
+    """
+    스트리밍 본문을 max_bytes까지만 읽기
+
+    Args:
+        chunks: 압축 해제된 본문 조각 이터레이터
+        max_bytes: 최대 바이트 수
+
+    Returns:
+        (본문, 잘렸는지 여부)
+    """
+    parts = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            return b"".join(parts)[:max_bytes], True
+    return b"".join(parts), False
+
+class AsyncFetcher:
+    """
+    asyncio 기반 HTTP 다운로드 엔진
+
+    백그라운드 스레드에서 이벤트 루프를 실행하고, 일반 스레드에서 submit()으로 요청을
+    넣으면 concurrent.futures.Future를 돌려줍니다. HTTP keep-alive 연결을 재사용하며
+    전체 동시 요청 수와 호스트별 동시 요청 수를 각각 제한합니다.
+    """
+
+    def __init__(self,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                 http2: bool = False,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 headers: Optional[Dict[str, str]] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        초기화
+
+        Args:
+            max_in_flight: 전체 동시 요청 수
+            per_host_limit: 호스트별 동시 요청 수
+            http2: HTTP/2 사용 여부 (h2 패키지 필요, 없으면 HTTP/1.1로 대체)
+            timeout: 연결/읽기 타임아웃 (초)
+            headers: 모든 요청에 사용할 기본 헤더
+            max_bytes: 응답 본문 최대 크기 (압축 해제 후, 초과분은 잘라냄)
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.per_host_limit = max(1, per_host_limit)
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.max_bytes = max_bytes
+
+        if http2 and not is_http2_available():
+            logger.warning("⚠️ HTTP/2를 사용하려면 'pip install httpx[http2]'가 필요합니다. HTTP/1.1로 진행합니다.")
+            http2 = False
+        self.http2 = http2
+
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._global_semaphore = None
+        self._host_semaphores = {}
+        self._ready = threading.Event()
+
+    def __enter__(self) -> "AsyncFetcher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """이벤트 루프 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="async-fetcher", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    def _run_loop(self) -> None:
+        """백그라운드 스레드에서 이벤트 루프 실행"""
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._init_client())
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _init_client(self) -> None:
+        """루프 내부에서 클라이언트와 세마포어 생성"""
+        limits = httpx.Limits(
+            max_connections=self.max_in_flight,
+            max_keepalive_connections=self.max_in_flight
+        )
+        self._client = httpx.AsyncClient(
+            http2=self.http2,
+            limits=limits,
+            timeout=httpx.Timeout(self.timeout),
+            headers=self.headers,
+            follow_redirects=True
+        )
+        self._global_semaphore = asyncio.Semaphore(self.max_in_flight)
+
+    def submit(self, url: str, headers: Optional[Dict[str, str]] = None) -> concurrent.futures.Future:
+        """
+        URL 다운로드 요청 (스레드 안전)
+
+        Args:
+            url: 다운로드할 URL
+            headers: 요청별 추가 헤더 (조건부 요청 헤더 등)
+
+        Returns:
+            fetch 결과 딕셔너리를 담는 Future
+        """
+        if self._loop is None:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, headers or {}), self._loop)
+
+    async def _fetch(self, url: str, headers: Dict[str, str]) -> Dict[str, Any]:
+        """
+        단일 URL 다운로드 - 전체/호스트별 제한 및 재시도 적용
+
+        본문은 스트리밍으로 max_bytes까지만 읽고, 텍스트 문서가 아닌 응답은 본문을 받지 않습니다.
+
+        Returns:
+            {'url', 'status_code', 'text', 'headers', 'error', 'elapsed',
+             'bytes_transferred', 'truncated', 'encoding'} 딕셔너리
+        """
+        host = urlparse(url).netloc
+        host_semaphore = self._host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = asyncio.Semaphore(self.per_host_limit)
+            self._host_semaphores[host] = host_semaphore
+
+        start = time.time()
+        async with host_semaphore, self._global_semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                if attempt > 0:
+                    # 지수 백오프 + 무작위성(jitter)
+                    delay = BACKOFF_FACTOR * (2 ** (attempt - 1))
+                    await asyncio.sleep(delay + random.uniform(0, 0.5 * delay))
+
+                try:
+                    async with self._client.stream("GET", url, headers=headers) as response:
+                        if response.status_code in RETRY_STATUS_CODES and attempt < MAX_RETRIES:
+                            logger.warning(f"⚠️ HTTP {response.status_code} 응답, 재시도 ({attempt+1}/{MAX_RETRIES+1}): {url[:60]}")
+                            continue
+
+                        text, encoding, truncated, error = "", None, False, None
+                        if 200 <= response.status_code < 300:  # 304와 오류 응답은 본문 불필요
+                            content_type = response.headers.get("Content-Type")
+                            error = get_content_type_error(content_type)
+                            if not error:
+                                body, truncated = await self._read_limited(response)
+                                try:
+                                    text, encoding = decode_body(body, content_type)
+                                except ValueError as e:
+                                    error = str(e)
+
+                        return {
+                            "url": url,
+                            "status_code": response.status_code,
+                            "text": text,
+                            "headers": response.headers,
+                            "error": error,
+                            "elapsed": time.time() - start,
+                            "bytes_transferred": response.num_bytes_downloaded,
+                            "truncated": truncated,
+                            "encoding": encoding
+                        }
+                except httpx.HTTPError as e:
+                    if attempt == MAX_RETRIES:
+                        return {
+                            "url": url,
+                            "status_code": None,
+                            "text": "",
+                            "headers": {},
+                            "error": f"{type(e).__name__}: {str(e) or '요청 실패'}",
+                            "elapsed": time.time() - start
+                        }
+                    logger.warning(f"⚠️ URL 요청 실패 ({attempt+1}/{MAX_RETRIES+1}): {url[:60]} - {str(e)}")
+
+    async def _read_limited(self, response: httpx.Response) -> Tuple[bytes, bool]:
+        """스트리밍 응답 본문을 max_bytes까지만 읽기 (압축 해제 후 기준)"""
+        parts = []
+        size = 0
+        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_BYTES):
+            parts.append(chunk)
+            size += len(chunk)
+            if size > self.max_bytes:
+                return b"".join(parts)[:self.max_bytes], True
+        return b"".join(parts), False
+
+    def close(self) -> None:
+        """클라이언트 종료 및 이벤트 루프 정지"""
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), self._loop).result(timeout=5)
+        except Exception as e:
+            logger.warning(f"⚠️ HTTP 클라이언트 종료 중 오류: {str(e)}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+def fetch_urls(requests_: List[Tuple[str, Dict[str, str]]], **kwargs) -> List[Dict[str, Any]]:
+    """
+    여러 URL을 동시에 다운로드 (입력 순서대로 결과 반환)
+
+    Args:
+        requests_: (URL, 요청별 헤더) 튜플 목록
+        **kwargs: AsyncFetcher 설정
+
+    Returns:
+        fetch 결과 딕셔너리 목록
+    """
+    with AsyncFetcher(**kwargs) as fetcher:
+        futures = [fetcher.submit(url, headers) for url, headers in requests_]
+        return [future.result() for future in futures]
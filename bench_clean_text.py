@@ -0,0 +1,72 @@
+import argparse
+import glob
+import os
+import time
+from typing import List, Tuple
+
+from source_parser_updated import clean_text
+
+# 기본 설정
+DEFAULT_PATTERN = "output_*/sources/*.txt"  # 기존 프로젝트 출력의 소스 텍스트
+DEFAULT_REPEAT = 5
+
+def load_fixtures(pattern: str) -> List[Tuple[str, str]]:
+    """
+    벤치마크용 텍스트 파일 로드
+
+    Args:
+        pattern: 파일 glob 패턴
+
+    Returns:
+        (파일 경로, 내용) 튜플 목록
+    """
+    fixtures = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, 'r', encoding='utf-8') as f:
+            fixtures.append((path, f.read()))
+    return fixtures
+
+def measure(text: str, repeat: int) -> float:
+    """clean_text를 repeat회 실행하여 가장 빠른 실행 시간(초) 반환"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        clean_text(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description='clean_text 처리량(MB/s) 측정')
+    parser.add_argument('--pattern', default=DEFAULT_PATTERN, help=f'입력 파일 glob 패턴 (기본: {DEFAULT_PATTERN})')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help=f'파일당 반복 횟수 (기본: {DEFAULT_REPEAT})')
+    parser.add_argument('--scale', type=int, default=1, help='모든 파일을 이어 붙인 텍스트를 N배로 늘려 추가 측정 (대용량 PDF 덤프 모사)')
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.pattern)
+    if not fixtures:
+        print(f"❌ 입력 파일이 없습니다: {args.pattern}")
+        return
+
+    print(f"{'파일':<60} {'크기(KB)':>10} {'시간(ms)':>10} {'MB/s':>8}")
+    total_bytes = 0
+    total_seconds = 0.0
+    for path, text in fixtures:
+        size = len(text.encode('utf-8'))
+        seconds = measure(text, args.repeat)
+        total_bytes += size
+        total_seconds += seconds
+        print(f"{os.path.relpath(path):<60} {size / 1024:>10.1f} {seconds * 1000:>10.2f} {size / 1024 / 1024 / seconds:>8.1f}")
+
+    print(f"\n📊 합계: {len(fixtures)}개 파일, {total_bytes / 1024 / 1024:.2f} MB, "
+          f"{total_bytes / 1024 / 1024 / total_seconds:.1f} MB/s")
+
+    if args.scale > 1:
+        # 여러 줄로 이어 붙여 중복 줄 제거 경로까지 측정
+        combined = '\n'.join(text for _, text in fixtures) * args.scale
+        size = len(combined.encode('utf-8'))
+        seconds = measure(combined, args.repeat)
+        print(f"📊 결합 텍스트 x{args.scale}: {size / 1024 / 1024:.2f} MB, {seconds:.3f}초, "
+              f"{size / 1024 / 1024 / seconds:.1f} MB/s")
+
+if __name__ == "__main__":
+    main()
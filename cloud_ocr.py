@@ -242,7 +242,8 @@ class CloudOCRProcessor:
     def parse_image(self, 
                    image_path: str, 
                    preprocess: bool = True,
-                   ocr_level: str = 'advanced') -> str:
+                   ocr_level: str = 'advanced',
+                   preprocessed_path: Optional[str] = None) -> str:
         """
         이미지에서 텍스트 추출 - 논문 특화 처리
         
@@ -250,6 +251,8 @@ class CloudOCRProcessor:
             image_path: 이미지 파일 경로
             preprocess: 이미지 전처리 사용 여부
             ocr_level: OCR 처리 수준 ('basic', 'advanced')
+            preprocessed_path: prepare_ocr_image()로 미리 전처리한 이미지 경로.
+                지정하면 로드/전처리를 건너뛰고 OCR 후 파일을 삭제함
             
         Returns:
             추출된 텍스트
@@ -264,30 +267,27 @@ class CloudOCRProcessor:
             if self.ocr_engine not in self.available_engines:
                 return f"{self.ocr_engine} 엔진은 사용할 수 없습니다. 사용 가능한 엔진: {', '.join(self.available_engines)}"
 
-            # 이미지 로드
-            image = self._load_image(image_path)
-            
-            # 이미지 전처리
-            if preprocess:
-                processed_image = self._preprocess_image(image)
+            if preprocessed_path:
+                # 다른 프로세스에서 전처리를 마친 이미지 사용
+                temp_img_path = preprocessed_path
+                with Image.open(temp_img_path) as processed_image:
+                    processed_image.load()
             else:
-                processed_image = image
-            
-            # 임시 파일로 저장 (API 요청용)
-            temp_img_path = os.path.join(self.temp_dir, f"temp_{uuid.uuid4()}.png")
-            processed_image.save(temp_img_path)
+                # 이미지 로드
+                image = self._load_image(image_path)
+                
+                # 이미지 전처리
+                if preprocess:
+                    processed_image = self._preprocess_image(image)
+                else:
+                    processed_image = image
+                
+                # 임시 파일로 저장 (API 요청용)
+                temp_img_path = os.path.join(self.temp_dir, f"temp_{uuid.uuid4()}.png")
+                processed_image.save(temp_img_path)
             
             # OCR 실행
-            if self.ocr_engine == "google":
-                extracted_text = self._process_with_google_vision(temp_img_path)
-            elif self.ocr_engine == "aws":
-                extracted_text = self._process_with_aws_textract(temp_img_path)
-            elif self.ocr_engine == "azure":
-                extracted_text = self._process_with_azure(temp_img_path)
-            elif self.ocr_engine == "naver":
-                extracted_text = self._process_with_naver_clova(temp_img_path)
-            else:
-                extracted_text = "지원하지 않는 OCR 엔진입니다."
+            extracted_text = self._run_engine(temp_img_path)
             
             # 임시 파일 삭제
             if os.path.exists(temp_img_path):
@@ -312,60 +312,44 @@ class CloudOCRProcessor:
             logger.error(f"❌ {self.ocr_engine.upper()} OCR 처리 오류 ({image_path}): {str(e)}")
             return f"이미지 파싱 오류: {image_path}\n오류 세부사항: {str(e)}"
     
+    def recognize(self, image_path: str) -> str:
+        """
+        전처리를 마친 이미지 한 장의 OCR - 파일 정보 헤더 없이 본문 텍스트만 반환
+        
+        PDF 스캔 페이지처럼 여러 이미지를 하나의 문서로 합칠 때 사용합니다.
+        여러 스레드에서 같은 처리기로 동시에 호출할 수 있습니다.
+        
+        Args:
+            image_path: OCR할 이미지 파일 경로
+            
+        Returns:
+            후처리된 텍스트 (인식된 텍스트가 없으면 빈 문자열)
+        """
+        if self.ocr_engine not in self.available_engines:
+            raise RuntimeError(f"{self.ocr_engine} 엔진은 사용할 수 없습니다.")
+        
+        extracted_text = self._run_engine(image_path)
+        return self._post_process_academic(extracted_text) if extracted_text else ""
+    
+    def _run_engine(self, image_path: str) -> str:
+        """선택한 엔진으로 OCR 실행"""
+        if self.ocr_engine == "google":
+            return self._process_with_google_vision(image_path)
+        elif self.ocr_engine == "aws":
+            return self._process_with_aws_textract(image_path)
+        elif self.ocr_engine == "azure":
+            return self._process_with_azure(image_path)
+        elif self.ocr_engine == "naver":
+            return self._process_with_naver_clova(image_path)
+        return "지원하지 않는 OCR 엔진입니다."
+    
     def _load_image(self, image_path: str) -> Image.Image:
         """이미지 로드 및 기본 검증"""
-        try:
-            img = Image.open(image_path)
-            
-            # 이미지가 너무 크면 처리 속도를 위해 리사이징
-            max_dimension = 4000
-            if max(img.size) > max_dimension:
-                ratio = max_dimension / max(img.size)
-                new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
-                img = img.resize(new_size, Image.LANCZOS)
-                logger.info(f"🔄 큰 이미지 리사이징: {img.size}")
-            
-            return img
-        except Exception as e:
-            logger.error(f"❌ 이미지 로드 실패: {str(e)}")
-            raise
+        return load_ocr_image(image_path)
     
     def _preprocess_image(self, image: Image.Image) -> Image.Image:
         """학술 문서 이미지 전처리 - 논문 가독성 향상"""
-        try:
-            # 원본 이미지 복사
-            img = image.copy()
-            
-            # 그레이스케일 변환 (컬러 이미지인 경우)
-            if img.mode != 'L':
-                img = img.convert('L')
-            
-            # 노이즈 제거
-            img = img.filter(ImageFilter.MedianFilter(3))
-            
-            # 대비 향상
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(1.5)
-            
-            # 선명도 증가
-            enhancer = ImageEnhance.Sharpness(img)
-            img = enhancer.enhance(1.5)
-            
-            # 이진화 (적응형 임계값 - OpenCV 사용)
-            img_np = np.array(img)
-            _, binary = cv2.threshold(img_np, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-            
-            # 노이즈 제거를 위한 모폴로지 연산
-            kernel = np.ones((1, 1), np.uint8)
-            binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
-            
-            # NumPy 배열을 PIL 이미지로 변환
-            processed_img = Image.fromarray(binary)
-            
-            return processed_img
-        except Exception as e:
-            logger.warning(f"⚠️ 이미지 전처리 실패, 원본 이미지 사용: {str(e)}")
-            return image
+        return preprocess_ocr_image(image)
     
     def _process_with_google_vision(self, image_path: str) -> str:
         """Google Cloud Vision API를 사용한 OCR"""
@@ -590,13 +574,84 @@ class CloudOCRProcessor:
         
         return text
 
-def parse_cloud_ocr(path: str, engine: str = "google") -> str:
+def load_ocr_image(image_path: str) -> Image.Image:
+    """OCR용 이미지 로드 및 기본 검증 (너무 큰 이미지는 리사이징)"""
+    try:
+        img = Image.open(image_path)
+        
+        # 이미지가 너무 크면 처리 속도를 위해 리사이징
+        max_dimension = 4000
+        if max(img.size) > max_dimension:
+            ratio = max_dimension / max(img.size)
+            new_size = (int(img.size[0] * ratio), int(img.size[1] * ratio))
+            img = img.resize(new_size, Image.LANCZOS)
+            logger.info(f"🔄 큰 이미지 리사이징: {img.size}")
+        
+        return img
+    except Exception as e:
+        logger.error(f"❌ 이미지 로드 실패: {str(e)}")
+        raise
+
+def preprocess_ocr_image(image: Image.Image) -> Image.Image:
+    """학술 문서 이미지 전처리 - 논문 가독성 향상"""
+    try:
+        # 원본 이미지 복사
+        img = image.copy()
+        
+        # 그레이스케일 변환 (컬러 이미지인 경우)
+        if img.mode != 'L':
+            img = img.convert('L')
+        
+        # 노이즈 제거
+        img = img.filter(ImageFilter.MedianFilter(3))
+        
+        # 대비 향상
+        enhancer = ImageEnhance.Contrast(img)
+        img = enhancer.enhance(1.5)
+        
+        # 선명도 증가
+        enhancer = ImageEnhance.Sharpness(img)
+        img = enhancer.enhance(1.5)
+        
+        # 이진화 (적응형 임계값 - OpenCV 사용)
+        img_np = np.array(img)
+        _, binary = cv2.threshold(img_np, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        
+        # 노이즈 제거를 위한 모폴로지 연산
+        kernel = np.ones((1, 1), np.uint8)
+        binary = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
+        
+        # NumPy 배열을 PIL 이미지로 변환
+        processed_img = Image.fromarray(binary)
+        
+        return processed_img
+    except Exception as e:
+        logger.warning(f"⚠️ 이미지 전처리 실패, 원본 이미지 사용: {str(e)}")
+        return image
+
+def prepare_ocr_image(image_path: str, output_path: str) -> str:
+    """
+    OCR 전 이미지 로드/전처리 후 PNG로 저장 (CPU 작업 - 프로세스 풀에서 실행 가능)
+    
+    Args:
+        image_path: 원본 이미지 파일 경로
+        output_path: 전처리된 이미지를 저장할 경로
+        
+    Returns:
+        저장된 이미지 경로 (CloudOCRProcessor.parse_image의 preprocessed_path로 전달)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    preprocess_ocr_image(load_ocr_image(image_path)).save(output_path)
+    return output_path
+
+def parse_cloud_ocr(path: str, engine: str = "google", preprocessed_path: Optional[str] = None) -> str:
     """
     클라우드 OCR 서비스를 사용하여 이미지에서 텍스트 추출
     
     Args:
         path: 이미지 파일 경로
         engine: 사용할 OCR 엔진 ('google', 'aws', 'azure', 'naver')
+        preprocessed_path: prepare_ocr_image()로 미리 전처리한 이미지 경로 (없으면 여기서 전처리)
         
     Returns:
         추출된 텍스트
@@ -613,7 +668,8 @@ def parse_cloud_ocr(path: str, engine: str = "google") -> str:
         result = processor.parse_image(
             path,
             preprocess=True,
-            ocr_level='advanced'
+            ocr_level='advanced',
+            preprocessed_path=preprocessed_path
         )
         
         return result
@@ -0,0 +1,208 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Optional, List, Tuple
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 기본 설정
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 기본 캐시 크기 예산 (512MB)
+HASH_CHUNK_SIZE = 1024 * 1024  # 파일 해시 계산 시 읽기 단위 (1MB)
+
+def file_sha256(path: str) -> str:
+    """
+    파일 내용의 SHA-256 해시 계산 (대용량 파일도 일정한 메모리로 처리)
+
+    Args:
+        path: 해시를 계산할 파일 경로
+
+    Returns:
+        16진수 해시 문자열
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class DiskCache:
+    """JSON 파일 기반 디스크 캐시 - 크기 예산, TTL, LRU 제거 지원"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES, ttl: Optional[float] = None):
+        """
+        초기화
+
+        Args:
+            cache_dir: 캐시 파일 저장 디렉토리
+            max_bytes: 캐시 전체 크기 예산 (바이트). 초과 시 가장 오래 사용되지 않은 항목부터 제거
+            ttl: 기본 항목 유효 시간 (초). None이면 만료 없음
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._size = None  # 첫 쓰기 시점에 디렉토리를 스캔하여 계산
+
+    def _path(self, key: str) -> str:
+        """캐시 키를 파일 경로로 변환"""
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _scan(self) -> List[Tuple[float, int, str]]:
+        """캐시 디렉토리의 (최근 사용 시각, 크기, 경로) 목록 반환"""
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.json'):
+                    try:
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    except OSError:
+                        continue
+        return entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 항목 조회 - 조회된 항목은 최근 사용으로 표시 (LRU)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None (없거나 만료된 경우)
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 항목 로드 실패, 삭제합니다: {str(e)}")
+            self.delete(key)
+            return None
+
+        # 해시 충돌 방지를 위한 키 확인
+        if record.get('key') != key:
+            return None
+
+        # 만료 확인
+        expires = record.get('expires')
+        if expires is not None and time.time() > expires:
+            self.delete(key)
+            return None
+
+        # 최근 사용 시각 갱신 (LRU 순서 유지)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+        return record.get('value')
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
+        """
+        캐시 항목 저장 - 원자적 쓰기 후 크기 예산 초과 시 LRU 제거
+
+        Args:
+            key: 캐시 키
+            value: JSON 직렬화 가능한 값
+            ttl: 항목별 유효 시간 (초). None이면 기본 TTL 사용
+
+        Returns:
+            저장 성공 여부
+        """
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        record = {
+            'key': key,
+            'created': now,
+            'expires': now + ttl if ttl is not None else None,
+            'value': value
+        }
+
+        path = self._path(key)
+        try:
+            data = json.dumps(record, ensure_ascii=False).encode('utf-8')
+
+            # 단일 항목이 예산보다 크면 저장하지 않음
+            if len(data) > self.max_bytes:
+                logger.warning(f"⚠️ 캐시 항목이 크기 예산을 초과하여 저장하지 않습니다 ({len(data) / 1024 / 1024:.1f} MB)")
+                return False
+
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+            with self._lock:
+                if self._size is None:
+                    self._size = sum(size for _, size, _ in self._scan())
+
+                old_size = os.path.getsize(path) if os.path.exists(path) else 0
+
+                # 임시 파일에 쓴 뒤 교체 (동시 실행 중인 다른 프로세스가 깨진 파일을 읽지 않도록)
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+
+                self._size += len(data) - old_size
+                if self._size > self.max_bytes:
+                    self._evict_locked()
+
+            return True
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 저장 실패: {str(e)}")
+            return False
+
+    def delete(self, key: str) -> None:
+        """캐시 항목 삭제"""
+        path = self._path(key)
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                if self._size is not None:
+                    self._size -= size
+            except OSError:
+                pass
+
+    def _evict_locked(self) -> None:
+        """가장 오래 사용되지 않은 항목부터 제거하여 크기 예산의 90% 이하로 유지 (잠금 보유 상태에서 호출)"""
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                continue
+
+        self._size = total
+        if removed:
+            logger.info(f"🧹 캐시 정리: {removed}개 항목 제거 ({self.cache_dir}, 현재 {total / 1024 / 1024:.1f} MB)")
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            for _, _, path in self._scan():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size = 0
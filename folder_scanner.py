@@ -0,0 +1,262 @@
+import os
+import json
+import time
+import fnmatch
+import hashlib
+import zipfile
+import logging
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 폴더 스캔 설정
+FOLDER_MANIFEST_DIR = "cache/folder_manifests"  # 폴더별 파일 목록(JSONL) 저장 위치
+DEFAULT_INCLUDE_PATTERNS = ["*"]  # 포함할 파일 패턴 (폴더 기준 상대 경로 또는 파일 이름에 적용)
+DEFAULT_EXCLUDE_PATTERNS = [".*", "~$*", "__pycache__", "node_modules"]  # 숨김 파일/폴더, Office 잠금 파일 등
+SNIFF_BYTES = 1024  # 형식 판별을 위해 읽는 파일 앞부분 크기
+
+# 파일 앞부분 시그니처(매직 바이트) -> 소스 타입
+MAGIC_SIGNATURES = [
+    (b"%PDF-", "pdf"),
+    (b"PK\x03\x04", "zip"),  # DOCX 여부는 압축 목록으로 다시 확인
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"\xff\xd8\xff", "jpg"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+]
+BMP_SIGNATURE = b"BM"  # 2바이트로 짧아 확장자가 .bmp인 경우에만 인정
+TEXT_EXTENSIONS = {".txt", ".md", ".markdown", ".text"}  # 시그니처가 없는 텍스트 파일로 인정할 확장자
+IMAGE_TYPES = {"jpg", "png", "gif", "bmp", "tiff"}  # OCR로 처리할 이미지 타입
+
+def matches_any(rel_path: str, name: str, patterns: List[str]) -> bool:
+    """
+    파일/폴더가 glob 패턴 중 하나와 일치하는지 확인
+
+    Args:
+        rel_path: 스캔 루트 기준 상대 경로 ('/' 구분)
+        name: 파일 또는 폴더 이름
+        patterns: glob 패턴 목록 (예: "*.pdf", "drafts/*")
+
+    Returns:
+        일치 여부
+    """
+    return any(fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(rel_path, pattern) for pattern in patterns)
+
+def sniff_file_type(path: str) -> Optional[str]:
+    """
+    파일 앞부분의 시그니처로 소스 타입 판별 (확장자가 틀리거나 없는 파일 대응)
+
+    Args:
+        path: 파일 경로
+
+    Returns:
+        소스 타입 ('pdf', 'docx', 'txt', 'jpg', 'png', 'gif', 'bmp', 'tiff') 또는 None (지원하지 않는 형식)
+    """
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
+
+    for signature, file_type in MAGIC_SIGNATURES:
+        if head.startswith(signature):
+            if file_type != "zip":
+                return file_type
+            # DOCX는 ZIP 컨테이너이므로 본문 파트가 있는지 확인
+            if ext == ".docx":
+                return "docx"
+            try:
+                with zipfile.ZipFile(path) as archive:
+                    return "docx" if "word/document.xml" in archive.namelist() else None
+            except zipfile.BadZipFile:
+                return None
+
+    if ext == ".bmp" and head.startswith(BMP_SIGNATURE):
+        return "bmp"
+    if ext in TEXT_EXTENSIONS and b"\x00" not in head:
+        return "txt"
+    return None
+
+def iter_folder_files(root: str,
+                      include: Optional[List[str]] = None,
+                      exclude: Optional[List[str]] = None,
+                      stats: Optional[Dict[str, int]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    폴더를 os.scandir로 재귀 탐색하며 지원 형식 파일을 하나씩 반환
+
+    제외 패턴과 일치하는 폴더는 내려가지 않으며, 심볼릭 링크 폴더는 따라가지 않습니다(순환 방지).
+
+    Args:
+        root: 스캔할 폴더 경로
+        include: 포함할 파일 glob 패턴 (None이면 DEFAULT_INCLUDE_PATTERNS)
+        exclude: 제외할 파일/폴더 glob 패턴 (None이면 DEFAULT_EXCLUDE_PATTERNS)
+        stats: 건너뛴 파일 수(skipped), 접근 오류 수(errors)를 기록할 딕셔너리
+
+    Yields:
+        {"type": 소스 타입, "path": 절대 경로, "size": 바이트 수} 딕셔너리
+    """
+    include = include or DEFAULT_INCLUDE_PATTERNS
+    exclude = DEFAULT_EXCLUDE_PATTERNS if exclude is None else exclude
+    stats = stats if stats is not None else {}
+    stats.setdefault("skipped", 0)
+    stats.setdefault("errors", 0)
+
+    root = os.path.abspath(root)
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                # 같은 폴더 안에서는 이름순으로 반환 (실행마다 같은 목록)
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.warning(f"⚠️ 폴더를 읽을 수 없음 ({directory}): {str(e)}")
+            stats["errors"] += 1
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            rel_path = os.path.relpath(entry.path, root).replace(os.sep, "/")
+            if matches_any(rel_path, entry.name, exclude):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                    continue
+                if not entry.is_file() or not matches_any(rel_path, entry.name, include):
+                    continue
+                file_type = sniff_file_type(entry.path)
+                if file_type is None:
+                    stats["skipped"] += 1
+                    continue
+                yield {"type": file_type, "path": entry.path, "size": entry.stat().st_size}
+            except OSError as e:
+                logger.warning(f"⚠️ 파일을 읽을 수 없음 ({entry.path}): {str(e)}")
+                stats["errors"] += 1
+        # 이름순 깊이 우선 탐색이 되도록 역순으로 쌓음
+        stack.extend(reversed(subdirectories))
+
+def get_manifest_path(root: str, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None) -> str:
+    """폴더 경로와 패턴 조합별 파일 목록 경로"""
+    key = json.dumps([os.path.abspath(root), include, exclude], ensure_ascii=False)
+    return os.path.join(FOLDER_MANIFEST_DIR, hashlib.sha1(key.encode('utf-8')).hexdigest() + ".jsonl")
+
+def write_folder_manifest(root: str,
+                          include: Optional[List[str]] = None,
+                          exclude: Optional[List[str]] = None,
+                          manifest_path: Optional[str] = None) -> Tuple[str, Dict[str, int]]:
+    """
+    폴더를 스캔하면서 찾은 파일을 JSONL 파일 목록에 한 줄씩 바로 기록 (파일 수와 무관하게 메모리 일정)
+
+    Args:
+        root: 스캔할 폴더 경로
+        include: 포함할 파일 glob 패턴
+        exclude: 제외할 파일/폴더 glob 패턴
+        manifest_path: 파일 목록 경로 (None이면 get_manifest_path 결과)
+
+    Returns:
+        (파일 목록 경로, 통계) 튜플 - 통계는 files, bytes, skipped, errors와 타입별 파일 수
+    """
+    manifest_path = manifest_path or get_manifest_path(root, include, exclude)
+    os.makedirs(os.path.dirname(os.path.abspath(manifest_path)), exist_ok=True)
+
+    started = time.time()
+    stats = {"files": 0, "bytes": 0}
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in iter_folder_files(root, include, exclude, stats):
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                stats["files"] += 1
+                stats["bytes"] += record["size"]
+                stats[record["type"]] = stats.get(record["type"], 0) + 1
+        os.replace(temp_path, manifest_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    logger.info(f"📁 폴더 스캔 완료: {root} - 파일 {stats['files']:,}개 ({stats['bytes'] / (1024 * 1024):.1f}MB), "
+                f"건너뜀 {stats['skipped']:,}개 ({time.time() - started:.2f}초)")
+    return manifest_path, stats
+
+def is_manifest_stale(root: str, manifest_path: str, exclude: Optional[List[str]] = None) -> bool:
+    """
+    파일 목록을 만든 뒤 폴더에 파일이 추가/삭제/이름 변경되었는지 확인
+
+    파일이 추가되거나 삭제되면 그 파일이 있는 폴더의 수정 시각이 바뀌므로, 파일 내용을 읽지 않고
+    폴더들의 수정 시각만 파일 목록의 수정 시각과 비교합니다 (제외 패턴과 일치하는 폴더는 건너뜀).
+
+    Args:
+        root: 스캔한 폴더 경로
+        manifest_path: 파일 목록 경로
+        exclude: 제외할 파일/폴더 glob 패턴 (None이면 DEFAULT_EXCLUDE_PATTERNS)
+
+    Returns:
+        다시 스캔해야 하는지 여부 (파일 목록이 없거나 폴더를 읽을 수 없으면 True)
+    """
+    exclude = DEFAULT_EXCLUDE_PATTERNS if exclude is None else exclude
+    try:
+        manifest_mtime = os.path.getmtime(manifest_path)
+        root = os.path.abspath(root)
+        if os.path.getmtime(root) >= manifest_mtime:
+            return True
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    rel_path = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                    if matches_any(rel_path, entry.name, exclude):
+                        continue
+                    if entry.stat(follow_symlinks=False).st_mtime >= manifest_mtime:
+                        return True
+                    stack.append(entry.path)
+    except OSError:
+        return True
+    return False
+
+def read_folder_manifest(manifest_path: str) -> Iterator[Dict[str, Any]]:
+    """JSONL 파일 목록을 한 줄씩 읽어 파일 항목 반환"""
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def expand_folder_source(src: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    폴더 소스를 파일별 소스 목록으로 확장 (큰 파일부터 - 오래 걸리는 파싱을 먼저 시작)
+
+    파일 목록이 없거나, 목록을 만든 뒤 폴더에 파일이 추가/삭제되었으면 폴더를 다시 스캔합니다.
+
+    Args:
+        src: {"type": "folder", "path": ..., "include": [...], "exclude": [...], "manifest": ..., "ocr_engine": ...}
+
+    Returns:
+        parse_sources에 넘길 파일 소스 딕셔너리 목록
+    """
+    manifest_path = src.get("manifest")
+    if not manifest_path or is_manifest_stale(src["path"], manifest_path, src.get("exclude")):
+        if manifest_path and os.path.exists(manifest_path):
+            logger.info(f"🔄 폴더 내용이 바뀌어 다시 스캔합니다: {src['path']}")
+        manifest_path, _ = write_folder_manifest(src["path"], src.get("include"), src.get("exclude"), manifest_path)
+
+    expanded = []
+    for record in read_folder_manifest(manifest_path):
+        if not os.path.exists(record["path"]):
+            # 다시 스캔한 뒤에 삭제된 파일
+            continue
+        file_src = {"type": record["type"], "path": record["path"], "size": record.get("size", 0)}
+        # 폴더의 OCR 엔진은 이미지에만 적용 (PDF 스캔 페이지 OCR은 PDF_OCR_ENGINE으로 따로 켬)
+        if record["type"] in IMAGE_TYPES:
+            file_src["ocr_engine"] = src.get("ocr_engine", "google")
+        expanded.append(file_src)
+
+    expanded.sort(key=lambda file_src: file_src["size"], reverse=True)
+    return expanded
@@ -7,6 +7,7 @@ from typing import List, Dict, Union, Optional, Tuple, Any
 from pathlib import Path
 import validators
 from urllib.parse import urlparse
+from folder_scanner import write_folder_manifest, DEFAULT_EXCLUDE_PATTERNS, IMAGE_TYPES
 
 # 로깅 설정
 logging.basicConfig(
@@ -25,13 +26,15 @@ DEFAULT_CONFIG_PATH = "config.json"
 MAX_SOURCES = 30  # 최대 소스 개수
 SUPPORTED_FILE_TYPES = ['.pdf', '.docx', '.txt']  # 지원하는 파일 형식
 
-def get_user_input(config_path: str = DEFAULT_CONFIG_PATH, force_input: bool = False) -> Dict:
+def get_user_input(config_path: str = DEFAULT_CONFIG_PATH, force_input: bool = False,
+                   prefetcher: Optional[Any] = None) -> Dict:
     """
     사용자로부터 필요한 입력을 받는 단순화된 함수
     
     Args:
         config_path: 설정 파일 경로
         force_input: 강제로 새 입력 요청 (기본값: False)
+        prefetcher: 입력된 소스를 바로 미리 파싱할 SourcePrefetcher (없으면 미리 파싱하지 않음)
         
     Returns:
         사용자 입력 및 구성 정보 딕셔너리
@@ -54,7 +57,7 @@ def get_user_input(config_path: str = DEFAULT_CONFIG_PATH, force_input: bool = F
     topic = get_topic_input(previous_config)
     
     # 소스 입력
-    sources = get_sources_input(previous_config)
+    sources = get_sources_input(previous_config, prefetcher)
     
     # 구조는 기본값 사용
     structure = "서론-본론-결론"
@@ -174,12 +177,16 @@ def get_topic_input(previous_config: Dict) -> str:
     
     return topic
 
-def get_sources_input(previous_config: Dict) -> List[SourceType]:
+def get_sources_input(previous_config: Dict, prefetcher: Optional[Any] = None) -> List[SourceType]:
     """
     소스 입력 받기
     
+    검증을 통과한 소스는 prefetcher가 있으면 입력을 계속 받는 동안 백그라운드에서 파싱을
+    시작하고, 'del N'으로 제거하거나 'prev'로 대체한 소스는 작업을 취소합니다.
+    
     Args:
         previous_config: 이전 설정 정보
+        prefetcher: 소스 미리 파싱 실행기 (submit/cancel 메서드 제공)
         
     Returns:
         입력된 소스 리스트
@@ -190,6 +197,7 @@ def get_sources_input(previous_config: Dict) -> List[SourceType]:
     print("- 기사/블로그/논문 URL (https://...)")
     print("- 유튜브 영상 URL (https://youtube.com/... 또는 https://youtu.be/...)")
     print("- 파일 경로 (PDF, DOCX, TXT 지원)")
+    print("- 폴더 경로 (하위 폴더의 PDF, DOCX, TXT, 이미지 파일을 모두 사용)")
     
     if previous_sources:
         print("\n📋 이전 소스 목록:")
@@ -203,6 +211,7 @@ def get_sources_input(previous_config: Dict) -> List[SourceType]:
             print(f"   ... 외 {len(previous_sources)-5}개")
         
         print("\n이전 소스를 재사용하려면 'prev' 입력")
+    print("입력한 소스를 제거하려면 'del 번호' 입력 (예: del 2)")
     
     sources = []
     while len(sources) < MAX_SOURCES:
@@ -213,21 +222,45 @@ def get_sources_input(previous_config: Dict) -> List[SourceType]:
             
         if src_input.lower() == 'prev' and previous_sources:
             print(f"✅ 이전 소스 {len(previous_sources)}개를 재사용합니다.")
+            if prefetcher:
+                for src in sources:
+                    prefetcher.cancel(src)
+                for src in previous_sources:
+                    prefetcher.submit(src)
             return previous_sources
         
+        # 입력한 소스 제거
+        remove_match = re.fullmatch(r'del\s+(\d+)', src_input, re.IGNORECASE)
+        if remove_match:
+            remove_index = int(remove_match.group(1)) - 1
+            if 0 <= remove_index < len(sources):
+                removed = sources.pop(remove_index)
+                if prefetcher:
+                    prefetcher.cancel(removed)
+                print(f"🗑️ {remove_index+1}번 소스를 제거했습니다.")
+            else:
+                print(f"❌ 제거할 소스 번호가 올바르지 않습니다 (1-{len(sources)}).")
+            continue
+        
         # 소스 입력 처리
         processed_source = process_source_input(src_input)
         if processed_source:
             sources.append(processed_source)
+            # 나머지 입력을 받는 동안 백그라운드에서 파싱 시작
+            if prefetcher:
+                prefetcher.submit(processed_source)
         # 오류는 process_source_input 내에서 출력
     
     if not sources:
         if previous_sources:
             print("⚠️ 소스가 입력되지 않았습니다. 이전 소스를 사용합니다.")
+            if prefetcher:
+                for src in previous_sources:
+                    prefetcher.submit(src)
             return previous_sources
         else:
             print("⚠️ 소스가 입력되지 않았습니다. 계속하려면 적어도 하나의 소스가 필요합니다.")
-            return get_sources_input(previous_config)  # 재귀적으로 다시 입력 받기
+            return get_sources_input(previous_config, prefetcher)  # 재귀적으로 다시 입력 받기
     
     return sources
 
@@ -258,50 +291,38 @@ def process_source_input(src_input: str) -> Optional[SourceType]:
         
         return src_input
     
-    # 폴더 여부 확인 - 추가된 부분
+    # 폴더 여부 확인 - 하위 폴더까지 PDF/DOCX/TXT/이미지 파일 수집
     elif os.path.isdir(src_input):
         print(f"✅ 폴더가 감지되었습니다: {src_input}")
-        # 이미지 파일 확장자
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']
-        
-        # 폴더 내 이미지 파일 확인
-        image_files = []
-        for file in os.listdir(src_input):
-            file_path = os.path.join(src_input, file)
-            if os.path.isfile(file_path) and any(file.lower().endswith(ext) for ext in image_extensions):
-                image_files.append(file_path)
-        
-        if not image_files:
-            print(f"❌ 폴더에 지원되는 이미지 파일이 없습니다: {src_input}")
+        include, exclude = get_folder_patterns_input()
+        
+        # 하위 폴더까지 스캔하며 파일 목록을 바로 기록 (파일 형식은 파일 앞부분 시그니처로 판별)
+        manifest_path, stats = write_folder_manifest(src_input, include, exclude)
+        if not stats["files"]:
+            print(f"❌ 폴더에 지원되는 파일이 없습니다: {src_input}")
             return None
         
-        print(f"✅ {len(image_files)}개의 이미지 파일이 감지되었습니다.")
-        
-        # OCR 엔진 선택 프롬프트
-        print("\n🔍 사용할 OCR 엔진을 선택하세요:")
-        print("1. Google Cloud Vision (기본값)")
-        print("2. AWS Textract")
-        print("3. Naver CLOVA OCR")
-        print("4. Azure Document Intelligence (현재 사용 불가)")
-        
-        choice = input("> ").strip()
-        
-        # 선택에 따른 엔진 설정
-        if choice == "2":
-            engine = "aws"
-        elif choice == "3":
-            engine = "naver"
-        elif choice == "4":
-            print("⚠️ Azure는 현재 사용할 수 없습니다. Google Vision을 대신 사용합니다.")
-            engine = "google"
-        else:
-            # 기본값 또는 잘못된 입력
-            engine = "google"
+        type_counts = ", ".join(f"{file_type.upper()} {stats[file_type]}개"
+                                for file_type in ["pdf", "docx", "txt", *sorted(IMAGE_TYPES)] if stats.get(file_type))
+        print(f"✅ {stats['files']:,}개 파일이 감지되었습니다 ({type_counts}, {stats['bytes'] / (1024 * 1024):.1f}MB)")
+        if stats["skipped"]:
+            print(f"ℹ️ 지원하지 않는 형식의 파일 {stats['skipped']:,}개는 건너뜁니다.")
+        
+        folder_source = {
+            "type": "folder",
+            "path": os.path.abspath(src_input),
+            "include": include,
+            "exclude": exclude,
+            "manifest": manifest_path,
+            "file_count": stats["files"]
+        }
         
-        print(f"✅ 선택된 OCR 엔진: {engine}")
+        # 이미지 파일이 있을 때만 OCR 엔진 선택
+        if any(stats.get(file_type) for file_type in IMAGE_TYPES):
+            folder_source["ocr_engine"] = get_ocr_engine_input()
         
-        # 폴더를 특별한 타입으로 반환
-        return {"type": "image_folder", "path": src_input, "files": image_files, "ocr_engine": engine}
+        # 폴더를 특별한 타입으로 반환 (파싱 시 파일별 소스로 확장)
+        return folder_source
     
     # 파일 경로 확인 - 기존 코드
     elif os.path.exists(src_input):
@@ -311,27 +332,7 @@ def process_source_input(src_input: str) -> Optional[SourceType]:
             
             # 이미지 파일인 경우 OCR 엔진 선택 프롬프트 추가
             if ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']:
-                print("\n🔍 사용할 OCR 엔진을 선택하세요:")
-                print("1. Google Cloud Vision (기본값)")
-                print("2. AWS Textract")
-                print("3. Naver CLOVA OCR")
-                print("4. Azure Document Intelligence (현재 사용 불가)")
-                
-                choice = input("> ").strip()
-                
-                # 선택에 따른 엔진 설정
-                if choice == "2":
-                    engine = "aws"
-                elif choice == "3":
-                    engine = "naver"
-                elif choice == "4":
-                    print("⚠️ Azure는 현재 사용할 수 없습니다. Google Vision을 대신 사용합니다.")
-                    engine = "google"
-                else:
-                    # 기본값 또는 잘못된 입력
-                    engine = "google"
-                
-                print(f"✅ 선택된 OCR 엔진: {engine}")
+                engine = get_ocr_engine_input()
                 return {"type": ext[1:], "path": os.path.abspath(src_input), "ocr_engine": engine}
             
             return {"type": ext[1:], "path": os.path.abspath(src_input)}
@@ -355,6 +356,49 @@ def process_source_input(src_input: str) -> Optional[SourceType]:
         print("❌ 유효한 URL 또는 파일 경로를 입력해주세요.")
         return None
 
+def get_ocr_engine_input() -> str:
+    """
+    이미지 OCR 엔진 선택 입력 받기
+    
+    Returns:
+        OCR 엔진 이름 ('google', 'aws', 'naver')
+    """
+    print("\n🔍 사용할 OCR 엔진을 선택하세요:")
+    print("1. Google Cloud Vision (기본값)")
+    print("2. AWS Textract")
+    print("3. Naver CLOVA OCR")
+    print("4. Azure Document Intelligence (현재 사용 불가)")
+    
+    choice = input("> ").strip()
+    
+    # 선택에 따른 엔진 설정
+    if choice == "2":
+        engine = "aws"
+    elif choice == "3":
+        engine = "naver"
+    elif choice == "4":
+        print("⚠️ Azure는 현재 사용할 수 없습니다. Google Vision을 대신 사용합니다.")
+        engine = "google"
+    else:
+        # 기본값 또는 잘못된 입력
+        engine = "google"
+    
+    print(f"✅ 선택된 OCR 엔진: {engine}")
+    return engine
+
+def get_folder_patterns_input() -> Tuple[Optional[List[str]], Optional[List[str]]]:
+    """
+    폴더 스캔에 사용할 포함/제외 glob 패턴 입력 받기
+    
+    Returns:
+        (포함 패턴 목록, 제외 패턴 목록) - 입력하지 않으면 None (기본값 사용)
+    """
+    print("\n📁 포함할 파일 패턴을 입력하세요 (쉼표로 구분, 예: *.pdf, reports/*) [Enter: 전체]")
+    include = [pattern.strip() for pattern in input("> ").split(",") if pattern.strip()]
+    print(f"📁 제외할 파일/폴더 패턴을 입력하세요 (쉼표로 구분) [Enter: {', '.join(DEFAULT_EXCLUDE_PATTERNS)}]")
+    exclude = [pattern.strip() for pattern in input("> ").split(",") if pattern.strip()]
+    return include or None, exclude or None
+
 def get_structure_input(previous_config: Dict) -> str:
     """
     논리 구조 입력 받기
@@ -588,6 +632,8 @@ def show_input_summary(data: Dict) -> None:
                     print(f"   {i+1}. YouTube: {src[:60]}{'...' if len(src) > 60 else ''}")
                 else:
                     print(f"   {i+1}. URL: {src[:60]}{'...' if len(src) > 60 else ''}")
+            elif src.get('type') == 'folder':
+                print(f"   {i+1}. 폴더: {src.get('path', '')} (파일 {src.get('file_count', 0):,}개)")
             else:
                 print(f"   {i+1}. 파일: {os.path.basename(src.get('path', ''))} (타입: {src.get('type', '알 수 없음')})")
     
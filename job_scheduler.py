@@ -0,0 +1,95 @@
+import heapq
+import threading
+import contextlib
+from typing import Iterator, List, Sequence
+
+# 예측 대비 실제 소요 시간 보고 설정
+TIMING_REPORT_MIN_SECONDS = 0.5  # 예상 시간이 이보다 짧으면 오차 비율을 표시하지 않음
+
+def longest_first(costs: Sequence[float]) -> List[int]:
+    """
+    추정 비용이 큰 작업부터 실행하는 순서 (LPT - 마지막에 큰 작업이 남아 작업자가 노는 시간을 줄임)
+
+    Args:
+        costs: 작업별 추정 비용 (초)
+
+    Returns:
+        실행할 작업 인덱스 목록 (비용이 같으면 원래 순서 유지)
+    """
+    return sorted(range(len(costs)), key=lambda index: -costs[index])
+
+def predict_makespan(costs: Sequence[float], workers: int) -> float:
+    """
+    작업자 수가 정해진 풀에서 큰 작업부터 실행할 때의 전체 소요 시간 예측
+
+    비어 있는 작업자에게 남은 작업 중 가장 큰 작업을 배정하는 과정을 그대로 계산합니다.
+
+    Args:
+        costs: 작업별 추정 비용 (초)
+        workers: 동시에 실행되는 작업 수
+
+    Returns:
+        예상 전체 소요 시간 (초)
+    """
+    if not costs:
+        return 0.0
+    loads = [0.0] * max(1, min(workers, len(costs)))
+    for cost in sorted(costs, reverse=True):
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
+
+def format_stage_timing(stage: str, predicted: float, actual: float) -> str:
+    """
+    단계별 예상/실제 소요 시간 보고 문자열
+
+    Args:
+        stage: 단계 이름 (예: "소스 파싱")
+        predicted: 예상 소요 시간 (초)
+        actual: 실제 소요 시간 (초)
+
+    Returns:
+        로그용 한 줄 문자열
+    """
+    report = f"⏱️ {stage} 소요 시간: 예상 {predicted:.1f}초 / 실제 {actual:.1f}초"
+    if predicted >= TIMING_REPORT_MIN_SECONDS:
+        report += f" (오차 {(actual - predicted) / predicted:+.0%})"
+    return report
+
+class PrioritySemaphore:
+    """
+    동시 실행 수를 하나로 제한하면서, 슬롯이 비면 우선 요청을 먼저 통과시키는 세마포어
+
+    우선 요청이 기다리는 동안에는 일반 요청이 새 슬롯을 받지 못하므로, 짧은 우선 호출(구간 요약 등)이
+    긴 일반 호출 뒤에 줄 서지 않습니다. 이미 실행 중인 호출은 중단하지 않습니다.
+    """
+
+    def __init__(self, value: int):
+        self._condition = threading.Condition()
+        self._available = max(1, value)
+        self._priority_waiting = 0
+
+    @contextlib.contextmanager
+    def slot(self, priority: bool = False) -> Iterator[None]:
+        """슬롯 하나를 잡고 블록이 끝나면 반환"""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self, priority: bool = False) -> None:
+        with self._condition:
+            if priority:
+                self._priority_waiting += 1
+            try:
+                while self._available == 0 or (not priority and self._priority_waiting):
+                    self._condition.wait()
+            finally:
+                if priority:
+                    self._priority_waiting -= 1
+            self._available -= 1
+
+    def release(self) -> None:
+        with self._condition:
+            self._available += 1
+            self._condition.notify_all()
@@ -0,0 +1,229 @@
+import os
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from openai import OpenAI
+
+from llm_cache import llm_cache, get_llm_cache_key, is_llm_cache_enabled
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 배치 API 설정 (즉시 응답이 필요 없는 대량 요청을 저렴하게 처리)
+BATCH_BASE_URL = os.getenv("OPENAI_BATCH_BASE_URL")  # 지정 시 이 주소의 배치 엔드포인트 사용 (로컬 테스트 서버 등)
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_SECONDS = float(os.getenv("OPENAI_BATCH_POLL_SECONDS", "30"))  # 상태 확인 주기 (초)
+BATCH_MAX_ROUNDS = 2  # 실패한 요청만 모아 다시 제출하는 최대 횟수 (첫 제출 포함)
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+BATCH_STATE_DIR = "cache/llm_batches"  # 요청 묶음별 진행 상태 (실행 폴더와 무관하게 재시작 시 이어서 진행)
+
+_batch_client = None
+
+def get_batch_client() -> OpenAI:
+    """배치 API용 OpenAI 클라이언트 (처음 사용할 때 생성)"""
+    global _batch_client
+    if _batch_client is None:
+        _batch_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), base_url=BATCH_BASE_URL or None)
+    return _batch_client
+
+def chat_request(prompt: str, model: str, temperature: float, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    """사용자 메시지 하나짜리 채팅 완성 요청 본문"""
+    body = {"model": model, "messages": [{"role": "user", "content": prompt}], "temperature": temperature}
+    if max_tokens is not None:
+        body["max_tokens"] = max_tokens
+    return body
+
+def request_custom_id(label: str, body: Dict[str, Any]) -> str:
+    """
+    요청 식별자 - 이름표와 요청 내용 해시를 함께 사용
+    (프롬프트가 바뀐 요청은 다른 식별자가 되므로 재시작 시 이전 결과를 잘못 쓰지 않음)
+    """
+    digest = hashlib.sha256(json.dumps(body, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    return f"{label}-{digest[:16]}"
+
+def batch_state_path(requests: Dict[str, Dict[str, Any]], state_dir: Optional[str] = None) -> str:
+    """
+    요청 묶음의 진행 상태 파일 경로 - 요청 식별자와 요청 본문 전체의 해시로 결정
+    (같은 요청 묶음이면 어느 출력 폴더에서 다시 실행해도 같은 상태 파일을 찾음)
+    """
+    payload = json.dumps(sorted(requests.items()), sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    return os.path.join(state_dir or BATCH_STATE_DIR, f"batch_{digest[:32]}.json")
+
+def load_batch_state(state_path: str) -> Dict[str, Any]:
+    """배치 진행 상태 로드 (없거나 손상되었으면 빈 상태)"""
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if isinstance(state, dict) and isinstance(state.get("results"), dict):
+            return state
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"⚠️ 배치 상태 파일을 읽을 수 없어 새로 시작합니다 ({state_path}): {str(e)}")
+    return {"batch_id": None, "results": {}}
+
+def save_batch_state(state_path: str, state: Dict[str, Any]) -> None:
+    """배치 진행 상태 저장 (임시 파일에 쓴 뒤 교체)"""
+    os.makedirs(os.path.dirname(os.path.abspath(state_path)), exist_ok=True)
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, state_path)
+
+def submit_batch(client: OpenAI, requests: Dict[str, Dict[str, Any]], input_path: str) -> str:
+    """
+    요청을 JSONL 파일로 기록하고 업로드한 뒤 배치 작업 생성
+
+    Args:
+        client: 배치용 OpenAI 클라이언트
+        requests: 요청 식별자 -> 채팅 완성 요청 본문
+        input_path: 기록할 JSONL 파일 경로
+
+    Returns:
+        배치 ID
+    """
+    with open(input_path, 'w', encoding='utf-8') as f:
+        for custom_id, body in requests.items():
+            f.write(json.dumps({"custom_id": custom_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body},
+                               ensure_ascii=False) + "\n")
+
+    with open(input_path, 'rb') as f:
+        input_file = client.files.create(file=f, purpose="batch")
+    batch = client.batches.create(input_file_id=input_file.id, endpoint=BATCH_ENDPOINT,
+                                  completion_window=BATCH_COMPLETION_WINDOW)
+    logger.info(f"📦 배치 작업 제출: {batch.id} (요청 {len(requests)}개)")
+    return batch.id
+
+def wait_for_batch(client: OpenAI, batch_id: str, poll_seconds: float, deadline: Optional[float]) -> Any:
+    """
+    배치 작업이 끝날 때까지 주기적으로 상태 확인
+
+    Returns:
+        마지막으로 조회한 배치 객체 (제한 시간을 넘기면 아직 진행 중인 상태일 수 있음)
+    """
+    last_status = None
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != last_status:
+            counts = getattr(batch, "request_counts", None)
+            progress = f" ({counts.completed}/{counts.total})" if counts is not None and counts.total else ""
+            logger.info(f"⏳ 배치 {batch_id} 상태: {batch.status}{progress}")
+            last_status = batch.status
+        if batch.status in BATCH_TERMINAL_STATUSES:
+            return batch
+        if deadline is not None and time.time() + poll_seconds > deadline:
+            return batch
+        time.sleep(poll_seconds)
+
+def read_batch_output(client: OpenAI, file_id: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    배치 결과 파일을 읽어 요청별 응답과 오류로 분리
+
+    Returns:
+        (요청 식별자 -> 응답 텍스트, 요청 식별자 -> 오류 메시지) 튜플
+    """
+    contents = {}
+    errors = {}
+    for line in client.files.content(file_id).text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        custom_id = item.get("custom_id")
+        response = item.get("response") or {}
+        if item.get("error") or response.get("status_code") != 200:
+            errors[custom_id] = str(item.get("error") or response.get("body", {}).get("error") or response.get("status_code"))
+            continue
+        try:
+            contents[custom_id] = response["body"]["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            errors[custom_id] = f"응답 형식 오류: {str(e)}"
+    return contents, errors
+
+def run_chat_batch(requests: Dict[str, Dict[str, Any]],
+                   state_path: Optional[str] = None,
+                   poll_seconds: float = BATCH_POLL_SECONDS,
+                   max_wait: Optional[float] = None) -> Dict[str, str]:
+    """
+    채팅 완성 요청을 배치 API로 처리 - 제출, 상태 확인, 결과 매핑, 재시작 시 이어서 진행
+
+    완료된 응답과 진행 중인 배치 ID를 상태 파일에 바로 기록하므로, 중간에 중단되어도 다시 실행하면
+    완료된 요청은 건너뛰고 진행 중이던 배치는 새로 제출하지 않고 이어서 기다립니다.
+    LLM 응답 캐시에 있는 요청은 제출하지 않으며, 받은 응답은 캐시에도 저장합니다.
+
+    Args:
+        requests: 요청 식별자(request_custom_id 결과) -> 채팅 완성 요청 본문(chat_request 결과)
+        state_path: 진행 상태 파일 경로 (JSON, None이면 BATCH_STATE_DIR 아래 요청 묶음 해시로 결정)
+        poll_seconds: 상태 확인 주기 (초)
+        max_wait: 최대 대기 시간 (초, None이면 배치가 끝날 때까지 대기)
+
+    Returns:
+        요청 식별자 -> 응답 텍스트 (실패했거나 아직 끝나지 않은 요청은 제외)
+    """
+    if state_path is None:
+        state_path = batch_state_path(requests)
+    state = load_batch_state(state_path)
+    results = state["results"]
+    deadline = time.time() + max_wait if max_wait else None
+
+    # 캐시에 있는 응답은 제출하지 않음
+    if is_llm_cache_enabled():
+        for custom_id, body in requests.items():
+            if custom_id not in results:
+                cached = llm_cache.get(get_llm_cache_key(body["model"], body["messages"], body["temperature"],
+                                                         body.get("max_tokens")))
+                if cached is not None:
+                    results[custom_id] = cached
+
+    pending = {custom_id: body for custom_id, body in requests.items() if custom_id not in results}
+    if len(pending) < len(requests):
+        logger.info(f"⚡ 배치 요청 {len(requests) - len(pending)}개는 이전 결과를 사용합니다")
+    save_batch_state(state_path, state)
+
+    client = get_batch_client() if pending else None
+    rounds = 0
+    while pending:
+        if not state.get("batch_id"):
+            if rounds >= BATCH_MAX_ROUNDS:
+                break
+            rounds += 1
+            state["batch_id"] = submit_batch(client, pending, f"{os.path.splitext(state_path)[0]}_input.jsonl")
+            save_batch_state(state_path, state)
+        else:
+            logger.info(f"🔁 진행 중이던 배치 작업을 이어서 확인합니다: {state['batch_id']}")
+
+        batch = wait_for_batch(client, state["batch_id"], poll_seconds, deadline)
+        if batch.status not in BATCH_TERMINAL_STATUSES:
+            logger.warning(f"⏰ 배치 대기 시간 초과, 다음 실행에서 이어서 확인합니다: {batch.id}")
+            break
+
+        errors = {}
+        for file_id in (batch.output_file_id, getattr(batch, "error_file_id", None)):
+            if not file_id:
+                continue
+            contents, file_errors = read_batch_output(client, file_id)
+            errors.update(file_errors)
+            for custom_id, content in contents.items():
+                if custom_id in pending and content:
+                    results[custom_id] = content
+                    body = pending[custom_id]
+                    if is_llm_cache_enabled():
+                        llm_cache.set(get_llm_cache_key(body["model"], body["messages"], body["temperature"],
+                                                        body.get("max_tokens")), content)
+        state["batch_id"] = None
+        save_batch_state(state_path, state)
+
+        pending = {custom_id: body for custom_id, body in pending.items() if custom_id not in results}
+        for custom_id in pending:
+            logger.warning(f"⚠️ 배치 요청 실패 ({custom_id}): {errors.get(custom_id, batch.status)}")
+
+    return {custom_id: results[custom_id] for custom_id in requests if custom_id in results}
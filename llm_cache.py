@@ -0,0 +1,161 @@
+import os
+import json
+import hashlib
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from disk_cache import DiskCache
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# LLM 응답 디스크 캐시 설정 (같은 요청은 실행 간 다시 호출하지 않음)
+LLM_CACHE_DIR = "cache/llm_responses"
+LLM_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+LLM_CACHE_TTL = 30 * 24 * 60 * 60  # 30일 (초 단위)
+LLM_CACHE_VERSION = "1"  # 응답 후처리 방식이 바뀌면 값을 올려 기존 캐시를 무효화
+
+llm_cache = DiskCache(LLM_CACHE_DIR, max_bytes=LLM_CACHE_MAX_BYTES, ttl=LLM_CACHE_TTL)
+_cache_enabled = os.getenv("LLM_CACHE_BYPASS", "").lower() not in ("1", "true", "yes")
+
+def set_llm_cache_enabled(enabled: bool) -> None:
+    """LLM 응답 캐시 사용 여부 설정 (False면 캐시를 조회/저장하지 않고 항상 API 호출)"""
+    global _cache_enabled
+    _cache_enabled = enabled
+
+def is_llm_cache_enabled() -> bool:
+    return _cache_enabled
+
+def get_llm_cache_key(model: str, messages: List[Dict[str, Any]], temperature: float,
+                      max_tokens: Optional[int] = None) -> str:
+    """
+    요청 내용 해시 기반 캐시 키 생성
+
+    Args:
+        model: 모델 이름
+        messages: 채팅 메시지 목록
+        temperature: 샘플링 온도
+        max_tokens: 최대 출력 토큰 수
+
+    Returns:
+        캐시 키
+    """
+    payload = json.dumps({
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    }, sort_keys=True, ensure_ascii=False)
+    return f"llm:v{LLM_CACHE_VERSION}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+def create_chat_completion(client: Any,
+                           call_with_retry: Callable,
+                           model: str,
+                           messages: List[Dict[str, Any]],
+                           temperature: float,
+                           max_tokens: Optional[int] = None) -> str:
+    """
+    채팅 완성 호출 - 같은 요청의 응답이 캐시에 있으면 API를 호출하지 않음
+
+    캐시 조회는 재시도 래퍼(동시 요청 세마포어) 밖에서 하므로 캐시 적중은 API 호출을 기다리지 않습니다.
+
+    Args:
+        client: OpenAI 클라이언트
+        call_with_retry: 재시도/동시 요청 제한 래퍼 (모듈별 api_call_with_retry)
+        model: 모델 이름
+        messages: 채팅 메시지 목록
+        temperature: 샘플링 온도
+        max_tokens: 최대 출력 토큰 수 (None이면 지정하지 않음)
+
+    Returns:
+        응답 텍스트 (앞뒤 공백 제거)
+    """
+    cache_key = get_llm_cache_key(model, messages, temperature, max_tokens) if _cache_enabled else None
+    if cache_key:
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"⚡ 캐시에서 LLM 응답 로드 ({model}, {len(cached):,}자)")
+            return cached
+
+    def make_api_call():
+        options = {"max_tokens": max_tokens} if max_tokens is not None else {}
+        res = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            **options
+        )
+        return res.choices[0].message.content.strip()
+
+    content = call_with_retry(make_api_call)
+    if cache_key and content:
+        llm_cache.set(cache_key, content)
+    return content
+
+def stream_chat_completion(client: Any,
+                           call_with_retry: Callable,
+                           model: str,
+                           messages: List[Dict[str, Any]],
+                           temperature: float,
+                           on_delta: Callable[[str], None],
+                           on_restart: Optional[Callable[[], None]] = None,
+                           max_tokens: Optional[int] = None) -> str:
+    """
+    스트리밍 채팅 완성 호출 - 응답 조각이 도착할 때마다 on_delta 호출 (긴 응답을 기다리지 않고 후속 처리 시작)
+
+    캐시 적중 시에는 캐시된 응답 전체를 on_delta로 한 번에 전달합니다.
+    재시도 시에는 새 시도 전에 on_restart를 호출하므로 받는 쪽에서 이전 시도의 부분 출력을 버릴 수 있습니다.
+
+    Args:
+        client: OpenAI 클라이언트
+        call_with_retry: 재시도/동시 요청 제한 래퍼 (모듈별 api_call_with_retry)
+        model: 모델 이름
+        messages: 채팅 메시지 목록
+        temperature: 샘플링 온도
+        on_delta: 응답 조각 처리 함수
+        on_restart: 시도 시작 시 호출할 함수 (첫 시도 포함)
+        max_tokens: 최대 출력 토큰 수 (None이면 지정하지 않음)
+
+    Returns:
+        전체 응답 텍스트 (앞뒤 공백 제거)
+    """
+    cache_key = get_llm_cache_key(model, messages, temperature, max_tokens) if _cache_enabled else None
+    if cache_key:
+        cached = llm_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"⚡ 캐시에서 LLM 응답 로드 ({model}, {len(cached):,}자)")
+            if on_restart:
+                on_restart()
+            on_delta(cached)
+            return cached
+
+    def make_stream_call():
+        if on_restart:
+            on_restart()
+        options = {"max_tokens": max_tokens} if max_tokens is not None else {}
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+            **options
+        )
+        parts = []
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                on_delta(delta)
+        return "".join(parts).strip()
+
+    content = call_with_retry(make_stream_call)
+    if cache_key and content:
+        llm_cache.set(cache_key, content)
+    return content
@@ -6,6 +6,7 @@ import time
 import logging
 import json
 import argparse
+import contextlib
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Union
 import concurrent.futures
@@ -21,10 +22,14 @@ print("ElevenLabs API 키:", os.getenv("ELEVENLABS_API_KEY")[:5] + "..." if os.g
 
 # 개선된 모듈들 임포트
 from input_handler_updated import get_user_input, save_user_inputs
-from source_parser_updated import parse_sources
+from source_parser_updated import parse_sources, SourcePrefetcher, DEFAULT_WEB_SOURCE_TIMEOUT
+from parse_result import ParseResult, STATUS_TIMEOUT
+from spooled_text import SpooledText
+from source_dedup import deduplicate_sources, log_dedup_report, DEFAULT_PASSAGE_THRESHOLD
 from advanced_summarizer_updated import advanced_summarize_texts
 from subtitle_generator import generate_srt, batch_generate_srt
 from media_suggester_updated import generate_media_suggestions
+from llm_cache import set_llm_cache_enabled
 # TTS 엔진 모두 임포트
 from openai_tts_generator import generate_tts_openai, list_available_voices, get_audio_info
 from tts_generator import generate_tts_elevenlabs, list_recommended_voices, resolve_voice_id
@@ -45,6 +50,29 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG_PATH = "config.json"
 MAX_PARALLEL_WORKERS = min(multiprocessing.cpu_count(), 4)  # 최대 4개 제한
 
+@contextlib.contextmanager
+def quiet_console_logging(level: int = logging.WARNING):
+    """대화형 입력 중 콘솔에는 경고 이상만 출력 (백그라운드 파싱 로그가 입력 프롬프트와 섞이지 않도록)"""
+    handlers = [handler for handler in logging.getLogger().handlers
+                if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler)]
+    previous_levels = [handler.level for handler in handlers]
+    for handler in handlers:
+        handler.setLevel(max(handler.level, level))
+    try:
+        yield
+    finally:
+        for handler, previous_level in zip(handlers, previous_levels):
+            handler.setLevel(previous_level)
+
+def get_fetch_options(args: Any) -> Dict[str, Any]:
+    """웹 소스 다운로드 설정 (미리 파싱과 본 파싱에 같은 값 사용)"""
+    return {
+        "max_in_flight": getattr(args, 'max_inflight_fetches', 32),
+        "per_host_limit": getattr(args, 'per_host_connections', 4),
+        "http2": getattr(args, 'http2', False),
+        "max_download_bytes": int(getattr(args, 'max_download_mb', 5) * 1024 * 1024)
+    }
+
 def check_dependencies() -> bool:
     """
     필요한 패키지가 설치되어 있는지 확인하고 결과를 보고합니다.
@@ -134,6 +162,7 @@ def main(args: Optional[Dict[str, Any]] = None):
         sys.exit(1)
     
     # 1. 명령행 인자 처리 또는 사용자 입력 받기
+    prefetcher = None  # 대화형 입력 중 소스 미리 파싱
     if args is None:
         # 명령행 인자 파싱
         args = parse_arguments()
@@ -148,14 +177,19 @@ def main(args: Optional[Dict[str, Any]] = None):
         if (not has_required or force_input) and not skip_input:
             config_path = getattr(args, 'config', DEFAULT_CONFIG_PATH)
             
+            # 입력한 소스는 나머지 입력을 받는 동안 백그라운드에서 파싱 시작
+            prefetcher = SourcePrefetcher(use_cache=not getattr(args, 'no_cache', False),
+                                          parse_options=get_fetch_options(args))
+            
             # 단순화된 호출 - 예외 처리 포함
-            try:
-                # 매개변수 이름 명시
-                user_data = get_user_input(config_path=config_path, force_input=force_input)
-            except TypeError:
-                # 오류 발생시 인자 없이 호출
-                print("⚠️ 매개변수 오류 발생, 기본 호출로 대체")
-                user_data = get_user_input()
+            with quiet_console_logging():
+                try:
+                    # 매개변수 이름 명시
+                    user_data = get_user_input(config_path=config_path, force_input=force_input, prefetcher=prefetcher)
+                except TypeError:
+                    # 오류 발생시 인자 없이 호출
+                    print("⚠️ 매개변수 오류 발생, 기본 호출로 대체")
+                    user_data = get_user_input()
             
             # 사용자 입력 데이터를 args에 병합
             for key, value in user_data.items():
@@ -174,17 +208,39 @@ def main(args: Optional[Dict[str, Any]] = None):
     logger.addHandler(file_handler)
     
     logger.info(f"🚀 프로젝트 시작: {args.topic}")
+    # 같은 프롬프트/모델/온도의 LLM 응답은 실행 간 재사용 (--no-llm-cache로 끔)
+    set_llm_cache_enabled(not getattr(args, 'no_llm_cache', False))
     logger.info(f"📂 프로젝트 폴더: {os.path.abspath(project_folder)}")
 
     
     try:
         # 2. 소스 텍스트 파싱 (유튜브 포함)
-        source_texts = parse_source_content(args.sources, project_folder, args.parallel_workers)
+        failed_sources = []  # 실패/시간 초과 소스 (프로젝트 요약에 기록)
+        source_texts = parse_source_content(
+            args.sources,
+            project_folder,
+            args.parallel_workers,
+            use_cache=not getattr(args, 'no_cache', False),
+            fetch_options=get_fetch_options(args),
+            timeouts={
+                "source_timeout": getattr(args, 'source_timeout', 0) or None,
+                "stage_timeout": getattr(args, 'parse_timeout', 0) or None
+            },
+            failed_results=failed_sources,
+            prefetcher=prefetcher
+        )
         
         if not source_texts:
             logger.error("❌ 모든 소스 파싱 실패. 최소한 하나의 유효한 소스가 필요합니다.")
             return
         
+        # 소스 간 유사 중복 제거 (분석 API 호출량 절감)
+        if not getattr(args, 'no_dedup', False):
+            source_texts = deduplicate_source_content(
+                source_texts,
+                getattr(args, 'dedup_threshold', DEFAULT_PASSAGE_THRESHOLD)
+            )
+        
         # 3. 스크립트 생성 (롱폼 및 숏폼)
         script_paths = generate_script(
             source_texts, 
@@ -193,7 +249,9 @@ def main(args: Optional[Dict[str, Any]] = None):
             project_folder,
             args.style,
             args.additional_instructions,
-            args.content_types  # 콘텐츠 유형 전달
+            args.content_types,  # 콘텐츠 유형 전달
+            getattr(args, 'batch_analysis', False),
+            getattr(args, 'stream_longform', False)
         )
         
         if not script_paths or "longform" not in script_paths:
@@ -212,7 +270,7 @@ def main(args: Optional[Dict[str, Any]] = None):
         # tasks.append(tts_task)
         
         # 병렬 처리 실행
-        results = {}
+        results = {'parse_failures': failed_sources}
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(tasks), MAX_PARALLEL_WORKERS)) as executor:
             # 작업 제출
@@ -307,6 +365,10 @@ def main(args: Optional[Dict[str, Any]] = None):
         print(f"자세한 내용은 로그 파일을 확인하세요: {log_file}")
     
     finally:
+        # 넘겨받지 않은 미리 파싱 작업 정리
+        if prefetcher:
+            prefetcher.close()
+        
         # 로그 핸들러 닫기
         file_handler.close()
         logger.removeHandler(file_handler)
@@ -346,6 +408,30 @@ def parse_arguments():
                       help='사용자 입력 건너뛰기 (구성 파일이나 명령행 인자 사용)')
     parser.add_argument('--force-input', action='store_true',
                       help='항상 새로운 사용자 입력 요청 (이전 설정 무시)')
+    parser.add_argument('--no-cache', action='store_true',
+                      help='소스 파싱 캐시 사용 안 함 (모든 소스를 다시 파싱)')
+    parser.add_argument('--no-llm-cache', action='store_true',
+                      help='LLM 응답 캐시 사용 안 함 (같은 요청도 API를 다시 호출)')
+    parser.add_argument('--batch-analysis', action='store_true',
+                      help='소스별 분석을 배치 API로 처리 (느리지만 저렴, 중단 후 재실행 시 이어서 진행)')
+    parser.add_argument('--stream-longform', action='store_true',
+                      help='롱폼 스크립트를 스트리밍으로 생성 (완성된 문단부터 프로젝트 폴더의 스크립트 파일에 기록하고 진행 표시)')
+    parser.add_argument('--max-inflight-fetches', type=int, default=32,
+                      help='웹 소스 전체 동시 다운로드 수 (기본값: 32)')
+    parser.add_argument('--per-host-connections', type=int, default=4,
+                      help='웹 소스 호스트별 동시 다운로드 수 (기본값: 4)')
+    parser.add_argument('--http2', action='store_true',
+                      help='웹 소스 다운로드에 HTTP/2 사용 (h2 패키지 필요)')
+    parser.add_argument('--max-download-mb', type=float, default=5,
+                      help='웹 소스 응답 본문 최대 크기(MB), 초과분은 잘라냄 (기본값: 5)')
+    parser.add_argument('--no-dedup', action='store_true',
+                      help='소스 간 유사 중복 제거 사용 안 함')
+    parser.add_argument('--dedup-threshold', type=float, default=DEFAULT_PASSAGE_THRESHOLD,
+                      help=f'중복 문단 판정 유사도 기준 0~1 (기본값: {DEFAULT_PASSAGE_THRESHOLD})')
+    parser.add_argument('--source-timeout', type=float, default=0,
+                      help=f'모든 소스에 적용할 소스 하나의 파싱 제한 시간(초), 0이면 파일 소스는 제한 없음 (웹 URL은 기본 {DEFAULT_WEB_SOURCE_TIMEOUT:.0f}초)')
+    parser.add_argument('--parse-timeout', type=float, default=0,
+                      help='소스 파싱 단계 전체 제한 시간(초), 0이면 제한 없음 (기본값: 0)')
     
     args = parser.parse_args()
     
@@ -355,17 +441,33 @@ def parse_arguments():
     
     return args
 
-def parse_source_content(sources: List[Any], project_folder: str, parallel_workers: int = 3) -> List[str]:
+def parse_source_content(
+    sources: List[Any],
+    project_folder: str,
+    parallel_workers: int = 3,
+    use_cache: bool = True,
+    fetch_options: Optional[Dict[str, Any]] = None,
+    timeouts: Optional[Dict[str, Optional[float]]] = None,
+    failed_results: Optional[List[ParseResult]] = None,
+    prefetcher: Optional[SourcePrefetcher] = None
+) -> List[Union[str, SpooledText]]:
     """
-    소스 텍스트 파싱 (URL, 파일, YouTube 등)
+    소스 텍스트 파싱 (URL, 파일, YouTube 등) - 성공한 소스만 반환
+    
+    제한 시간을 넘긴 소스는 기다리지 않고 제외하며, 나머지 소스로 계속 진행합니다.
     
     Args:
         sources: 소스 목록 (URL 또는 파일 경로)
         project_folder: 프로젝트 폴더 경로
         parallel_workers: 병렬 처리 워커 수
+        use_cache: 파싱 결과 디스크 캐시 사용 여부
+        fetch_options: 웹 소스 다운로드 설정 (max_in_flight, per_host_limit, http2, max_download_bytes)
+        timeouts: 파싱 제한 시간 설정 (source_timeout, stage_timeout - 초 단위, None이면 제한 없음)
+        failed_results: 실패하거나 시간 초과된 소스의 결과를 받을 리스트 (프로젝트 요약용)
+        prefetcher: 대화형 입력 중 소스 미리 파싱을 시작한 실행기
         
     Returns:
-        파싱된 텍스트 리스트
+        파싱에 성공한 텍스트 리스트 (대용량 PDF는 sources/ 파일을 가리키는 SpooledText)
     """
     logger.info(f"📡 {len(sources)}개 소스 파싱 시작")
     
@@ -374,26 +476,115 @@ def parse_source_content(sources: List[Any], project_folder: str, parallel_worke
     os.makedirs(sources_dir, exist_ok=True)
     
     # 소스 파싱
-    parsed_texts = parse_sources(sources, max_workers=parallel_workers)
+    parse_start = time.time()
+    parse_results = parse_sources(
+        sources,
+        max_workers=parallel_workers,
+        use_cache=use_cache,
+        spool_dir=sources_dir,
+        **(fetch_options or {}),
+        **(timeouts or {}),
+        prefetcher=prefetcher
+    )
+    
+    # 소스별 결과와 소요 시간 기록 (process.log)
+    for i, result in enumerate(parse_results):
+        if result.ok:
+            logger.info(f"⏱️ 소스 #{i+1} {result.describe()}")
+        else:
+            logger.warning(f"⏱️ 소스 #{i+1} {result.describe()}")
+    logger.info(f"⏱️ 소스 파싱 전체 소요 시간: {time.time() - parse_start:.1f}초")
     
-    # 유효성 검사
-    valid_texts = [text for text in parsed_texts if text and len(text.strip()) > 100]
+    timed_out = [result for result in parse_results if result.status == STATUS_TIMEOUT]
+    if timed_out:
+        logger.warning(f"⏰ 제한 시간 초과로 제외된 소스: {len(timed_out)}개 (나머지 소스로 계속 진행)")
+    if failed_results is not None:
+        failed_results.extend(result for result in parse_results if not result.ok)
+    
+    # 성공한 결과만 분석에 사용 (오류 메시지나 빈 결과가 LLM에 전달되지 않도록)
+    valid_texts = [result.text for result in parse_results if result.ok]
     
     if not valid_texts:
         logger.error("❌ 유효한 텍스트가 파싱되지 않았습니다.")
-        if parsed_texts:
-            logger.warning(f"⚠️ 파싱된 텍스트가 있지만 너무 짧거나 비어 있습니다. ({len(parsed_texts)}개)")
+        if parse_results:
+            logger.warning(f"⚠️ 모든 소스가 실패했거나 너무 짧거나 비어 있습니다. ({len(parse_results)}개)")
         return []
     
     # 파싱된 텍스트 저장
     for i, text in enumerate(valid_texts):
         source_path = os.path.join(sources_dir, f"source_{i+1}.txt")
+        if isinstance(text, SpooledText):
+            # 스트리밍 기록된 파일은 이름만 변경 (내용을 다시 읽지 않음)
+            text.move_to(source_path)
+            continue
         with open(source_path, "w", encoding="utf-8") as f:
             f.write(text)
     
     logger.info(f"✅ {len(valid_texts)}/{len(sources)}개 소스 파싱 완료")
     return valid_texts
 
+def deduplicate_source_content(
+    source_texts: List[Union[str, SpooledText]],
+    threshold: float = DEFAULT_PASSAGE_THRESHOLD
+) -> List[Union[str, SpooledText]]:
+    """
+    소스 간 유사 중복 문단/소스 제거 (MinHash/LSH)
+    
+    Args:
+        source_texts: 파싱된 소스 텍스트 리스트
+        threshold: 중복 문단 판정 유사도 기준
+        
+    Returns:
+        중복이 제거된 소스 텍스트 리스트 (실패 시 원본 그대로)
+    """
+    logger.info(f"🔍 {len(source_texts)}개 소스 중복 검사 시작")
+    start = time.time()
+    
+    try:
+        deduped_texts, report = deduplicate_sources(source_texts, threshold=threshold)
+    except Exception as e:
+        logger.error(f"❌ 중복 검사 중 오류, 원본 소스를 사용합니다: {str(e)}")
+        return source_texts
+    
+    log_dedup_report(report, logger)
+    logger.info(f"⏱️ 중복 검사 소요 시간: {time.time() - start:.1f}초")
+    return deduped_texts
+
+class LongformStreamHandler:
+    """
+    롱폼 스트리밍의 문단 완성 이벤트 처리
+
+    문단이 완성될 때마다 프로젝트 폴더의 final_longform_script.txt를 갱신하고 진행 상황을 기록합니다.
+    (생성이 끝나기 전에도 프로젝트 폴더에서 스크립트를 확인할 수 있음)
+    API 재시도로 이미 받은 문단 번호가 다시 오면 그 번호부터의 문단을 버리고 새로 기록합니다.
+    """
+
+    def __init__(self, project_folder: str):
+        self.script_path = os.path.join(project_folder, "final_longform_script.txt")
+        self.paragraphs = []
+
+    def __call__(self, number: int, paragraph: str) -> None:
+        if number <= len(self.paragraphs):
+            logger.info(f"🔄 롱폼 재생성 감지: 문단 #{number}부터 다시 기록")
+            del self.paragraphs[number - 1:]
+
+        self.paragraphs.append(paragraph)
+        with open(self.script_path, "w", encoding="utf-8") as f:
+            f.write("\n\n".join(self.paragraphs))
+        logger.info(f"📄 롱폼 문단 #{number} 생성 완료 ({len(paragraph)}자)")
+
+    def finish(self, final_script: str) -> None:
+        """
+        생성 완료 처리 - 실패한 경우 스트리밍 중 기록한 부분 스크립트 삭제
+        (성공한 경우 최종본은 generate_script가 같은 경로에 저장)
+
+        Args:
+            final_script: 최종 롱폼 스크립트 (빈 문자열이면 생성 실패)
+        """
+        if not final_script and os.path.exists(self.script_path):
+            logger.warning("⚠️ 롱폼 생성 실패: 스트리밍 중 기록한 부분 스크립트 삭제")
+            os.remove(self.script_path)
+
 def generate_script(
     source_texts: List[str], 
     topic: str, 
@@ -401,7 +592,9 @@ def generate_script(
     project_folder: str,
     style: str = "international_relations_expert",
     additional_instructions: str = "",
-    content_types: List[str] = ["longform", "shortform1", "shortform2"]
+    content_types: List[str] = ["longform", "shortform1", "shortform2"],
+    batch_analysis: bool = False,
+    stream_longform: bool = False
 ) -> Dict[str, str]:
     """
     소스 텍스트를 분석하여 롱폼 및 숏폼 스크립트 생성
@@ -414,6 +607,8 @@ def generate_script(
         style: 생성 스타일
         additional_instructions: 추가 지시사항
         content_types: 생성할 콘텐츠 유형 리스트
+        batch_analysis: 소스별 분석을 배치 API로 처리할지 여부
+        stream_longform: 롱폼 스크립트를 스트리밍으로 생성하며 완성된 문단부터 프로젝트 폴더에 기록
         
     Returns:
         생성된 스크립트 파일 경로 딕셔너리
@@ -438,6 +633,9 @@ def generate_script(
     # 분석 결과 저장 디렉토리
     analysis_dir = os.path.join(project_folder, "analysis")
     
+    # 롱폼 스트리밍 시 문단이 완성될 때마다 프로젝트 스크립트 파일 갱신 및 진행 상황 표시
+    longform_handler = LongformStreamHandler(project_folder) if stream_longform and "longform" in content_types else None
+    
     try:
         # 향상된 스크립트 생성 함수 호출
         scripts = advanced_summarize_texts(
@@ -447,8 +645,13 @@ def generate_script(
             style=style,
             output_dir=analysis_dir,
             additional_instructions=korean_instruction,
-            content_types=content_types
+            content_types=content_types,
+            batch_analysis=batch_analysis,
+            on_longform_paragraph=longform_handler
         )
+
+        if longform_handler is not None:
+            longform_handler.finish((scripts or {}).get("longform", ""))
         
         if not scripts and "longform" in content_types:
             logger.error("❌ 스크립트 생성 실패")
@@ -798,6 +1001,16 @@ def generate_project_summary(
                 f.write(f"{i+1}. 파일: {path} (타입: {src.get('type', '알 수 없음')})\n")
         f.write("\n")
         
+        # 분석에서 제외된 소스 (시간 초과, 실패, 내용 부족)
+        parse_failures = results.get('parse_failures') or []
+        if parse_failures:
+            timeout_count = sum(1 for result in parse_failures if result.status == STATUS_TIMEOUT)
+            f.write(f"## 제외된 소스 ({len(parse_failures)}개, 시간 초과 {timeout_count}개)\n")
+            for result in parse_failures:
+                f.write(f"- [{result.status}] {result.short_source(120)} ({result.source_type}, {result.elapsed:.1f}초)")
+                f.write(f": {result.error.splitlines()[0][:200]}\n" if result.error else "\n")
+            f.write("\n")
+        
         f.write(f"## 생성된 파일\n")
         
         # 스크립트 파일
@@ -10,6 +10,7 @@ import concurrent.futures
 from dotenv import load_dotenv
 import threading
 import random
+from llm_cache import create_chat_completion
 
 # 로깅 설정
 logging.basicConfig(
@@ -68,6 +69,23 @@ def api_call_with_retry(func, *args, max_retries=MAX_RETRIES, **kwargs):
                 
                 logger.warning(f"⚠️ API 호출 실패 ({attempt+1}/{max_retries}): {str(e)}")
 
+def chat_completion(prompt: str, model: str = "gpt-4o", temperature: float = 0.7,
+                    max_tokens: Optional[int] = None) -> str:
+    """
+    사용자 메시지 하나로 채팅 완성 호출 (재시도, 동시 요청 제한, LLM 응답 디스크 캐시 적용)
+    
+    Args:
+        prompt: 프롬프트
+        model: 모델 이름
+        temperature: 샘플링 온도
+        max_tokens: 최대 출력 토큰 수 (None이면 지정하지 않음)
+        
+    Returns:
+        응답 텍스트
+    """
+    return create_chat_completion(client, api_call_with_retry, model,
+                                  [{"role": "user", "content": prompt}], temperature, max_tokens)
+
 def generate_media_suggestions(
     script: str, 
     topic: str,
@@ -221,16 +239,7 @@ def generate_main_media_suggestions(script: str, topic: str, existing_media: Lis
 """
 
     try:
-        def make_api_call():
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-            )
-            return response.choices[0].message.content.strip()
-        
-        # 재시도 로직으로 API 호출
-        suggestions = api_call_with_retry(make_api_call)
+        suggestions = chat_completion(prompt, temperature=0.7)
         return suggestions
     
     except Exception as e:
@@ -582,16 +591,7 @@ def generate_international_stock_footage_keywords(script: str, topic: str) -> st
 """
 
     try:
-        def make_api_call():
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-            )
-            return response.choices[0].message.content.strip()
-        
-        # 재시도 로직으로 API 호출
-        return api_call_with_retry(make_api_call)
+        return chat_completion(prompt, temperature=0.7)
     except Exception as e:
         logger.error(f"⚠️ 스톡 영상 키워드 생성 실패: {str(e)}")
         return """
@@ -651,16 +651,7 @@ def suggest_military_background_music(script: str, topic: str) -> str:
 """
 
     try:
-        def make_api_call():
-            response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-            )
-            return response.choices[0].message.content.strip()
-        
-        # 재시도 로직으로 API 호출
-        return api_call_with_retry(make_api_call)
+        return chat_completion(prompt, temperature=0.7)
     except Exception as e:
         logger.error(f"⚠️ 배경음악 제안 생성 실패: {str(e)}")
         return """
@@ -750,16 +741,7 @@ def suggest_military_data_visualizations(script: str, topic: str = None) -> str:
 """
 
         try:
-            def make_api_call():
-                response = client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.7,
-                )
-                return response.choices[0].message.content.strip()
-            
-            # 재시도 로직으로 API 호출
-            return api_call_with_retry(make_api_call)
+            return chat_completion(prompt, temperature=0.7)
         except Exception as e:
             logger.error(f"⚠️ 데이터 시각화 제안 실패: {str(e)}")
     
@@ -847,16 +829,7 @@ def suggest_expert_citations(script: str, topic: str = None) -> str:
 """
 
         try:
-            def make_api_call():
-                response = client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.7,
-                )
-                return response.choices[0].message.content.strip()
-            
-            # 재시도 로직으로 API 호출
-            return api_call_with_retry(make_api_call)
+            return chat_completion(prompt, temperature=0.7)
         except Exception as e:
             logger.error(f"⚠️ 전문가 인용 제안 생성 실패: {str(e)}")
     
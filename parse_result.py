@@ -0,0 +1,119 @@
+import time
+from typing import Dict, Any, Optional, Union
+
+from spooled_text import SpooledText, is_blank
+
+# 파싱 상태
+STATUS_OK = "ok"  # 분석에 사용할 수 있는 텍스트
+STATUS_EMPTY = "empty"  # 파싱은 되었지만 내용이 없거나 너무 짧음
+STATUS_ERROR = "error"  # 다운로드/파싱 실패
+STATUS_UNSUPPORTED = "unsupported"  # 지원하지 않는 소스 형식
+STATUS_TIMEOUT = "timeout"  # 제한 시간 안에 끝나지 않아 결과를 기다리지 않음
+
+MIN_TEXT_CHARS = 100  # 유효한 소스로 인정할 최소 글자 수
+
+class ParseResult:
+    """
+    소스 하나의 파싱 결과 - 상태, 소스 정보, 텍스트, 소요 시간
+
+    오류 메시지를 텍스트와 분리하여, 실패한 소스가 본문으로 취급되어
+    LLM 분석에 넘어가지 않도록 합니다.
+    """
+
+    def __init__(self,
+                 source: str,
+                 source_type: str,
+                 status: str,
+                 text: Union[str, SpooledText] = "",
+                 error: Optional[str] = None,
+                 metadata: Optional[Dict[str, Any]] = None,
+                 elapsed: float = 0.0):
+        """
+        초기화
+
+        Args:
+            source: 소스 표시 이름 (URL 또는 파일 경로)
+            source_type: 소스 유형 (url, youtube, pdf, docx, txt, image 등)
+            status: 파싱 상태 (STATUS_* 상수)
+            text: 추출된 텍스트 (대용량 PDF는 SpooledText)
+            error: 실패 사유
+            metadata: 소스별 부가 정보 (페이지 수, 인코딩, 캐시 사용 여부 등)
+            elapsed: 파싱 소요 시간 (초)
+        """
+        self.source = source
+        self.source_type = source_type
+        self.status = status
+        self.text = text
+        self.error = error
+        self.metadata = metadata or {}
+        self.elapsed = elapsed
+
+    @classmethod
+    def from_text(cls, source: str, source_type: str, text: Union[str, SpooledText],
+                  started: Optional[float] = None, metadata: Optional[Dict[str, Any]] = None) -> "ParseResult":
+        """
+        추출된 텍스트로 결과 생성 (너무 짧거나 비어 있으면 STATUS_EMPTY)
+
+        Args:
+            source: 소스 표시 이름
+            source_type: 소스 유형
+            text: 추출된 텍스트
+            started: 파싱 시작 시각 (time.time() 값, 소요 시간 계산용)
+            metadata: 소스별 부가 정보
+
+        Returns:
+            파싱 결과
+        """
+        if text is None or is_blank(text) or len(text) <= MIN_TEXT_CHARS:
+            return cls(source, source_type, STATUS_EMPTY, text or "",
+                       error=f"추출된 텍스트가 너무 짧습니다 ({len(text or '')}자)",
+                       metadata=metadata, elapsed=time.time() - started if started else 0.0)
+        return cls(source, source_type, STATUS_OK, text, metadata=metadata,
+                   elapsed=time.time() - started if started else 0.0)
+
+    @classmethod
+    def failure(cls, source: str, source_type: str, error: str, started: Optional[float] = None,
+                status: str = STATUS_ERROR, metadata: Optional[Dict[str, Any]] = None) -> "ParseResult":
+        """
+        실패 결과 생성
+
+        Args:
+            source: 소스 표시 이름
+            source_type: 소스 유형
+            error: 실패 사유
+            started: 파싱 시작 시각 (time.time() 값)
+            status: 실패 상태 (STATUS_ERROR, STATUS_UNSUPPORTED 등)
+            metadata: 소스별 부가 정보
+
+        Returns:
+            파싱 결과
+        """
+        return cls(source, source_type, status, "", error=error, metadata=metadata,
+                   elapsed=time.time() - started if started else 0.0)
+
+    @property
+    def ok(self) -> bool:
+        """분석에 사용할 수 있는 결과인지 여부"""
+        return self.status == STATUS_OK
+
+    @property
+    def char_count(self) -> int:
+        return len(self.text) if self.text else 0
+
+    def short_source(self, limit: int = 60) -> str:
+        """로그용으로 줄인 소스 이름"""
+        return f"{self.source[:limit]}{'...' if len(self.source) > limit else ''}"
+
+    def describe(self) -> str:
+        """로그용 한 줄 요약"""
+        summary = f"[{self.source_type}] {self.short_source()} - {self.status}, {self.elapsed:.2f}초"
+        if self.ok:
+            summary += f", {self.char_count:,}자"
+        if self.metadata:
+            summary += ", " + ", ".join(f"{key}={value}" for key, value in self.metadata.items())
+        if self.error:
+            summary += f" ({self.error.splitlines()[0][:120]})"
+        return summary
+
+    def __repr__(self) -> str:
+        return f"ParseResult(source={self.source!r}, status={self.status!r}, chars={self.char_count}, elapsed={self.elapsed:.2f})"
@@ -0,0 +1,87 @@
+import os
+import logging
+from typing import Callable, Optional
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# 문단 구분 (빈 줄)
+PARAGRAPH_SEPARATOR = "\n\n"
+
+class ParagraphStreamWriter:
+    """
+    스트리밍 응답 조각을 받는 즉시 파일에 기록하고, 문단이 끝날 때마다 문단 완성 이벤트를 보내는 작성기
+
+    이벤트 처리 함수는 (문단 번호(1부터), 문단 텍스트)를 받으며 스트림을 읽는 스레드에서 바로 호출되므로,
+    오래 걸리는 작업은 별도 스레드/작업 큐로 넘겨야 응답 수신이 늦어지지 않습니다.
+    """
+
+    def __init__(self, path: str, on_paragraph: Optional[Callable[[int, str], None]] = None):
+        self.path = path
+        self.paragraph_count = 0
+        self.char_count = 0
+        self.on_paragraph = on_paragraph
+        self._file = None
+        self._buffer = ""
+
+    def __enter__(self) -> "ParagraphStreamWriter":
+        self.reset()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        # 오류로 끝난 경우에는 미완성 문단을 완료로 알리지 않음
+        self.close(emit_last=exc_type is None)
+
+    def reset(self) -> None:
+        """
+        파일과 문단 번호를 처음 상태로 되돌림 (API 재시도 시 이전 시도의 부분 출력 폐기)
+
+        재시도 후에는 문단 번호가 1부터 다시 시작하므로, 이벤트를 받는 쪽은 이미 받은 번호가 다시 오면
+        이전 문단을 새 문단으로 교체해야 합니다.
+        """
+        if self._file is not None:
+            self._file.close()
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._buffer = ""
+        self.paragraph_count = 0
+        self.char_count = 0
+
+    def feed(self, delta: str) -> None:
+        """응답 조각 기록 (완성된 문단이 생기면 이벤트 발생)"""
+        self._file.write(delta)
+        self._file.flush()
+        self.char_count += len(delta)
+
+        self._buffer += delta
+        while PARAGRAPH_SEPARATOR in self._buffer:
+            paragraph, self._buffer = self._buffer.split(PARAGRAPH_SEPARATOR, 1)
+            self._emit(paragraph)
+
+    def close(self, emit_last: bool = True) -> None:
+        """파일을 닫고 마지막 문단 이벤트 발생"""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        if emit_last:
+            self._emit(self._buffer)
+        self._buffer = ""
+
+    def _emit(self, paragraph: str) -> None:
+        paragraph = paragraph.strip()
+        if not paragraph:
+            return
+        self.paragraph_count += 1
+        if self.on_paragraph is None:
+            return
+        try:
+            self.on_paragraph(self.paragraph_count, paragraph)
+        except Exception as e:
+            # 이벤트 처리 실패가 스크립트 생성을 중단시키지 않도록 함
+            logger.warning(f"⚠️ 문단 #{self.paragraph_count} 이벤트 처리 중 오류: {str(e)}")
@@ -0,0 +1,312 @@
+import re
+import zlib
+import logging
+from typing import Dict, List, Any, Optional, Tuple, Union, Iterator
+
+import numpy as np
+
+from spooled_text import SpooledText
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# MinHash / LSH 설정
+SHINGLE_SIZE = 5  # 단어 n-gram 크기
+NUM_PERM = 128  # MinHash 서명 길이
+LSH_BANDS = 32  # LSH 밴드 수 (밴드당 NUM_PERM // LSH_BANDS 행, 후보 임계값 약 0.42)
+MERSENNE_PRIME = (1 << 61) - 1
+MINHASH_SEED = 1  # 실행 간 같은 서명을 얻기 위한 고정 시드
+
+# 문단(passage) 분할 설정
+PASSAGE_MIN_CHARS = 300  # 이 길이 이상에서만 경계 후보 허용
+PASSAGE_MAX_CHARS = 2000  # 이 길이를 넘으면 강제로 분할
+PASSAGE_BOUNDARY_MODULUS = 3  # 문장 해시가 이 값으로 나누어떨어지면 문단 경계 (내용 기반 분할)
+
+# 중복 판정 설정
+DEFAULT_PASSAGE_THRESHOLD = 0.7  # 문단 유사도(추정 자카드) 기준
+SOURCE_DROP_RATIO = 0.8  # 다른 소스와 겹치는 비율이 이 이상이면 소스 전체를 제거(병합)
+MERGE_MIN_CHARS = 200  # 제거되는 소스의 고유 문단이 이 길이 이상일 때만 대표 소스에 병합
+
+# 문장 단위 분할 (문장 끝 + 공백, 줄 나머지, 빈 줄) - 이어 붙이면 원문과 같음
+UNIT_PATTERN = re.compile(r'[^\n]*?[.!?。](?:\s+|$)|[^\n]+\n*|\n+')
+WORD_PATTERN = re.compile(r'\w+')
+
+# 순열 계수 (a * h + b) mod p
+_rng = np.random.RandomState(MINHASH_SEED)
+_PERM_A = _rng.randint(1, 1 << 31, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_PERM_B = _rng.randint(0, 1 << 31, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+
+def estimate_tokens(text: str) -> int:
+    """
+    토큰 수 추정 (영문 약 4자당 1토큰, 한글 등 비ASCII 문자는 1자당 1토큰)
+
+    Args:
+        text: 토큰 수를 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    ascii_chars = len(text.encode('ascii', 'ignore'))
+    return ascii_chars // 4 + (len(text) - ascii_chars)
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """
+    단어 n-gram 집합의 MinHash 서명 계산
+
+    Args:
+        text: 서명을 계산할 텍스트
+
+    Returns:
+        길이 NUM_PERM의 uint64 배열 (단어가 SHINGLE_SIZE개 미만이면 None)
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return None
+
+    shingles = {' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+    # (해시 수 x 순열 수) 행렬에서 순열별 최솟값
+    permuted = (np.outer(hashes, _PERM_A) + _PERM_B) % np.uint64(MERSENNE_PRIME)
+    return permuted.min(axis=0)
+
+def _iter_units(text: Union[str, SpooledText]) -> Iterator[str]:
+    """문장 단위 조각 반환 (SpooledText는 파일에서 한 줄씩 읽음)"""
+    if isinstance(text, SpooledText):
+        for line in text.iter_lines():
+            for match in UNIT_PATTERN.finditer(line + '\n'):
+                yield match.group()
+    else:
+        for match in UNIT_PATTERN.finditer(text):
+            yield match.group()
+
+def iter_passages(text: Union[str, SpooledText]) -> Iterator[str]:
+    """
+    텍스트를 문단 단위로 분할 (이어 붙이면 원문과 같음)
+
+    문단 경계는 문장 내용의 해시로 정하므로 같은 내용이 소스마다 다른 위치에서
+    시작하더라도 같은 경계로 나뉩니다.
+
+    Args:
+        text: 분할할 텍스트 또는 SpooledText
+
+    Yields:
+        문단 텍스트
+    """
+    pieces = []
+    length = 0
+    for unit in _iter_units(text):
+        # 문장이 없는 아주 긴 줄은 고정 길이로 자름
+        for start in range(0, len(unit), PASSAGE_MAX_CHARS):
+            piece = unit[start:start + PASSAGE_MAX_CHARS]
+            pieces.append(piece)
+            length += len(piece)
+
+            if length >= PASSAGE_MAX_CHARS or (
+                length >= PASSAGE_MIN_CHARS
+                and zlib.crc32(piece.strip().encode('utf-8')) % PASSAGE_BOUNDARY_MODULUS == 0
+            ):
+                yield ''.join(pieces)
+                pieces = []
+                length = 0
+
+    if pieces:
+        yield ''.join(pieces)
+
+class PassageIndex:
+    """MinHash 서명의 LSH 색인 - 유사 문단 후보를 빠르게 조회"""
+
+    def __init__(self, threshold: float = DEFAULT_PASSAGE_THRESHOLD):
+        """
+        초기화
+
+        Args:
+            threshold: 중복으로 판정할 최소 추정 자카드 유사도
+        """
+        self.threshold = threshold
+        self.rows = NUM_PERM // LSH_BANDS
+        self.buckets = {}  # (밴드 번호, 밴드 값) -> 문단 번호 목록
+        self.signatures = []
+        self.owners = []  # 문단 번호 -> 소스 번호
+
+    def _band_keys(self, signature: np.ndarray) -> Iterator[Tuple[int, bytes]]:
+        for band in range(LSH_BANDS):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def query(self, signature: np.ndarray) -> Optional[int]:
+        """
+        가장 유사한 색인 문단의 소스 번호 조회
+
+        Args:
+            signature: 조회할 문단의 MinHash 서명
+
+        Returns:
+            기준 이상으로 유사한 문단이 속한 소스 번호 (없으면 None)
+        """
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self.buckets.get(key, ()))
+
+        best_owner, best_score = None, self.threshold
+        for passage_id in candidates:
+            score = float(np.mean(self.signatures[passage_id] == signature))
+            if score >= best_score:
+                best_owner, best_score = self.owners[passage_id], score
+        return best_owner
+
+    def add(self, signature: np.ndarray, owner: int) -> None:
+        """문단 서명을 색인에 추가"""
+        passage_id = len(self.signatures)
+        self.signatures.append(signature)
+        self.owners.append(owner)
+        for key in self._band_keys(signature):
+            self.buckets.setdefault(key, []).append(passage_id)
+
+def deduplicate_sources(
+    texts: List[Union[str, SpooledText]],
+    threshold: float = DEFAULT_PASSAGE_THRESHOLD
+) -> Tuple[List[Union[str, SpooledText]], Dict[str, Any]]:
+    """
+    소스 간 유사 중복 문단 제거 (MinHash/LSH)
+
+    긴 소스부터 처리하여 먼저 처리된 소스를 대표로 삼고, 이후 소스에서 이미 본 문단과
+    유사한 문단을 제거합니다. 다른 소스와 대부분 겹치는 소스는 통째로 제거하고 남은
+    고유 문단만 가장 많이 겹친 대표 소스에 병합합니다. 디스크에 기록된 SpooledText는
+    수정하지 않고 대표 소스로만 사용합니다.
+
+    Args:
+        texts: 파싱된 소스 텍스트 목록
+        threshold: 문단 중복 판정 기준 (추정 자카드 유사도)
+
+    Returns:
+        (중복 제거된 텍스트 목록, 보고서 딕셔너리) 튜플
+    """
+    index = PassageIndex(threshold)
+    kept_passages = {}  # 소스 번호 -> 유지할 문단 목록 (수정된 str 소스만)
+    report = {
+        "sources_before": len(texts),
+        "sources_after": len(texts),
+        "dropped_sources": [],  # (제거된 소스 번호, 병합 대상 소스 번호 또는 None)
+        "trimmed_sources": [],
+        "passages_removed": 0,
+        "chars_removed": 0,
+        "tokens_before": 0,
+        "tokens_after": 0,
+        "tokens_saved": 0
+    }
+
+    # 디스크 소스(수정 불가)와 긴 소스를 먼저 처리하여 대표 소스로 사용
+    order = sorted(range(len(texts)), key=lambda i: (not isinstance(texts[i], SpooledText), -len(texts[i])))
+
+    for source_idx in order:
+        text = texts[source_idx]
+        spooled = isinstance(text, SpooledText)
+        passages = []  # (문단, 서명, 중복 대상 소스 번호)
+        total_chars = 0
+        cross_dup_chars = 0
+        overlap = {}
+
+        for passage in iter_passages(text):
+            signature = minhash_signature(passage)
+            owner = None if spooled or signature is None else index.query(signature)
+            total_chars += len(passage)
+            if owner is not None and owner != source_idx:
+                cross_dup_chars += len(passage)
+                overlap[owner] = overlap.get(owner, 0) + len(passage)
+            if spooled:
+                # 디스크 소스는 색인만 하고 내용은 보관하지 않음
+                if signature is not None:
+                    index.add(signature, source_idx)
+                continue
+            passages.append((passage, signature, owner))
+
+        if spooled:
+            continue
+
+        unique = [(p, s) for p, s, owner in passages if owner is None]
+        removed = len(passages) - len(unique)
+
+        # 대부분 다른 소스와 겹치면 소스를 제거하고 고유 문단은 대표 소스에 병합
+        target = max(overlap, key=overlap.get) if overlap else None
+        if target is not None and total_chars and cross_dup_chars / total_chars >= SOURCE_DROP_RATIO \
+                and not isinstance(texts[target], SpooledText):
+            unique_chars = sum(len(p) for p, _ in unique)
+            merge_into = target if unique_chars >= MERGE_MIN_CHARS else None
+            if merge_into is not None:
+                if merge_into not in kept_passages:
+                    kept_passages[merge_into] = [texts[merge_into]]
+                kept_passages[merge_into].append('\n\n' + ''.join(p for p, _ in unique))
+            report["dropped_sources"].append((source_idx, merge_into))
+            report["passages_removed"] += removed
+            report["chars_removed"] += total_chars - (unique_chars if merge_into is not None else 0)
+            kept_passages[source_idx] = None
+            owner_idx = merge_into
+        else:
+            if removed:
+                kept_passages[source_idx] = [p for p, _ in unique]
+                report["trimmed_sources"].append(source_idx)
+                report["passages_removed"] += removed
+                report["chars_removed"] += total_chars - sum(len(p) for p, _ in unique)
+            owner_idx = source_idx
+
+        # 소스 처리가 끝난 뒤 남은 고유 문단을 색인에 추가 (다른 소스와의 중복만 판정하며, 같은 소스 안의 반복 문단은 유지됨)
+        if owner_idx is None:
+            continue
+        for _, signature in unique:
+            if signature is not None:
+                index.add(signature, owner_idx)
+
+    # 원래 순서대로 결과 구성
+    result = []
+    for source_idx, text in enumerate(texts):
+        if source_idx in kept_passages:
+            if kept_passages[source_idx] is None:
+                continue
+            text = ''.join(kept_passages[source_idx]).strip()
+        result.append(text)
+
+    report["sources_after"] = len(result)
+    report["tokens_before"] = sum(_estimate_source_tokens(t) for t in texts)
+    report["tokens_after"] = sum(_estimate_source_tokens(t) for t in result)
+    report["tokens_saved"] = report["tokens_before"] - report["tokens_after"]
+    return result, report
+
+def _estimate_source_tokens(text: Union[str, SpooledText]) -> int:
+    """소스 토큰 수 추정 (SpooledText는 파일을 조각 단위로 읽음)"""
+    if isinstance(text, SpooledText):
+        return sum(estimate_tokens(chunk) for chunk in text.iter_chunks())
+    return estimate_tokens(text)
+
+def log_dedup_report(report: Dict[str, Any], log: Optional[logging.Logger] = None) -> None:
+    """
+    중복 제거 결과 로그 출력
+
+    Args:
+        report: deduplicate_sources가 반환한 보고서
+        log: 사용할 로거 (기본: 이 모듈의 로거)
+    """
+    log = log or logger
+    if not report["passages_removed"] and not report["dropped_sources"]:
+        log.info("🔍 소스 간 중복 문단이 없습니다.")
+        return
+
+    for source_idx, merge_into in report["dropped_sources"]:
+        if merge_into is None:
+            log.info(f"🗑️ 소스 #{source_idx+1}: 다른 소스와 대부분 중복되어 제외")
+        else:
+            log.info(f"🔗 소스 #{source_idx+1}: 소스 #{merge_into+1}와 대부분 중복되어 고유 문단만 병합")
+    if report["trimmed_sources"]:
+        trimmed = ", ".join(f"#{i+1}" for i in sorted(report["trimmed_sources"]))
+        log.info(f"✂️ 중복 문단 제거된 소스: {trimmed}")
+
+    saved_ratio = report["tokens_saved"] / report["tokens_before"] * 100 if report["tokens_before"] else 0
+    log.info(
+        f"✅ 중복 제거: 소스 {report['sources_before']}→{report['sources_after']}개, "
+        f"문단 {report['passages_removed']}개 ({report['chars_removed']:,}자) 제거, "
+        f"토큰 약 {report['tokens_saved']:,}개 절약 ({saved_ratio:.1f}%)"
+    )
@@ -1,19 +1,44 @@
 import requests
 from bs4 import BeautifulSoup
+from bs4.element import Tag, NavigableString, CData, Comment
 import fitz  # PyMuPDF
 import os
 import docx
-from typing import Union, Dict, List, Any, Optional, Tuple, Set
+from typing import Union, Dict, List, Any, Optional, Tuple, Set, Iterator
 import time
 import random
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, unquote
 import re
-from functools import lru_cache
+import codecs
+import mmap
 import concurrent.futures
+import multiprocessing
+import queue
+import threading
+import atexit
+import uuid
+import collections
+import itertools
+import shutil
+import json
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
 import logging
+import numpy as np
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
-from cloud_ocr import parse_cloud_ocr
+from docx.styles import BabelFish
+from PIL import Image
+from cloud_ocr import CloudOCRProcessor, parse_cloud_ocr, prepare_ocr_image, preprocess_ocr_image
+from disk_cache import DiskCache, file_sha256
+from folder_scanner import expand_folder_source, IMAGE_TYPES
+from job_scheduler import longest_first, predict_makespan, format_stage_timing
+from spooled_text import SpooledText, SpooledTextWriter
+from parse_result import ParseResult, STATUS_UNSUPPORTED, STATUS_TIMEOUT
+from async_fetcher import (AsyncFetcher, DEFAULT_MAX_IN_FLIGHT, DEFAULT_PER_HOST_LIMIT, DEFAULT_MAX_BYTES,
+                           DOWNLOAD_CHUNK_BYTES, get_accept_encoding, get_content_type_error, decode_body,
+                           read_limited)
 
 # 로깅 설정
 logging.basicConfig(
@@ -32,6 +57,166 @@ SourceType = Union[str, Dict[str, str]]  # URL 문자열 또는 {'type': 'pdf',
 # 이 위치에 추가
 SUPPORTED_FILE_TYPES = ['.pdf', '.docx', '.txt', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']
 
+# 작업 유형별 실행기 설정
+# - I/O 작업(다운로드, YouTube, OCR API 호출, TXT 읽기)은 큰 스레드 풀
+# - CPU 작업(PDF/DOCX 파싱, HTML 본문 추출, OCR 이미지 전처리)은 코어 수만큼의 공유 프로세스 풀 (GIL 회피)
+IO_THREAD_WORKERS = 32  # I/O 작업 스레드 수 상한
+CPU_PROCESS_WORKERS = os.cpu_count() or 1
+_cpu_process_pool = None
+_cpu_pool_lock = threading.Lock()
+OCR_TEMP_DIR = "temp_ocr"
+
+# 파싱 제한 시간 설정 (느린 소스 하나가 전체 파싱 단계를 붙잡지 않도록)
+# 파일 소스는 크기(페이지 수, OCR 여부)에 따라 정상 소요 시간 차이가 커서 기본 제한 없음 (--source-timeout으로 지정)
+DEFAULT_WEB_SOURCE_TIMEOUT = 300.0  # 웹 URL(다운로드, YouTube) 하나의 제한 시간 (초, 작업 시작 시점부터)
+DEADLINE_POLL_SECONDS = 1.0  # 제한 시간 확인 주기 (초)
+
+# 작업 비용 추정 설정 (큰 작업부터 실행하여 전체 소요 시간 단축, 값은 대략적인 초 단위 비용)
+COST_PDF_SECONDS_PER_PAGE = 0.004  # 텍스트 층 추출 기준
+COST_PDF_SECONDS_PER_MB = 0.05  # 페이지 수를 확인하지 않은 PDF
+COST_DOCX_SECONDS_PER_MB = 0.5
+COST_TXT_SECONDS_PER_MB = 0.05
+COST_IMAGE_SECONDS = 3.0  # OCR API 호출 포함
+COST_URL_SECONDS = 1.5  # 크기를 모르는 웹 페이지 (요청 지연 포함)
+COST_URL_SECONDS_PER_MB = 1.0
+COST_YOUTUBE_SECONDS = 10.0  # 자막 추출 또는 음성 인식
+PREFLIGHT_HEAD_TIMEOUT = 2.0  # 웹 URL 크기 확인(HEAD) 제한 시간 (초)
+PREFLIGHT_MAX_PAGE_COUNTS = 200  # PDF가 이보다 많으면 페이지 수 대신 파일 크기로 추정
+
+# 대화형 입력 중 미리 파싱 설정
+PREFETCH_WORKERS = 4  # 입력 중 동시에 미리 파싱할 소스 수
+PREFETCH_SPOOL_DIR = "temp_prefetch"  # 프로젝트 폴더가 정해지기 전 대용량 PDF를 스트리밍 기록할 위치
+
+# PDF 페이지 병렬 추출 설정 (CPU 프로세스 풀 사용)
+PDF_PARALLEL_MIN_PAGES = 40  # 이 페이지 수 이상인 PDF만 병렬 추출
+PDF_MIN_PAGES_PER_TASK = 8  # 작업 하나에 배정할 최소 페이지 수
+PDF_STREAM_MIN_PAGES = 1000  # 이 페이지 수 이상인 PDF는 메모리 대신 파일로 스트리밍 (spool_dir 지정 시)
+
+# PDF 스캔 페이지 OCR 설정 (텍스트 층이 거의 없고 이미지가 페이지 대부분을 덮는 페이지만 렌더링하여 OCR)
+PDF_OCR_ENGINE = os.getenv("PDF_OCR_ENGINE") or None  # 과금되는 API 호출이므로 지정한 경우에만 스캔 페이지 OCR
+PDF_OCR_DPI = int(os.getenv("PDF_OCR_DPI", "300"))  # 스캔 페이지 렌더링 해상도
+PDF_OCR_MIN_PAGE_CHARS = 50  # 텍스트 층이 이보다 짧은 페이지만 스캔 페이지 후보
+PDF_OCR_MIN_IMAGE_COVERAGE = 0.5  # 이미지가 페이지 면적의 이 비율 이상을 덮어야 스캔 페이지로 간주 (빈 페이지, 제목/간지 제외)
+PDF_OCR_WORKERS = 8  # PDF 하나에서 동시에 진행할 OCR API 호출 수
+PDF_OCR_WINDOW = 64  # 페이지 순서 유지를 위해 OCR 완료를 기다리며 보관할 최대 페이지 수
+
+# PDF 반복 머리글/바닥글 제거 설정 (여러 페이지의 같은 위치에 반복되는 줄)
+PDF_BOILERPLATE_EDGE_LINES = 3  # 페이지 위/아래에서 각각 검사할 줄 수
+PDF_BOILERPLATE_MIN_PAGES = 4  # 이 페이지 수 이상인 PDF에서만 제거
+PDF_BOILERPLATE_MIN_RATIO = 0.4  # 같은 위치에서 이 비율 이상의 페이지에 나오면 반복 줄로 판단 (홀짝 페이지 머리글 포함)
+PDF_BOILERPLATE_SAMPLE_PAGES = 500  # 반복 줄 판단에 사용할 앞쪽 페이지 수 (이후 페이지는 판단 결과만 적용)
+PDF_BOILERPLATE_DIGITS = re.compile(r'\d+')  # 페이지 번호 줄의 숫자는 같은 값으로 취급
+# 숫자를 무시하고 비교할 페이지 번호 줄 - "12", "- 12 -", "[12]", "Page 3 of 120", "p. 3", "3 / 120", "12쪽",
+# "Annual Report | 12" (구분 기호로 나뉜 머리글 + 번호). "Chapter 3", 숫자 표 행 등은 그대로 비교
+PDF_FOLIO_PATTERN = re.compile(
+    r'^(?:[-–—\[(]\s*)?(?:(?:page|p\.|pp\.|페이지)\s*)?\d+(?:\s*(?:/|of)\s*\d+)?\s*(?:쪽|페이지)?(?:\s*[-–—\])])?$'
+    r'|^.*\S\s*[|·•]\s*\d+$|^\d+\s*[|·•]\s*\S.*$',
+    re.IGNORECASE
+)
+
+# 파싱 결과 디스크 캐시 설정 (실행 간 재사용)
+PARSER_VERSION = "5"  # 파서 출력 형식이 바뀌면 값을 올려 기존 캐시를 무효화
+SOURCE_CACHE_DIR = "cache/parsed_sources"
+SOURCE_CACHE_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+source_cache = DiskCache(SOURCE_CACHE_DIR, max_bytes=SOURCE_CACHE_MAX_BYTES)
+
+# HTTP 조건부 요청 캐시 설정 (ETag / Last-Modified 재검증)
+HTTP_CACHE_DIR = "cache/http"
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+HTTP_ERROR_TTL = 300  # 실패한 요청은 5분 동안만 기억
+http_cache = DiskCache(HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES)
+
+# 위키피디아 API 빠른 경로 설정 (HTML 대신 TextExtracts 일반 텍스트 사용, 리비전 ID별 캐시)
+WIKIPEDIA_API_BASE = os.getenv("WIKIPEDIA_API_BASE")  # 지정 시 모든 위키피디아 URL에 이 API 주소 사용 (로컬 테스트 서버 등)
+WIKIPEDIA_API_PATH = "/w/api.php"
+WIKIPEDIA_API_TIMEOUT = 15  # 초 단위
+WIKIPEDIA_TOC_EXCLUDED = {"Contents", "References", "External links"}  # 목차에서 제외할 섹션 (HTML 파서와 동일)
+WIKIPEDIA_HEADING_PATTERN = re.compile(r'^(={2,6})\s*(.*?)\s*\1$')  # "== 섹션 ==" 형식의 섹션 제목
+
+# HTML 파싱 설정
+HTML_PARSER = os.getenv("HTML_PARSER", "html.parser")  # 'lxml' 지정 시 더 빠른 lxml 파서 사용
+MAIN_CONTENT_TAGS = {"article", "main", "div", "section"}  # 본문 영역 후보 태그
+CONTENT_CANDIDATE_SELECTORS = (  # 본문 문단 후보 선택자 (우선순위 순)
+    "article p",
+    "main p",
+    ".content p, .post-content p, .entry-content p, .article p",
+    ".story p, .body p, .post p",
+    '[role="main"] p',
+    '[role="article"] p',
+    "p"  # 마지막 수단
+)
+
+# TXT 파일 읽기 설정
+TXT_SNIFF_BYTES = 64 * 1024  # 인코딩 추정에 사용할 앞부분 크기
+TXT_MMAP_MIN_BYTES = 16 * 1024 * 1024  # 이 크기 이상인 파일은 mmap으로 읽기
+TXT_FALLBACK_ENCODINGS = ('cp949', 'cp1252', 'latin-1')  # 추정 실패 시 검증 순서 (latin-1은 항상 성공하므로 마지막)
+TXT_PREFERRED_ENCODINGS = ('cp949', 'euc_kr', 'cp1252')  # 추정 결과가 비슷할 때 우선할 인코딩
+TXT_DETECTOR_CHAOS_TOLERANCE = 0.2  # 최선 후보와 이 차이 이내의 후보는 동등하게 취급
+TEXT_BOMS = (  # UTF-32 BOM이 UTF-16 BOM으로 시작하므로 먼저 확인
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+# DOCX 스트리밍 읽기 설정 (word/document.xml을 전체 트리 없이 순차 처리)
+DOCX_DOCUMENT_PART = "word/document.xml"
+DOCX_STYLES_PART = "word/styles.xml"
+DOCX_CORE_PART = "docProps/core.xml"
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+DOCX_CORE_FIELDS = (  # (core.xml 태그, 출력 라벨) - python-docx의 title/author/comments와 동일
+    ("{http://purl.org/dc/elements/1.1/}title", "제목"),
+    ("{http://purl.org/dc/elements/1.1/}creator", "저자"),
+    ("{http://purl.org/dc/elements/1.1/}description", "설명"),
+)
+DOCX_RUN_TEXT = {  # 런 내부 요소의 텍스트 변환 (python-docx Run.text와 동일)
+    W_NS + "t": None,  # 요소의 텍스트 그대로
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "br": "\n",
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-",
+}
+DOCX_UNSUPPORTED_TAGS = {W_NS + "altChunk"}  # 스트리밍으로 읽을 수 없는 요소 (python-docx로 대체)
+
+BOILERPLATE_PATTERNS = (  # 일반적인 쓸모없는 텍스트 (쿠키 정책, 구독 안내 등)
+    r'쿠키를 사용.*?동의',
+    r'Subscribe to.*?newsletter',
+    r'구독.*?뉴스레터',
+    r'Published:.*?\d{4}',
+    r'Last modified on.*?\d{4}',
+    r'Share on (?:Twitter|Facebook|LinkedIn)',
+    r'\d+ shares',
+    r'©.*?All rights reserved',
+    r'Terms of (?:use|service)',
+    r'Privacy Policy',
+    r'All Rights Reserved',
+    r'Please enable JavaScript',
+    r'You need to enable JavaScript',
+    r'ADVERTISEMENT',
+    r'Advertisement',
+    r'Sponsored Content',
+    r'Click here to view'
+)
+BOILERPLATE_FIRST_CHARS = r'쿠구©\dspltayc'  # 위 패턴들의 첫 글자 (패턴 추가 시 함께 수정)
+# 첫 글자 전방탐색으로 후보 위치에서만 대안들을 시도하여 한 번의 스캔으로 모두 제거
+BOILERPLATE_PATTERN = re.compile(
+    f'(?=[{BOILERPLATE_FIRST_CHARS}])(?:' + '|'.join(f'(?:{p})' for p in BOILERPLATE_PATTERNS) + ')',
+    re.IGNORECASE
+)
+WHITESPACE_RUN_PATTERN = re.compile(r'\s{2,}')
+BLANK_LINES_PATTERN = re.compile(r'\n{3,}')
+DEDUP_MIN_LINE_CHARS = 20  # 이 길이를 넘는 줄만 중복 검사
+DEDUP_CHUNK_CHARS = 50  # 중복 검사 청크 크기
+DEDUP_MIN_CHUNK_CHARS = 20  # 기록할 최소 청크 크기
+
+# 외부 파서 모듈(YouTube, OCR)이 문자열로 반환하는 오류 메시지 식별용 문구
+PARSE_ERROR_MARKERS = (
+    "파싱 오류:", "OCR 처리를 위한 사용 가능한 엔진이 없습니다", "엔진은 사용할 수 없습니다",
+    "오류: 유효한 YouTube URL이 아닙니다", "유튜브 영상 처리 실패"
+)
+
 # 세션 객체 생성 및 재시도 설정
 def create_session() -> requests.Session:
     """향상된 재시도 로직이 있는 세션 생성"""
@@ -50,75 +235,355 @@ def create_session() -> requests.Session:
 # 기본 세션 생성
 session = create_session()
 
-@lru_cache(maxsize=32)
-def parse_url(url: str) -> str:
+# 기본 요청 헤더
+DEFAULT_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": get_accept_encoding(),
+    "Referer": "https://www.google.com/",
+    "DNT": "1",
+}
+
+def get_html_parser() -> str:
+    """사용할 BeautifulSoup 파서 이름 (HTML_PARSER=lxml 지정 시 lxml 설치 여부 확인)"""
+    global HTML_PARSER
+    if HTML_PARSER == "lxml":
+        try:
+            import lxml  # noqa: F401
+        except ImportError:
+            logger.warning("⚠️ lxml이 설치되지 않아 html.parser를 사용합니다. (pip install lxml)")
+            HTML_PARSER = "html.parser"
+    return HTML_PARSER
+
+def get_url_cache_key(url: str) -> str:
+    """URL 소스의 HTTP 캐시 키 생성 (추출기 출력이 바뀌면 파서 버전으로 무효화)"""
+    return f"url:v{PARSER_VERSION}:{get_html_parser()}:{url}"
+
+def get_cache_max_age(cache_control: Optional[str]) -> Optional[int]:
+    """Cache-Control 헤더에서 max-age 값 추출 (no-cache/no-store면 None)"""
+    if not cache_control:
+        return None
+    directives = cache_control.lower()
+    if "no-store" in directives or "no-cache" in directives:
+        return None
+    match = re.search(r'max-age\s*=\s*(\d+)', directives)
+    return int(match.group(1)) if match else None
+
+def extract_url_content(html: str, url: str) -> str:
     """
-    웹 URL로부터 기사/본문 텍스트 추출 - 캐싱 및 오류 처리 강화
+    다운로드한 HTML에서 도메인별 추출기로 본문 텍스트 추출
+    
+    Args:
+        html: 웹페이지 HTML
+        url: 원본 URL (도메인 판별용)
+        
+    Returns:
+        정리된 본문 텍스트
+    """
+    soup = BeautifulSoup(html, get_html_parser())
+    
+    # 미디어 플랫폼별 최적화된 파싱
+    domain = urlparse(url).netloc
+    
+    # 특정 뉴스 사이트 최적화
+    if "medium.com" in domain:
+        content = parse_medium(soup)
+    elif any(x in domain for x in ["nytimes.com", "washingtonpost.com", "theguardian.com"]):
+        content = parse_news_site(soup)
+    elif "wikipedia.org" in domain:
+        content = parse_wikipedia(soup)
+    elif "arxiv.org" in domain:
+        content = parse_arxiv(soup)
+    else:
+        # 일반적인 파싱 방법
+        return clean_text(general_parsing(soup, url))
+        
+    if not content:
+        logger.warning(f"⚠️ {url}에서 콘텐츠를 찾을 수 없습니다. 일반 파싱으로 시도합니다.")
+        content = general_parsing(soup, url)
+        
+    # 텍스트 정리
+    return clean_text(content)
+
+def lookup_url_cache(url: str, use_cache: bool = True) -> Tuple[Optional[Dict[str, Any]], Optional[ParseResult]]:
+    """
+    URL 캐시 조회
+    
+    Args:
+        url: 조회할 URL
+        use_cache: 캐시 사용 여부
+        
+    Returns:
+        (캐시 항목, 재요청 없이 바로 사용할 파싱 결과 - 재요청이 필요하면 None)
+    """
+    if not use_cache:
+        return None, None
+    
+    started = time.time()
+    short_url = f"{url[:60]}{'...' if len(url) > 60 else ''}"
+    cached = http_cache.get(get_url_cache_key(url))
+    if not cached:
+        return None, None
+    
+    # 최근 실패 기록이 남아 있으면 재요청하지 않음
+    if cached.get("status") == "error":
+        logger.warning(f"⚠️ 최근 실패한 URL (캐시된 오류 사용): {short_url}")
+        return cached, ParseResult.failure(url, "url", cached["text"], started, metadata={"cache": "error"})
+    
+    # Cache-Control max-age 기간 내라면 재검증 없이 사용
+    if cached.get("fresh_until") and time.time() < cached["fresh_until"]:
+        logger.info(f"⚡ 캐시에서 URL 본문 로드 (유효기간 내): {short_url}")
+        return cached, ParseResult.from_text(url, "url", cached["text"], started, metadata={"cache": "fresh"})
+    
+    return cached, None
+
+def build_url_request_headers(cached: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+    """기본 요청 헤더에 캐시된 검증자로 조건부 요청 헤더 추가"""
+    headers = dict(DEFAULT_REQUEST_HEADERS)
+    if cached and cached.get("status") == "ok":
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    return headers
+
+def finish_url_response(url: str, status_code: int, html: str, headers: Any,
+                        cached: Optional[Dict[str, Any]], use_cache: bool = True,
+                        started: Optional[float] = None, content: Optional[str] = None) -> ParseResult:
+    """
+    다운로드된 응답 처리 - 304면 캐시된 본문 사용, 아니면 본문 추출 후 캐시 저장
+    
+    Args:
+        url: 요청한 URL
+        status_code: HTTP 상태 코드 (오류 상태는 호출 전에 걸러야 함)
+        html: 응답 본문
+        headers: 응답 헤더 (대소문자 구분 없는 매핑)
+        cached: 요청 전에 조회한 캐시 항목
+        use_cache: 캐시 사용 여부
+        started: 요청 시작 시각 (소요 시간 계산용)
+        content: 다른 프로세스에서 미리 추출한 본문 (없으면 여기서 추출)
+        
+    Returns:
+        파싱 결과
+    """
+    short_url = f"{url[:60]}{'...' if len(url) > 60 else ''}"
+    
+    # 변경 없음 - 다운로드/파싱 생략
+    if status_code == 304 and cached:
+        logger.info(f"⚡ 변경 없음 (304), 캐시된 본문 사용: {short_url}")
+        return ParseResult.from_text(url, "url", cached["text"], started, metadata={"http_status": 304, "cache": "revalidated"})
+    
+    if content is None:
+        content = extract_url_content(html, url)
+    
+    # 검증자나 유효기간이 있는 응답만 저장 (재검증 불가능한 응답은 저장해도 쓸모 없음)
+    if use_cache:
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        max_age = get_cache_max_age(headers.get("Cache-Control"))
+        if etag or last_modified or max_age:
+            http_cache.set(get_url_cache_key(url), {
+                "status": "ok",
+                "etag": etag,
+                "last_modified": last_modified,
+                "fresh_until": time.time() + max_age if max_age else None,
+                "text": content
+            })
+    
+    logger.info(f"✅ URL 파싱 완료: {short_url}")
+    return ParseResult.from_text(url, "url", content, started, metadata={"http_status": status_code})
+
+def store_url_error(url: str, error_text: str, use_cache: bool = True,
+                    started: Optional[float] = None) -> ParseResult:
+    """실패 결과를 짧은 TTL로만 저장 (일시적 오류가 캐시를 오염시키지 않도록)"""
+    if use_cache:
+        http_cache.set(get_url_cache_key(url), {"status": "error", "text": error_text}, ttl=HTTP_ERROR_TTL)
+    return ParseResult.failure(url, "url", error_text, started)
+
+def add_download_metadata(result: ParseResult, bytes_transferred: Optional[int], truncated: bool = False) -> ParseResult:
+    """다운로드 크기(전송 바이트, 압축 기준)와 본문 잘림 여부를 결과 메타데이터에 기록"""
+    if bytes_transferred is not None:
+        result.metadata["bytes_transferred"] = bytes_transferred
+    if truncated:
+        result.metadata["truncated"] = True
+    return result
+
+def parse_url(url: str, use_cache: bool = True, max_bytes: int = DEFAULT_MAX_BYTES) -> ParseResult:
+    """
+    웹 URL로부터 기사/본문 텍스트 추출 - 조건부 요청 캐싱 및 오류 처리 강화
+    
+    캐시된 ETag/Last-Modified 값으로 재검증하여, 서버가 304를 반환하면
+    다운로드와 HTML 파싱을 모두 건너뛰고 저장된 추출 텍스트를 사용합니다.
+    실패한 요청은 짧은 TTL(HTTP_ERROR_TTL)로만 기억합니다.
+    본문은 스트리밍으로 max_bytes까지만 받고, 텍스트 문서가 아닌 응답은 받지 않습니다.
     
     Args:
         url: 파싱할 웹 URL
+        use_cache: HTTP 디스크 캐시 사용 여부
+        max_bytes: 응답 본문 최대 크기 (압축 해제 후, 초과분은 잘라냄)
         
     Returns:
-        추출된 텍스트 컨텐츠
+        파싱 결과
     """
     # YouTube URL 확인
     if "youtube.com" in url or "youtu.be" in url:
         logger.info(f"🎬 YouTube 영상 URL 감지: {url}")
         return parse_youtube_content(url)
     
+    # 위키피디아 문서는 API 일반 텍스트로 빠르게 처리 (실패 시 HTML 경로)
+    wikipedia_result = parse_wikipedia_api(url, use_cache)
+    if wikipedia_result is not None:
+        return wikipedia_result
+    
+    started = time.time()
+    cached, cached_result = lookup_url_cache(url, use_cache)
+    if cached_result is not None:
+        return cached_result
+    
     try:
         logger.info(f"🌐 URL 파싱 시작: {url[:60]}{'...' if len(url) > 60 else ''}")
         
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Referer": "https://www.google.com/",
-            "DNT": "1",
-        }
-        
-        res = session.get(url, headers=headers, timeout=15)
-        res.raise_for_status()  # 오류 상태 코드 확인
-        
-        # 인코딩 처리 (명시적 인코딩이 없는 경우 대비)
-        if res.encoding.lower() == 'iso-8859-1':
-            # 인코딩 감지 시도
-            res.encoding = res.apparent_encoding
-        
-        soup = BeautifulSoup(res.text, "html.parser")
-        
-        # 미디어 플랫폼별 최적화된 파싱
-        domain = urlparse(url).netloc
-        
-        # 특정 뉴스 사이트 최적화
-        if "medium.com" in domain:
-            content = parse_medium(soup)
-        elif any(x in domain for x in ["nytimes.com", "washingtonpost.com", "theguardian.com"]):
-            content = parse_news_site(soup)
-        elif "wikipedia.org" in domain:
-            content = parse_wikipedia(soup)
-        elif "arxiv.org" in domain:
-            content = parse_arxiv(soup)
-        else:
-            # 일반적인 파싱 방법
-            content = general_parsing(soup, url)
-            
-        if not content:
-            logger.warning(f"⚠️ {url}에서 콘텐츠를 찾을 수 없습니다. 일반 파싱으로 시도합니다.")
-            content = general_parsing(soup, url)
-            
-        # 텍스트 정리
-        content = clean_text(content)
+        with session.get(url, headers=build_url_request_headers(cached), timeout=15, stream=True) as res:
+            html, truncated = "", False
+            if res.status_code != 304:
+                res.raise_for_status()  # 오류 상태 코드 확인
+                
+                # 텍스트 문서가 아니면 본문을 받지 않음
+                content_type = res.headers.get("Content-Type")
+                content_error = get_content_type_error(content_type)
+                if content_error:
+                    logger.error(f"❌ URL 요청 오류 ({url}): {content_error}")
+                    return add_download_metadata(store_url_error(url, f"URL 접근 오류: {content_error}", use_cache, started),
+                                                 res.raw.tell())
+                
+                # 크기 제한 스트리밍 다운로드 후 인코딩 처리 (헤더 charset이 없으면 앞부분으로 추정)
+                body, truncated = read_limited(res.iter_content(DOWNLOAD_CHUNK_BYTES), max_bytes)
+                if truncated:
+                    logger.warning(f"⚠️ 응답 본문이 {max_bytes / 1024 / 1024:.1f}MB를 넘어 잘랐습니다: {url[:60]}")
+                html, _ = decode_body(body, content_type)
+            bytes_transferred = res.raw.tell()
         
-        logger.info(f"✅ URL 파싱 완료: {url[:60]}{'...' if len(url) > 60 else ''}")
-        return content
+        result = finish_url_response(url, res.status_code, html, res.headers, cached, use_cache, started)
+        return add_download_metadata(result, bytes_transferred, truncated)
 
     except requests.exceptions.RequestException as e:
         logger.error(f"❌ URL 요청 오류 ({url}): {str(e)}")
-        return f"URL 접근 오류: {url}\n오류 세부사항: {str(e)}"
+        return store_url_error(url, f"URL 접근 오류: {str(e)}", use_cache, started)
     except Exception as e:
         logger.error(f"❌ URL 파싱 오류 ({url}): {str(e)}")
-        return f"URL 파싱 오류: {url}\n오류 세부사항: {str(e)}"
+        return store_url_error(url, f"URL 파싱 오류: {str(e)}", use_cache, started)
+
+def parse_fetched_url(url: str, fetch_result: Dict[str, Any], cached: Optional[Dict[str, Any]], use_cache: bool = True) -> ParseResult:
+    """
+    비동기 다운로드 엔진(AsyncFetcher)의 결과로 본문 텍스트 추출
+    
+    Args:
+        url: 요청한 URL
+        fetch_result: AsyncFetcher가 반환한 결과 딕셔너리
+        cached: 요청 전에 조회한 캐시 항목
+        use_cache: 캐시 사용 여부
+        
+    Returns:
+        파싱 결과 (소요 시간에 다운로드 시간 포함)
+    """
+    # 다운로드 시간을 포함하도록 시작 시각을 앞당김
+    started = time.time() - fetch_result.get("elapsed", 0.0)
+    
+    if fetch_result.get("error"):
+        logger.error(f"❌ URL 요청 오류 ({url}): {fetch_result['error']}")
+        result = store_url_error(url, f"URL 접근 오류: {fetch_result['error']}", use_cache, started)
+    elif fetch_result["status_code"] >= 400:
+        logger.error(f"❌ URL 요청 오류 ({url}): HTTP {fetch_result['status_code']}")
+        result = store_url_error(url, f"URL 접근 오류: HTTP {fetch_result['status_code']}", use_cache, started)
+    else:
+        try:
+            # HTML 본문 추출은 CPU 작업이므로 프로세스 풀에서 실행 (304는 추출 불필요)
+            content = None
+            if fetch_result["status_code"] != 304 or not cached:
+                content = run_cpu_job(extract_url_content, fetch_result["text"], url)
+            result = finish_url_response(url, fetch_result["status_code"], fetch_result["text"],
+                                         fetch_result["headers"], cached, use_cache, started, content)
+        except Exception as e:
+            logger.error(f"❌ URL 파싱 오류 ({url}): {str(e)}")
+            result = store_url_error(url, f"URL 파싱 오류: {str(e)}", use_cache, started)
+    
+    result.metadata["fetch_seconds"] = round(fetch_result.get("elapsed", 0.0), 2)
+    if fetch_result.get("truncated"):
+        logger.warning(f"⚠️ 응답 본문이 크기 제한을 넘어 잘랐습니다: {url[:60]}")
+    return add_download_metadata(result, fetch_result.get("bytes_transferred"), fetch_result.get("truncated", False))
+
+def is_web_url(src: SourceType) -> bool:
+    """YouTube를 제외한 일반 웹 URL 소스인지 확인"""
+    return (isinstance(src, str) and src.startswith(('http://', 'https://'))
+            and "youtube.com" not in src and "youtu.be" not in src)
+
+def preflight_content_lengths(urls: List[str], max_workers: int = IO_THREAD_WORKERS) -> Dict[str, int]:
+    """
+    웹 URL의 응답 크기를 HEAD 요청으로 동시에 확인 (작업 비용 추정용)
+    
+    Args:
+        urls: 확인할 URL 목록
+        max_workers: 동시 요청 수
+        
+    Returns:
+        URL별 Content-Length (확인하지 못한 URL은 제외)
+    """
+    def head(url: str) -> Optional[int]:
+        try:
+            # 재시도하지 않도록 공유 세션 대신 단일 요청 사용 (추정에 실패해도 기본 비용 사용)
+            res = requests.head(url, headers=DEFAULT_REQUEST_HEADERS, timeout=PREFLIGHT_HEAD_TIMEOUT, allow_redirects=True)
+            length = res.headers.get("Content-Length")
+            return int(length) if res.ok and length and length.isdigit() else None
+        except Exception:
+            return None
+    
+    if not urls:
+        return {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+        lengths = dict(zip(urls, executor.map(head, urls)))
+    return {url: length for url, length in lengths.items() if length is not None}
+
+def estimate_source_cost(src: SourceType, content_length: Optional[int] = None, count_pages: bool = True) -> float:
+    """
+    소스 하나의 파싱 비용(대략적인 초) 추정 - 파일 크기, PDF 페이지 수, 웹 응답 크기 기준
+    
+    Args:
+        src: URL 또는 파일 소스 딕셔너리
+        content_length: HEAD 요청으로 확인한 웹 응답 크기 (바이트)
+        count_pages: PDF 페이지 수를 직접 확인할지 여부 (False면 파일 크기로 추정)
+        
+    Returns:
+        추정 비용 (초)
+    """
+    if isinstance(src, str):
+        if "youtube.com" in src or "youtu.be" in src:
+            return COST_YOUTUBE_SECONDS
+        if content_length:
+            return COST_URL_SECONDS + content_length / (1024 * 1024) * COST_URL_SECONDS_PER_MB
+        return COST_URL_SECONDS
+    if not isinstance(src, dict):
+        return 0.0
+    
+    path = src.get("path", "")
+    src_type = src.get("type", "").lower() or os.path.splitext(path)[1].lstrip('.').lower()
+    try:
+        size_mb = (src.get("size") or os.path.getsize(path)) / (1024 * 1024)
+    except OSError:
+        return 0.0  # 없는 파일은 바로 실패
+    
+    if src_type == "pdf" or path.lower().endswith(".pdf"):
+        if count_pages:
+            try:
+                return get_pdf_page_count(path) * COST_PDF_SECONDS_PER_PAGE
+            except Exception:
+                pass
+        return size_mb * COST_PDF_SECONDS_PER_MB
+    if src_type == "docx":
+        return size_mb * COST_DOCX_SECONDS_PER_MB
+    if src_type in IMAGE_TYPES or any(path.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']):
+        return COST_IMAGE_SECONDS
+    return size_mb * COST_TXT_SECONDS_PER_MB
 
 def parse_medium(soup: BeautifulSoup) -> str:
     """Medium 아티클 파싱"""
@@ -195,6 +660,148 @@ def parse_wikipedia(soup: BeautifulSoup) -> str:
         return "\n\n".join(result)
     return ""
 
+def get_wikipedia_api_target(url: str) -> Optional[Tuple[str, str]]:
+    """
+    위키피디아 문서 URL에서 API 주소와 문서 제목 추출
+    
+    Args:
+        url: 웹 URL
+        
+    Returns:
+        (API 주소, 문서 제목) 또는 None (위키피디아 문서 URL이 아닌 경우)
+    """
+    if not isinstance(url, str):
+        return None
+    parsed = urlparse(url)
+    if not parsed.netloc.endswith("wikipedia.org") or not parsed.path.startswith("/wiki/"):
+        return None
+    title = unquote(parsed.path[len("/wiki/"):]).replace("_", " ").strip()
+    if not title:
+        return None
+    api_base = WIKIPEDIA_API_BASE or f"{parsed.scheme}://{parsed.netloc}{WIKIPEDIA_API_PATH}"
+    return api_base, title
+
+def query_wikipedia_page(api_base: str, title: str, props: str, **params) -> Dict[str, Any]:
+    """
+    MediaWiki API로 문서 하나 조회 (리다이렉트 따라감)
+    
+    Args:
+        api_base: api.php 주소
+        title: 문서 제목
+        props: 조회할 prop 값 (예: "info|extracts")
+        **params: 추가 API 파라미터
+        
+    Returns:
+        페이지 정보 딕셔너리 (formatversion=2 형식)
+        
+    Raises:
+        ValueError: 문서가 없거나 응답 형식이 올바르지 않은 경우
+    """
+    res = session.get(api_base, params={
+        "action": "query",
+        "prop": props,
+        "titles": title,
+        "redirects": 1,
+        "format": "json",
+        "formatversion": 2,
+        **params
+    }, headers=DEFAULT_REQUEST_HEADERS, timeout=WIKIPEDIA_API_TIMEOUT)
+    res.raise_for_status()
+    pages = res.json().get("query", {}).get("pages", [])
+    if not pages or pages[0].get("missing") or pages[0].get("invalid"):
+        raise ValueError(f"문서를 찾을 수 없습니다: {title}")
+    return pages[0]
+
+def format_wikipedia_extract(title: str, extract: str) -> str:
+    """
+    TextExtracts 일반 텍스트를 parse_wikipedia와 같은 제목/목차/본문 구조로 변환
+    
+    Args:
+        title: 문서 제목
+        extract: "== 섹션 ==" 제목이 포함된 일반 텍스트 본문
+        
+    Returns:
+        제목, "목차: ..." 줄, 본문 문단을 빈 줄로 구분한 텍스트
+    """
+    toc = []
+    paragraphs = []
+    excluded_section = False
+    for line in extract.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        heading = WIKIPEDIA_HEADING_PATTERN.match(line)
+        if heading:
+            level = len(heading.group(1))
+            if level == 2:
+                # 참고문헌/외부 링크는 HTML에서 목록이라 본문 문단에 없으므로 여기서도 제외
+                excluded_section = heading.group(2) in WIKIPEDIA_TOC_EXCLUDED
+            # HTML 파서와 같이 h2, h3 수준만 목차에 포함
+            if level <= 3 and not excluded_section and heading.group(2) not in WIKIPEDIA_TOC_EXCLUDED:
+                toc.append(heading.group(2))
+            continue
+        if not excluded_section:
+            paragraphs.append(line)
+    
+    result = []
+    if title:
+        result.append(title)
+    if toc:
+        result.append("목차: " + ", ".join(toc))
+    if paragraphs:
+        result.append("\n".join(paragraphs))
+    return "\n\n".join(result)
+
+def parse_wikipedia_api(url: str, use_cache: bool = True) -> Optional[ParseResult]:
+    """
+    위키피디아 문서를 API 일반 텍스트로 추출 (HTML 다운로드/파싱 생략)
+    
+    문서 정보와 본문을 한 번의 API 요청(prop=info|extracts)으로 받고, 응답의 리비전 ID(lastrevid)를
+    캐시 키로 사용합니다. 같은 리비전의 변환 결과가 캐시에 있으면 본문 정리/목차 변환을 생략합니다.
+    
+    Args:
+        url: 위키피디아 문서 URL
+        use_cache: 리비전별 캐시 사용 여부
+        
+    Returns:
+        파싱 결과 또는 None (API를 사용할 수 없어 HTML 경로로 처리해야 하는 경우)
+    """
+    target = get_wikipedia_api_target(url)
+    if target is None:
+        return None
+    api_base, title = target
+    started = time.time()
+    short_url = f"{url[:60]}{'...' if len(url) > 60 else ''}"
+    
+    try:
+        logger.info(f"📚 위키피디아 API 조회: {title}")
+        page = query_wikipedia_page(api_base, title, "info|extracts", explaintext=1, exsectionformat="wiki")
+        revision = page.get("lastrevid")
+        cache_key = f"wiki:v{PARSER_VERSION}:{api_base}:{page['title']}:{revision}" if use_cache and revision else None
+        if cache_key:
+            cached = http_cache.get(cache_key)
+            if cached:
+                logger.info(f"⚡ 캐시에서 위키피디아 본문 로드 (리비전 {revision}): {short_url}")
+                return ParseResult.from_text(url, "url", cached, started,
+                                             metadata={"wikipedia_api": True, "revision": revision, "cache": "revision"})
+        
+        extract = page.get("extract") or ""
+        if not extract.strip():
+            logger.warning(f"⚠️ 위키피디아 API 본문이 비어 있어 HTML로 파싱합니다: {short_url}")
+            return None
+        
+        content = clean_text(format_wikipedia_extract(page["title"], extract))
+        if cache_key:
+            # 리비전 ID가 키에 포함되므로 만료 없이 저장 (문서가 수정되면 새 키 사용)
+            http_cache.set(cache_key, content)
+        
+        logger.info(f"✅ 위키피디아 API 파싱 완료: {short_url}")
+        return ParseResult.from_text(url, "url", content, started,
+                                     metadata={"wikipedia_api": True, "revision": revision})
+    except Exception as e:
+        logger.warning(f"⚠️ 위키피디아 API 사용 불가, HTML로 파싱합니다 ({short_url}): {str(e)}")
+        return None
+
 def parse_arxiv(soup: BeautifulSoup) -> str:
     """arXiv 논문 파싱"""
     # 논문 제목
@@ -223,7 +830,7 @@ def parse_arxiv(soup: BeautifulSoup) -> str:
     return "\n\n".join(result)
 
 def general_parsing(soup: BeautifulSoup, url: str) -> str:
-    """일반적인 웹페이지 파싱 방법 - 도메인별 휴리스틱 개선"""
+    """일반적인 웹페이지 파싱 방법 - 도메인별 휴리스틱 개선 (본문을 찾지 못하면 빈 문자열)"""
     # 제목 추출
     title = ""
     title_tag = soup.find("title")
@@ -257,18 +864,9 @@ def general_parsing(soup: BeautifulSoup, url: str) -> str:
                 return title + "\n\n" + "\n".join(elem.get_text(strip=True) for elem in content_elems)
     
     # 여러 내용 컨테이너 후보 시도 (우선순위 순)
-    content_candidates = [
-        soup.select("article p"),
-        soup.select("main p"),
-        soup.select(".content p, .post-content p, .entry-content p, .article p"),
-        soup.select(".story p, .body p, .post p"),
-        soup.select('[role="main"] p'),
-        soup.select('[role="article"] p'),
-        soup.select("p")  # 마지막 수단
-    ]
-    
-    for candidate in content_candidates:
-        if candidate and len("".join(p.get_text() for p in candidate)) > 200:
+    for selector in CONTENT_CANDIDATE_SELECTORS:
+        candidate = soup.select(selector)
+        if candidate and sum(len(p.get_text()) for p in candidate) > 200:
             content = "\n".join(p.get_text(strip=True) for p in candidate)
             if title:
                 return title + "\n\n" + content
@@ -291,118 +889,794 @@ def general_parsing(soup: BeautifulSoup, url: str) -> str:
     except Exception:
         pass
     
-    # 모든 방법 실패 시 메타 정보라도 반환
+    # 모든 방법 실패 - 제목/설명만으로는 분석할 소스가 되지 못하므로 빈 결과 반환
     if title or meta_desc:
-        result = []
-        if title:
-            result.append(f"제목: {title}")
-        if meta_desc:
-            result.append(f"설명: {meta_desc}")
-        result.append(f"URL: {url}")
-        result.append("(웹페이지에서 충분한 텍스트 콘텐츠를 추출하지 못했습니다.)")
-        return "\n\n".join(result)
-    
-    return f"웹페이지 텍스트 추출 실패: {url}"
+        logger.warning(f"⚠️ 웹페이지에서 충분한 텍스트 콘텐츠를 추출하지 못했습니다 (제목: {title or meta_desc[:60]})")
+    else:
+        logger.warning(f"⚠️ 웹페이지 텍스트 추출 실패: {url}")
+    return ""
 
-def identify_main_content(soup: BeautifulSoup) -> Optional[BeautifulSoup]:
+def identify_main_content(soup: BeautifulSoup) -> Optional[Tag]:
     """
     본문 콘텐츠로 추정되는 영역을 식별하는 함수
     텍스트 길이와 밀도를 기준으로 판단
+    
+    문서 역순(자식이 부모보다 먼저)으로 한 번만 순회하면서 각 노드의 텍스트 길이와
+    마크업 길이를 자식 값의 합으로 계산합니다. 조상마다 get_text()/str()로 하위 트리를
+    다시 직렬화하지 않으므로 중첩이 깊은 페이지에서도 선형 시간에 끝납니다.
     """
-    # 주요 콘텐츠 후보 태그
-    candidates = {}
+    stats = {}  # id(태그) -> (텍스트 길이, 텍스트 조각 수, 마크업 길이)
+    best_element = None
+    best_score = 0.0
     
-    # 일반적인 콘텐츠 컨테이너 태그
-    for tag in ["article", "main", "div", "section"]:
-        for element in soup.find_all(tag):
-            # 클래스/ID 분석하여 광고, 네비게이션 등 제외
-            if element.get("class"):
-                class_str = " ".join(element.get("class")).lower()
-                if any(x in class_str for x in ["nav", "menu", "sidebar", "footer", "comment", "ad-", "advertisement"]):
-                    continue
-            
-            # id 분석
-            if element.get("id"):
-                id_str = element.get("id").lower()
-                if any(x in id_str for x in ["nav", "menu", "sidebar", "footer", "comment"]):
+    for element in reversed(soup.find_all(True)):
+        # 시작/끝 태그 길이 (<name attr="value"></name>, 빈 요소는 <name/>)
+        markup_len = len(element.name) + 3 if element.is_empty_element else len(element.name) * 2 + 5
+        for key, value in element.attrs.items():
+            value = " ".join(value) if isinstance(value, list) else str(value)
+            markup_len += len(key) + len(value) + 4
+        
+        text_len = 0
+        piece_count = 0
+        for child in element.contents:
+            if isinstance(child, Tag):
+                child_text, child_pieces, child_markup = stats.pop(id(child), (0, 0, 0))
+                text_len += child_text
+                piece_count += child_pieces
+                markup_len += child_markup
+            else:
+                markup_len += len(child)
+                if isinstance(child, Comment):
+                    markup_len += 7  # <!-- -->
                     continue
-            
-            # 텍스트 길이 계산
-            text = element.get_text(" ", strip=True)
-            if len(text) < 100:  # 너무 짧은 콘텐츠 제외
+                # get_text()와 같이 일반 텍스트만 계산 (script/style 제외)
+                if type(child) in (NavigableString, CData):
+                    # 직렬화 시 엔티티로 바뀌는 문자 (&amp; &lt; &gt;)
+                    markup_len += 4 * child.count("&") + 3 * (child.count("<") + child.count(">"))
+                    stripped_len = len(child.strip())
+                    if stripped_len:
+                        text_len += stripped_len
+                        piece_count += 1
+        
+        stats[id(element)] = (text_len, piece_count, markup_len)
+        
+        # 일반적인 콘텐츠 컨테이너 태그만 후보로 평가
+        if element.name not in MAIN_CONTENT_TAGS:
+            continue
+        
+        # 클래스/ID 분석하여 광고, 네비게이션 등 제외
+        if element.get("class"):
+            class_str = " ".join(element.get("class")).lower()
+            if any(x in class_str for x in ["nav", "menu", "sidebar", "footer", "comment", "ad-", "advertisement"]):
                 continue
-                
-            # 텍스트 밀도 계산 (텍스트 길이 / HTML 길이)
-            html_len = len(str(element))
-            if html_len == 0:
+        
+        # id 분석
+        if element.get("id"):
+            id_str = element.get("id").lower()
+            if any(x in id_str for x in ["nav", "menu", "sidebar", "footer", "comment"]):
                 continue
-                
-            text_density = len(text) / html_len
-            
-            # 점수 계산 (텍스트 길이 * 텍스트 밀도)
-            score = len(text) * text_density
-            candidates[element] = score
+        
+        # get_text(" ", strip=True) 길이 = 조각 길이 합 + 구분 공백 수
+        length = text_len + max(0, piece_count - 1)
+        if length < 100:  # 너무 짧은 콘텐츠 제외
+            continue
+        
+        # 점수 계산 (텍스트 길이 * 텍스트 밀도)
+        score = length * (length / markup_len)
+        if score >= best_score:  # 역순 순회이므로 동점이면 문서 앞쪽 요소 선택
+            best_element = element
+            best_score = score
+    
+    return best_element
+
+def get_cpu_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """CPU 작업용 공유 프로세스 풀 (최초 사용 시 생성, PDF 페이지 추출과 소스 파싱이 함께 사용)"""
+    global _cpu_process_pool
+    with _cpu_pool_lock:
+        if _cpu_process_pool is None:
+            _cpu_process_pool = concurrent.futures.ProcessPoolExecutor(max_workers=CPU_PROCESS_WORKERS)
+            atexit.register(shutdown_cpu_process_pool)
+        return _cpu_process_pool
+
+def shutdown_cpu_process_pool() -> None:
+    """공유 프로세스 풀 종료"""
+    global _cpu_process_pool
+    with _cpu_pool_lock:
+        if _cpu_process_pool is not None:
+            _cpu_process_pool.shutdown(wait=False, cancel_futures=True)
+            _cpu_process_pool = None
+
+def run_cpu_job(func, *args) -> Any:
+    """
+    CPU 작업을 공유 프로세스 풀에서 실행하고 결과를 기다림
+    
+    코어가 하나뿐이거나 프로세스 풀이 손상된 경우 호출한 스레드에서 직접 실행합니다.
+    func는 다른 프로세스에서 실행되므로 모듈 최상위 함수여야 합니다.
+    
+    Args:
+        func: 실행할 함수
+        *args: 함수 인자 (pickle 가능해야 함)
+        
+    Returns:
+        함수 반환값
+    """
+    # 작업자 프로세스 안에서는 풀을 중첩해서 만들지 않고 바로 실행
+    if CPU_PROCESS_WORKERS > 1 and multiprocessing.parent_process() is None:
+        try:
+            return get_cpu_process_pool().submit(func, *args).result()
+        except concurrent.futures.BrokenExecutor as e:
+            logger.warning(f"⚠️ 프로세스 풀 오류, 현재 스레드에서 실행합니다: {str(e)}")
+            shutdown_cpu_process_pool()
+    return func(*args)
+
+def build_pdf_header(doc: fitz.Document) -> List[str]:
+    """PDF 메타데이터와 목차(TOC) 헤더 줄 생성"""
+    texts = []
+    
+    # 메타데이터 추출
+    metadata = doc.metadata or {}
+    if metadata.get("title"):
+        texts.append(f"제목: {metadata.get('title')}")
+    if metadata.get("author"):
+        texts.append(f"저자: {metadata.get('author')}")
+    if metadata.get("subject"):
+        texts.append(f"주제: {metadata.get('subject')}")
+    texts.append("")  # 빈 줄 추가
     
-    # 점수 기준 정렬
-    if candidates:
-        return max(candidates.items(), key=lambda x: x[1])[0]
+    # TOC(목차) 추출 시도
+    toc = doc.get_toc()
+    if toc:
+        texts.append("목차:")
+        for level, title, page in toc:
+            indent = "  " * (level - 1)
+            texts.append(f"{indent}- {title} (페이지: {page})")
+        texts.append("")  # 빈 줄 추가
     
-    return None
+    return texts
+
+def extract_pdf_page_text(page: fitz.Page) -> str:
+    """페이지 구조 분석(텍스트 블록)을 통한 향상된 페이지 텍스트 추출"""
+    page_text = []
+    for block in page.get_text("blocks"):
+        if block[6] == 0:  # 텍스트 블록
+            block_text = block[4].strip()
+            if block_text:
+                page_text.append(block_text)
+    return "\n".join(page_text)
 
-def parse_pdf(path: str) -> str:
-    """PDF 파일 경로에서 전체 텍스트 추출 - 향상된 버전"""
+def extract_pdf_page_range(path: str, start: int, end: int) -> List[Tuple[int, str]]:
+    """
+    PDF의 [start, end) 페이지 범위에서 텍스트 블록 추출
+    작업자 프로세스에서도 호출되므로 문서를 직접 열어 사용
+    
+    Args:
+        path: PDF 파일 경로
+        start: 시작 페이지 인덱스 (0부터)
+        end: 끝 페이지 인덱스 (포함하지 않음)
+        
+    Returns:
+        (페이지 인덱스, 페이지 텍스트) 목록
+    """
+    doc = fitz.open(path)
     try:
-        logger.info(f"📄 PDF 파싱 시작: {os.path.basename(path)}")
+        return [(page_num, extract_pdf_page_text(doc[page_num])) for page_num in range(start, end)]
+    finally:
+        doc.close()
+
+def iter_pdf_pages(path: str, page_count: int, parallel: bool = False) -> Iterator[Tuple[int, str]]:
+    """
+    PDF 페이지 텍스트를 페이지 순서대로 하나씩 반환하는 제너레이터
+    
+    병렬 모드에서는 페이지 범위를 작업자 프로세스에 나누어 맡기되, 동시에 진행 중인
+    범위 수를 제한(슬라이딩 윈도우)하여 문서 크기와 무관하게 메모리 사용량을 일정하게 유지합니다.
+    
+    Args:
+        path: PDF 파일 경로
+        page_count: 전체 페이지 수
+        parallel: 프로세스 풀 병렬 추출 여부
+        
+    Yields:
+        (페이지 인덱스, 페이지 텍스트)
+    """
+    if not parallel:
+        if page_count < PDF_PARALLEL_MIN_PAGES:
+            # 작은 PDF는 작업 하나로 프로세스 풀에서 추출 (풀이 없으면 현재 프로세스에서 실행)
+            yield from run_cpu_job(extract_pdf_page_range, path, 0, page_count)
+            return
         doc = fitz.open(path)
-        texts = []
-        
-        # 메타데이터 추출
-        metadata = doc.metadata
-        if metadata.get("title"):
-            texts.append(f"제목: {metadata.get('title')}")
-        if metadata.get("author"):
-            texts.append(f"저자: {metadata.get('author')}")
-        if metadata.get("subject"):
-            texts.append(f"주제: {metadata.get('subject')}")
-        texts.append("")  # 빈 줄 추가
+        try:
+            for page_num in range(page_count):
+                yield page_num, extract_pdf_page_text(doc[page_num])
+        finally:
+            doc.close()
+        return
+    
+    # 작업자당 여러 범위를 배정해 페이지별 처리 시간 편차를 흡수
+    chunk_size = max(PDF_MIN_PAGES_PER_TASK, -(-page_count // (CPU_PROCESS_WORKERS * 4)))
+    ranges = iter([(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)])
+    
+    pool = get_cpu_process_pool()
+    window = collections.deque(
+        pool.submit(extract_pdf_page_range, path, start, end)
+        for start, end in itertools.islice(ranges, CPU_PROCESS_WORKERS * 2)
+    )
+    
+    try:
+        while window:
+            pages = window.popleft().result()
+            next_range = next(ranges, None)
+            if next_range:
+                window.append(pool.submit(extract_pdf_page_range, path, *next_range))
+            yield from pages
+    finally:
+        for future in window:
+            future.cancel()
+
+def render_pdf_page_for_ocr(path: str, page_num: int, dpi: int, output_path: str) -> str:
+    """
+    PDF 페이지 하나를 지정한 해상도로 렌더링하고 OCR 전처리 후 PNG로 저장
+    (CPU 작업 - 프로세스 풀에서 실행)
+    
+    Args:
+        path: PDF 파일 경로
+        page_num: 페이지 인덱스 (0부터)
+        dpi: 렌더링 해상도
+        output_path: 전처리된 이미지를 저장할 경로
         
-        # TOC(목차) 추출 시도
-        toc = doc.get_toc()
-        if toc:
-            texts.append("목차:")
-            for level, title, page in toc:
-                indent = "  " * (level - 1)
-                texts.append(f"{indent}- {title} (페이지: {page})")
-            texts.append("")  # 빈 줄 추가
-        
-        # 본문 추출 - 텍스트 블록 기반 접근
-        for page_num, page in enumerate(doc):
-            # 페이지 구조 분석을 통한 향상된 텍스트 추출
-            blocks = page.get_text("blocks")
-            page_text = []
-            
-            for block in blocks:
-                if block[6] == 0:  # 텍스트 블록
-                    block_text = block[4].strip()
-                    if block_text:
-                        page_text.append(block_text)
+    Returns:
+        저장된 이미지 경로
+    """
+    doc = fitz.open(path)
+    try:
+        pixmap = doc[page_num].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+    finally:
+        doc.close()
+    
+    image = Image.frombytes("L", (pixmap.width, pixmap.height), pixmap.samples)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    preprocess_ocr_image(image).save(output_path)
+    return output_path
+
+_ocr_processors: Dict[str, CloudOCRProcessor] = {}
+_ocr_processors_lock = threading.Lock()
+
+def get_pdf_ocr_processor(ocr_engine: str) -> CloudOCRProcessor:
+    """엔진별 OCR 처리기 (실행 중 처음 스캔 페이지를 만났을 때 한 번만 생성하여 모든 PDF가 공유)"""
+    with _ocr_processors_lock:
+        processor = _ocr_processors.get(ocr_engine)
+        if processor is None:
+            processor = CloudOCRProcessor(ocr_engine=ocr_engine, dpi=PDF_OCR_DPI, temp_dir=OCR_TEMP_DIR)
+            if not processor.available_engines:
+                logger.warning("⚠️ OCR 엔진이 없어 스캔 페이지는 텍스트 층 그대로 사용합니다 (API 키 확인)")
+            _ocr_processors[ocr_engine] = processor
+        return processor
+
+def pdf_page_is_scanned(page: "fitz.Page") -> bool:
+    """페이지 면적의 PDF_OCR_MIN_IMAGE_COVERAGE 이상을 이미지가 덮는지 확인 (스캔 페이지 판별)"""
+    page_rect = page.rect
+    page_area = page_rect.width * page_rect.height
+    if page_area <= 0:
+        return False
+    image_area = 0.0
+    for info in page.get_image_info():
+        bbox = fitz.Rect(info["bbox"]) & page_rect
+        if not bbox.is_empty:
+            image_area += bbox.width * bbox.height
+    return image_area / page_area >= PDF_OCR_MIN_IMAGE_COVERAGE
+
+def ocr_pdf_page(processor: CloudOCRProcessor, path: str, page_num: int) -> str:
+    """스캔 페이지 하나를 렌더링(프로세스 풀)한 뒤 OCR API 호출(현재 스레드)"""
+    image_path = os.path.join(OCR_TEMP_DIR, f"pdf_page_{uuid.uuid4().hex}.png")
+    try:
+        run_cpu_job(render_pdf_page_for_ocr, path, page_num, processor.dpi, image_path)
+        return processor.recognize(image_path)
+    finally:
+        if os.path.exists(image_path):
+            os.remove(image_path)
+
+def resolve_ocr_page(entry: Tuple[int, str, Optional[concurrent.futures.Future]],
+                     ocr_stats: Dict[str, int]) -> Tuple[int, str]:
+    """OCR 대기 항목을 (페이지 인덱스, 페이지 텍스트)로 변환 (OCR 실패 시 텍스트 층 사용)"""
+    page_num, page_text, future = entry
+    if future is None:
+        return page_num, page_text
+    try:
+        ocr_text = future.result().strip()
+    except Exception as e:
+        logger.warning(f"⚠️ PDF {page_num + 1}페이지 OCR 실패, 텍스트 층을 사용합니다: {str(e)}")
+        ocr_stats["ocr_skipped"] += 1
+        return page_num, page_text
+    ocr_stats["ocr_pages"] += 1
+    return page_num, ocr_text or page_text
+
+def iter_pdf_pages_with_ocr(path: str, pages: Iterator[Tuple[int, str]], ocr_engine: str,
+                            ocr_stats: Dict[str, int]) -> Iterator[Tuple[int, str]]:
+    """
+    텍스트 층이 거의 없고 이미지가 페이지 대부분을 덮는 페이지(스캔 페이지)만 OCR로 대체하면서 페이지 순서대로 반환
+    
+    그 밖의 페이지(빈 페이지, 제목/간지 포함)는 그대로 통과시키고, 스캔 페이지는 렌더링(프로세스 풀)과
+    OCR API 호출(스레드 풀)을 병렬로 진행합니다. 순서를 지키기 위해 OCR이 끝나지 않은
+    페이지 뒤의 페이지는 최대 PDF_OCR_WINDOW개까지 보관합니다.
+    
+    Args:
+        path: PDF 파일 경로
+        pages: (페이지 인덱스, 텍스트 층 텍스트) 이터레이터
+        ocr_engine: OCR 엔진 ('google', 'aws', 'azure', 'naver')
+        ocr_stats: OCR 처리 페이지 수(ocr_pages), OCR 실패 페이지 수(ocr_skipped),
+            OCR 엔진이 없어 건너뛴 페이지 수(ocr_unavailable)를 기록할 딕셔너리
+        
+    Yields:
+        (페이지 인덱스, 페이지 텍스트)
+    """
+    doc = None
+    processor = None
+    executor = None
+    pending = collections.deque()  # (페이지 인덱스, 텍스트 층 텍스트, OCR Future 또는 None)
+    
+    try:
+        for page_num, page_text in pages:
+            future = None
+            if len(page_text.strip()) < PDF_OCR_MIN_PAGE_CHARS:
+                if doc is None:
+                    doc = fitz.open(path)
+                if pdf_page_is_scanned(doc[page_num]):
+                    # 첫 스캔 페이지를 만났을 때만 OCR 처리기 준비
+                    if processor is None:
+                        processor = get_pdf_ocr_processor(ocr_engine)
+                        if processor.available_engines:
+                            executor = concurrent.futures.ThreadPoolExecutor(max_workers=PDF_OCR_WORKERS)
+                    if executor:
+                        future = executor.submit(ocr_pdf_page, processor, path, page_num)
+                    else:
+                        ocr_stats["ocr_unavailable"] = ocr_stats.get("ocr_unavailable", 0) + 1
+            pending.append((page_num, page_text, future))
             
-            if page_text:
-                # 페이지 번호 표시 (특히 긴 문서에서 유용)
-                if len(doc) > 5:  # 페이지가 5개 이상인 경우에만
-                    texts.append(f"--- 페이지 {page_num + 1} ---")
-                texts.append("\n".join(page_text))
-        
-        logger.info(f"✅ PDF 파싱 완료: {os.path.basename(path)}")
-        return "\n".join(texts)
+            # 맨 앞 페이지가 준비되었거나 보관 한도를 넘으면 순서대로 내보냄
+            while pending and (pending[0][2] is None or pending[0][2].done() or len(pending) > PDF_OCR_WINDOW):
+                yield resolve_ocr_page(pending.popleft(), ocr_stats)
+        
+        while pending:
+            yield resolve_ocr_page(pending.popleft(), ocr_stats)
+    finally:
+        if executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if doc is not None:
+            doc.close()
+
+def pdf_line_hash(line: str) -> int:
+    """반복 줄 비교용 줄 해시 (공백 차이와 페이지 번호 줄의 숫자 차이 무시, 0은 빈 자리 표시용으로 남겨 둠)"""
+    normalized = " ".join(line.split())
+    if PDF_FOLIO_PATTERN.match(normalized):
+        # "Page 3 of 120", "- 12 -" 같은 페이지 번호 줄이 페이지마다 같은 값이 되도록
+        normalized = PDF_BOILERPLATE_DIGITS.sub("#", normalized)
+    return zlib.crc32(normalized.encode('utf-8')) + 1
+
+def pdf_edge_hashes(page_texts: List[str]) -> np.ndarray:
+    """
+    페이지별 위/아래 가장자리 줄의 해시 행렬 생성 (빈 줄 제외)
+    
+    Args:
+        page_texts: 페이지 텍스트 목록
+        
+    Returns:
+        (페이지 수, 2 * PDF_BOILERPLATE_EDGE_LINES) 크기의 행렬
+        (앞쪽 열은 위에서부터, 뒤쪽 열은 아래에서부터 센 줄 - 마지막 열이 맨 아래 줄, 줄이 없으면 0)
+    """
+    edge = PDF_BOILERPLATE_EDGE_LINES
+    hashes = np.zeros((len(page_texts), 2 * edge), dtype=np.uint64)
+    for row, text in enumerate(page_texts):
+        lines = [line for line in text.splitlines() if line.strip()]
+        head = lines[:edge]
+        tail = lines[-edge:]
+        hashes[row, :len(head)] = [pdf_line_hash(line) for line in head]
+        hashes[row, 2 * edge - len(tail):] = [pdf_line_hash(line) for line in tail]
+    return hashes
+
+def find_pdf_boilerplate(hashes: np.ndarray) -> np.ndarray:
+    """
+    위치(열)별로 여러 페이지에 반복되는 줄을 찾아 제거 대상 표시
+    
+    Args:
+        hashes: pdf_edge_hashes 결과 행렬
+        
+    Returns:
+        열별 반복 줄 해시를 담은 (2 * PDF_BOILERPLATE_EDGE_LINES, 반복 줄 최대 수) 행렬 (빈 자리는 0)
+    """
+    min_pages = max(2, int(np.ceil(len(hashes) * PDF_BOILERPLATE_MIN_RATIO)))
+    columns = []
+    for column in hashes.T:
+        values, counts = np.unique(column[column != 0], return_counts=True)
+        columns.append(values[counts >= min_pages])
+    boilerplate = np.zeros((len(columns), max(1, max(len(values) for values in columns))), dtype=np.uint64)
+    for index, values in enumerate(columns):
+        boilerplate[index, :len(values)] = values
+    return boilerplate
+
+def pdf_boilerplate_mask(hashes: np.ndarray, boilerplate: np.ndarray) -> np.ndarray:
+    """
+    페이지별 가장자리 줄 중 반복 줄 위치 표시 (전체 페이지를 한 번에 비교)
+    
+    Args:
+        hashes: pdf_edge_hashes 결과 행렬 (페이지 수, 열 수)
+        boilerplate: find_pdf_boilerplate 결과 행렬 (열 수, 반복 줄 최대 수)
+        
+    Returns:
+        (페이지 수, 열 수) 크기의 불리언 행렬
+    """
+    return (hashes != 0) & (hashes[:, :, None] == boilerplate[None, :, :]).any(axis=2)
+
+def strip_pdf_page_edges(text: str, mask_row: np.ndarray) -> Tuple[str, int]:
+    """
+    페이지 하나에서 반복 줄로 표시된 가장자리 줄 제거
+    
+    Args:
+        text: 페이지 텍스트
+        mask_row: 이 페이지의 반복 줄 위치 표시 (pdf_boilerplate_mask의 한 행)
+        
+    Returns:
+        (정리된 페이지 텍스트, 제거한 줄 수)
+    """
+    if not mask_row.any():
+        return text, 0
+    edge = PDF_BOILERPLATE_EDGE_LINES
+    lines = text.splitlines()
+    content_indices = [index for index, line in enumerate(lines) if line.strip()]
+    drop = set()
+    for column in np.flatnonzero(mask_row):
+        # 열 번호를 페이지 줄 인덱스로 변환 (뒤쪽 열은 아래에서부터)
+        position = column if column < edge else len(content_indices) - (2 * edge - column)
+        drop.add(content_indices[position])
+    return "\n".join(line for index, line in enumerate(lines) if index not in drop), len(drop)
+
+def iter_pdf_pages_without_boilerplate(pages: Iterator[Tuple[int, str]],
+                                       page_stats: Dict[str, int]) -> Iterator[Tuple[int, str]]:
+    """
+    여러 페이지의 같은 위치에 반복되는 머리글/바닥글/페이지 번호 줄을 제거하면서 페이지 순서대로 반환
+    
+    앞쪽 PDF_BOILERPLATE_SAMPLE_PAGES 페이지의 가장자리 줄 해시 행렬로 반복 줄을 위치별로
+    한 번에 판단하고, 이후 페이지에는 판단 결과만 적용하여 메모리 사용량을 제한합니다.
+    
+    Args:
+        pages: (페이지 인덱스, 페이지 텍스트) 이터레이터
+        page_stats: 제거한 줄 수(boilerplate_lines)를 기록할 딕셔너리
+        
+    Yields:
+        (페이지 인덱스, 정리된 페이지 텍스트)
+    """
+    pages = iter(pages)
+    sample = list(itertools.islice(pages, PDF_BOILERPLATE_SAMPLE_PAGES))
+    if len(sample) < PDF_BOILERPLATE_MIN_PAGES:
+        yield from sample
+        yield from pages
+        return
+    
+    hashes = pdf_edge_hashes([text for _, text in sample])
+    boilerplate = find_pdf_boilerplate(hashes)
+    if not boilerplate.any():
+        yield from sample
+        yield from pages
+        return
+    
+    page_stats.setdefault("boilerplate_lines", 0)
+    mask = pdf_boilerplate_mask(hashes, boilerplate)
+    for (page_num, text), mask_row in zip(sample, mask):
+        page_text, removed = strip_pdf_page_edges(text, mask_row)
+        page_stats["boilerplate_lines"] += removed
+        yield page_num, page_text
+    del sample
+    
+    for page_num, text in pages:
+        page_text, removed = strip_pdf_page_edges(text, pdf_boilerplate_mask(pdf_edge_hashes([text]), boilerplate)[0])
+        page_stats["boilerplate_lines"] += removed
+        yield page_num, page_text
+
+def get_pdf_page_count(path: str) -> int:
+    """PDF 페이지 수 확인"""
+    doc = fitz.open(path)
+    try:
+        return len(doc)
+    finally:
+        doc.close()
+
+def iter_pdf_lines(path: str, parallel: Optional[bool] = None, ocr_engine: Optional[str] = None,
+                   page_stats: Optional[Dict[str, int]] = None) -> Iterator[str]:
+    """
+    PDF 추출 결과를 줄 단위로 반환 (헤더, 페이지 표시, 페이지 본문 순)
+    
+    Args:
+        path: PDF 파일 경로
+        parallel: 페이지 병렬 추출 여부 (None이면 PDF_PARALLEL_MIN_PAGES 기준으로 자동 결정)
+        ocr_engine: 스캔 페이지 OCR 엔진 (None이면 텍스트 층만 사용)
+        page_stats: OCR 처리/생략 페이지 수, 제거한 반복 줄 수를 기록할 딕셔너리
+        
+    Yields:
+        출력 텍스트 항목 ('\n'으로 이으면 parse_pdf 결과와 같음)
+    """
+    doc = fitz.open(path)
+    try:
+        header = build_pdf_header(doc)
+        page_count = len(doc)
+    finally:
+        doc.close()
+    
+    if parallel is None:
+        parallel = (page_count >= PDF_PARALLEL_MIN_PAGES and CPU_PROCESS_WORKERS > 1
+                    and multiprocessing.parent_process() is None)
+    parallel = parallel and page_count > 1
+    if parallel:
+        logger.info(f"⚙️ PDF 페이지 병렬 추출: {page_count}페이지 (프로세스 {CPU_PROCESS_WORKERS}개)")
+    
+    yield from header
+    
+    # 본문 추출 - 텍스트 블록 기반 접근 (스캔 페이지는 OCR로 대체)
+    if page_stats is None:
+        page_stats = {"ocr_pages": 0, "ocr_skipped": 0}
+    pages = iter_pdf_pages(path, page_count, parallel)
+    if ocr_engine:
+        pages = iter_pdf_pages_with_ocr(path, pages, ocr_engine, page_stats)
+    # 모든 페이지에 반복되는 머리글/바닥글/페이지 번호 제거 (LLM 입력 토큰 절약)
+    pages = iter_pdf_pages_without_boilerplate(pages, page_stats)
+    for page_num, page_text in pages:
+        if page_text:
+            # 페이지 번호 표시 (특히 긴 문서에서 유용)
+            if page_count > 5:  # 페이지가 5개 이상인 경우에만
+                yield f"--- 페이지 {page_num + 1} ---"
+            yield page_text
+
+def pdf_result_metadata(path: str, page_stats: Dict[str, int]) -> Dict[str, Any]:
+    """PDF 파싱 결과 메타데이터 (페이지 수, OCR한 스캔 페이지 수, 제거한 반복 줄 수)"""
+    metadata = {"pages": get_pdf_page_count(path)}
+    metadata.update({key: value for key, value in page_stats.items() if value})
+    return metadata
+
+def parse_pdf(path: str, parallel: Optional[bool] = None, ocr_engine: Optional[str] = PDF_OCR_ENGINE) -> ParseResult:
+    """
+    PDF 파일 경로에서 전체 텍스트 추출 - 향상된 버전
+    
+    텍스트 층이 거의 없는 스캔 페이지는 해당 페이지만 렌더링하여 OCR로 추출하고,
+    여러 페이지에 반복되는 머리글/바닥글/페이지 번호 줄은 제거합니다.
+    
+    Args:
+        path: PDF 파일 경로
+        parallel: 페이지 병렬 추출 여부 (None이면 PDF_PARALLEL_MIN_PAGES 기준으로 자동 결정)
+        ocr_engine: 스캔 페이지 OCR 엔진 (None 또는 빈 문자열이면 텍스트 층만 사용)
+        
+    Returns:
+        파싱 결과 (메타데이터의 ocr_pages는 OCR한 페이지 수, ocr_skipped는 OCR 호출이 실패한 스캔 페이지 수,
+        ocr_unavailable은 OCR 엔진이 없어 텍스트 층을 그대로 쓴 스캔 페이지 수,
+        boilerplate_lines는 제거한 반복 머리글/바닥글 줄 수)
+    """
+    started = time.time()
+    try:
+        logger.info(f"📄 PDF 파싱 시작: {os.path.basename(path)}")
+        page_stats = {"ocr_pages": 0, "ocr_skipped": 0}
+        try:
+            texts = list(iter_pdf_lines(path, parallel, ocr_engine, page_stats))
+        except concurrent.futures.BrokenExecutor as e:
+            logger.warning(f"⚠️ PDF 병렬 추출 실패, 순차 추출로 대체합니다: {str(e)}")
+            shutdown_cpu_process_pool()
+            page_stats = {"ocr_pages": 0, "ocr_skipped": 0}
+            texts = list(iter_pdf_lines(path, False, ocr_engine, page_stats))
+        
+        logger.info(f"✅ PDF 파싱 완료: {os.path.basename(path)}"
+                    + (f" (스캔 페이지 {page_stats['ocr_pages']}개 OCR)" if page_stats["ocr_pages"] else ""))
+        return ParseResult.from_text(path, "pdf", "\n".join(texts), started,
+                                     metadata=pdf_result_metadata(path, page_stats))
     except Exception as e:
         logger.error(f"❌ PDF 파싱 오류 ({path}): {str(e)}")
-        return f"PDF 파싱 오류: {path}\n오류 세부사항: {str(e)}"
+        return ParseResult.failure(path, "pdf", f"PDF 파싱 오류: {str(e)}", started)
 
-def parse_docx(path: str) -> str:
-    """DOCX 파일에서 텍스트 추출 - 스타일과 구조 정보 포함"""
+def stream_pdf_to_file(path: str, output_path: str, parallel: Optional[bool] = None,
+                       ocr_engine: Optional[str] = PDF_OCR_ENGINE) -> ParseResult:
+    """
+    대용량 PDF를 페이지 단위로 추출하면서 즉시 파일에 기록 (메모리 사용량 일정)
+    
+    Args:
+        path: PDF 파일 경로
+        output_path: 추출 텍스트를 기록할 파일 경로
+        parallel: 페이지 병렬 추출 여부 (None이면 자동 결정)
+        ocr_engine: 스캔 페이지 OCR 엔진 (None 또는 빈 문자열이면 텍스트 층만 사용)
+        
+    Returns:
+        파싱 결과 (텍스트는 기록된 파일을 가리키는 SpooledText)
+    """
+    started = time.time()
+    try:
+        logger.info(f"📄 PDF 스트리밍 파싱 시작: {os.path.basename(path)} → {os.path.basename(output_path)}")
+        page_stats = {"ocr_pages": 0, "ocr_skipped": 0}
+        with SpooledTextWriter(output_path) as writer:
+            for line in iter_pdf_lines(path, parallel, ocr_engine, page_stats):
+                writer.write_line(line)
+        
+        spooled = writer.result()
+        logger.info(f"✅ PDF 스트리밍 파싱 완료: {os.path.basename(path)} ({spooled.char_count:,}자)")
+        result = ParseResult.from_text(path, "pdf", spooled, started,
+                                       metadata={**pdf_result_metadata(path, page_stats), "spooled": True})
+        if not result.ok:
+            os.remove(spooled.path)  # 텍스트가 없는 PDF (스캔 문서 등)
+        return result
+    except Exception as e:
+        logger.error(f"❌ PDF 파싱 오류 ({path}): {str(e)}")
+        return ParseResult.failure(path, "pdf", f"PDF 파싱 오류: {str(e)}", started)
+
+def heading_marker(style_name: str) -> Optional[str]:
+    """
+    스타일 이름이 제목 스타일이면 마크다운 헤딩 표시 반환
+
+    Args:
+        style_name: 문단 스타일 이름 (예: "Heading 2")
+
+    Returns:
+        "#" 반복 문자열 또는 None (제목 스타일이 아닌 경우)
+    """
+    if "Heading" not in style_name:
+        return None
+    level_text = style_name.replace("Heading", "").strip()
+    level = int(level_text) if level_text.isdigit() else 1
+    return "#" * min(level, 6)
+
+def read_docx_core_lines(archive: zipfile.ZipFile) -> List[str]:
+    """
+    docProps/core.xml에서 문서 속성(제목, 저자, 설명) 줄 생성
+
+    Args:
+        archive: 열린 DOCX 압축 파일
+
+    Returns:
+        "라벨: 값" 형식의 줄 목록 (core.xml이 없으면 빈 목록)
+    """
+    try:
+        root = ET.fromstring(archive.read(DOCX_CORE_PART))
+    except KeyError:
+        return []
+    lines = []
+    for tag, label in DOCX_CORE_FIELDS:
+        element = root.find(tag)
+        if element is not None and element.text and element.text.strip():
+            lines.append(f"{label}: {element.text.strip()}")
+    return lines
+
+def read_docx_style_names(archive: zipfile.ZipFile) -> Tuple[Dict[str, str], Optional[str]]:
+    """
+    word/styles.xml에서 문단 스타일 ID -> 표시 이름 매핑 생성
+
+    Args:
+        archive: 열린 DOCX 압축 파일
+
+    Returns:
+        (스타일 ID별 이름, 기본 문단 스타일 ID) 튜플
+    """
+    try:
+        root = ET.fromstring(archive.read(DOCX_STYLES_PART))
+    except KeyError:
+        return {}, None
+    names = {}
+    default_style = None
+    for style in root.iter(W_NS + "style"):
+        if style.get(W_NS + "type") != "paragraph":
+            continue
+        style_id = style.get(W_NS + "styleId")
+        name = style.find(W_NS + "name")
+        # python-docx와 같은 이름 체계 사용 ("heading 1" -> "Heading 1")
+        names[style_id] = BabelFish.internal2ui(name.get(W_NS + "val")) if name is not None else style_id
+        if style.get(W_NS + "default") in ("1", "true"):
+            default_style = style_id
+    return names, default_style
+
+def iter_docx_lines(path: str, counts: Dict[str, int]) -> Iterator[str]:
+    """
+    word/document.xml을 iterparse로 순차 처리하여 제목, 문단, 표 행을 문서 순서대로 생성
+    
+    처리가 끝난 본문 요소는 즉시 트리에서 제거하므로 문서 크기와 관계없이 메모리 사용량이 일정합니다.
+    altChunk 등 스트리밍으로 처리할 수 없는 요소가 있으면 ValueError를 발생시킵니다.
+
+    Args:
+        path: DOCX 파일 경로
+        counts: 문단/표 개수를 기록할 딕셔너리 (호출 측에서 메타데이터로 사용)
+
+    Yields:
+        출력 텍스트 줄
+    """
+    with zipfile.ZipFile(path) as archive:
+        core_lines = read_docx_core_lines(archive)
+        style_names, default_style = read_docx_style_names(archive)
+        yield from core_lines
+        yield ""  # 빈 줄 추가
+
+        with archive.open(DOCX_DOCUMENT_PART) as document:
+            depth = 0  # 현재 요소 깊이 (document=1, body=2, 본문 블록=3)
+            body = None
+            table_depth = 0
+            paragraph_stack = []  # 문단별 (텍스트 조각, 스타일 ID) - 텍스트 상자 등 중첩 문단 대비
+            cell_lines = None  # 최상위 표의 현재 셀 문단 목록
+            row_cells = []
+
+            for event, element in ET.iterparse(document, events=("start", "end")):
+                tag = element.tag
+                if event == "start":
+                    depth += 1
+                    if depth == 1 and tag != W_NS + "document":
+                        raise ValueError(f"지원하지 않는 문서 형식: {tag}")
+                    if tag in DOCX_UNSUPPORTED_TAGS:
+                        raise ValueError(f"스트리밍으로 처리할 수 없는 요소: {tag}")
+                    if tag == W_NS + "p":
+                        paragraph_stack.append(([], None))
+                    elif tag == W_NS + "tbl":
+                        table_depth += 1
+                        if table_depth == 1:
+                            counts["tables"] += 1
+                            yield f"\n표 {counts['tables']}:"
+                    elif tag == W_NS + "tc" and table_depth == 1:
+                        cell_lines = []
+                    elif tag == W_NS + "body":
+                        body = element
+                    continue
+
+                depth -= 1
+                # python-docx와 마찬가지로 문단 바로 아래의 런 텍스트만 사용 (텍스트 상자 내부 문단 제외)
+                if tag in DOCX_RUN_TEXT and len(paragraph_stack) == 1:
+                    if tag == W_NS + "t":
+                        paragraph_stack[0][0].append(element.text or "")
+                    elif tag != W_NS + "br" or element.get(W_NS + "type", "textWrapping") == "textWrapping":
+                        paragraph_stack[0][0].append(DOCX_RUN_TEXT[tag])
+                elif tag == W_NS + "pStyle" and paragraph_stack:
+                    paragraph_stack[-1] = (paragraph_stack[-1][0], element.get(W_NS + "val"))
+                elif tag == W_NS + "p":
+                    parts, style_id = paragraph_stack.pop()
+                    if not paragraph_stack:
+                        text = "".join(parts).strip()
+                        if table_depth:
+                            # 중첩 표의 문단도 바깥 셀 내용에 포함
+                            if cell_lines is not None:
+                                cell_lines.append(text)
+                        else:
+                            counts["paragraphs"] += 1
+                            if text:
+                                style_id = style_id or default_style
+                                marker = heading_marker(style_names.get(style_id, style_id or ""))
+                                yield f"{marker} {text}" if marker else text
+                elif tag == W_NS + "tc" and table_depth == 1:
+                    cell_text = "\n".join(cell_lines).strip()
+                    if cell_text:
+                        row_cells.append(cell_text)
+                    cell_lines = None
+                elif tag == W_NS + "tr" and table_depth == 1:
+                    if row_cells:
+                        yield " | ".join(row_cells)
+                    row_cells = []
+                elif tag == W_NS + "tbl":
+                    table_depth -= 1
+
+                # 처리가 끝난 본문 블록을 트리에서 제거하여 메모리 사용량 유지
+                if depth == 2 and body is not None:
+                    body.remove(element)
+
+def parse_docx(path: str) -> ParseResult:
+    """
+    DOCX 파일에서 텍스트 추출 - 스타일과 구조 정보 포함
+    
+    word/document.xml을 스트리밍으로 읽어 제목, 문단, 표를 문서 순서대로 추출하고,
+    스트리밍으로 처리할 수 없는 파일은 python-docx 파서로 처리합니다.
+    """
+    started = time.time()
+    logger.info(f"📄 DOCX 파싱 시작: {os.path.basename(path)}")
+    counts = {"paragraphs": 0, "tables": 0}
+    try:
+        text = "\n".join(iter_docx_lines(path, counts))
+    except (KeyError, ValueError, ET.ParseError, zipfile.BadZipFile) as e:
+        logger.info(f"ℹ️ DOCX 스트리밍 읽기 불가, python-docx로 재시도 ({os.path.basename(path)}): {str(e)}")
+        return parse_docx_with_python_docx(path)
+    except Exception as e:
+        logger.error(f"❌ DOCX 파싱 오류 ({path}): {str(e)}")
+        return ParseResult.failure(path, "docx", f"DOCX 파싱 오류: {str(e)}", started)
+
+    logger.info(f"✅ DOCX 파싱 완료: {os.path.basename(path)}")
+    return ParseResult.from_text(path, "docx", text, started, metadata={"reader": "stream", **counts})
+
+def parse_docx_with_python_docx(path: str) -> ParseResult:
+    """DOCX 파일에서 텍스트 추출 - python-docx로 전체 문서를 읽는 방식 (스트리밍 실패 시 사용)"""
+    started = time.time()
     try:
-        logger.info(f"📄 DOCX 파싱 시작: {os.path.basename(path)}")
         doc = docx.Document(path)
         full_text = []
         
@@ -445,106 +1719,163 @@ def parse_docx(path: str) -> str:
                     full_text.append(" | ".join(row_text))
         
         logger.info(f"✅ DOCX 파싱 완료: {os.path.basename(path)}")
-        return "\n".join(full_text)
+        return ParseResult.from_text(path, "docx", "\n".join(full_text), started,
+                                     metadata={"reader": "python-docx", "paragraphs": len(doc.paragraphs),
+                                               "tables": len(doc.tables)})
     except Exception as e:
         logger.error(f"❌ DOCX 파싱 오류 ({path}): {str(e)}")
-        return f"DOCX 파싱 오류: {path}\n오류 세부사항: {str(e)}"
+        return ParseResult.failure(path, "docx", f"DOCX 파싱 오류: {str(e)}", started)
 
-def parse_txt(path: str) -> str:
-    """TXT 파일에서 텍스트 추출 - 다양한 인코딩 지원"""
-    logger.info(f"📄 TXT 파싱 시작: {os.path.basename(path)}")
+def detect_text_encoding(sample: bytes) -> Tuple[str, str]:
+    """
+    파일 앞부분 샘플로 텍스트 인코딩 추정
     
-    # 시도할 인코딩 목록
-    encodings = ['utf-8', 'latin-1', 'cp949', 'euc-kr', 'cp1252']
+    1. BOM 확인
+    2. UTF-8 점진적 디코더로 검증 (샘플 끝에서 잘린 멀티바이트 문자는 허용)
+    3. charset_normalizer 추정 (설치된 경우)
+    4. 후보 인코딩 순서대로 검증 (latin-1은 항상 성공하므로 마지막)
+    
+    Args:
+        sample: 파일 앞부분 바이트 (최대 TXT_SNIFF_BYTES)
+        
+    Returns:
+        (인코딩 이름, 판정 방법) 튜플
+    """
+    for bom, encoding in TEXT_BOMS:
+        if sample.startswith(bom):
+            return encoding, "bom"
     
-    for encoding in encodings:
+    def decodes(encoding: str) -> bool:
         try:
-            with open(path, 'r', encoding=encoding) as file:
-                content = file.read()
-            
-            logger.info(f"✅ TXT 파싱 완료 ({encoding} 인코딩): {os.path.basename(path)}")
-            
-            # 파일 기본 정보 추가
-            file_info = f"파일명: {os.path.basename(path)}\n"
-            file_info += f"크기: {os.path.getsize(path) / 1024:.1f} KB\n\n"
-            
-            return file_info + content
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return True
         except UnicodeDecodeError:
-            continue
-        except Exception as e:
-            logger.error(f"❌ TXT 파싱 오류 ({path}, {encoding}): {str(e)}")
+            return False
+    
+    if decodes("utf-8"):
+        return "utf-8", "utf-8"
     
-    # 모든 인코딩 시도 실패
-    logger.error(f"❌ TXT 파싱 실패: 지원되는 인코딩을 찾을 수 없습니다 ({path})")
-    return f"TXT 파싱 오류: {path}\n지원되는 인코딩을 찾을 수 없습니다."
+    try:
+        from charset_normalizer import from_bytes
+        matches = from_bytes(sample)
+        best = matches.best()
+        if best and best.encoding:
+            # 짧은 샘플에서는 비슷한 코드페이지가 근소한 차이로 앞설 수 있으므로 흔한 인코딩을 우선
+            candidates = [m.encoding for m in matches if m.chaos <= best.chaos + TXT_DETECTOR_CHAOS_TOLERANCE]
+            encoding = next((e for e in TXT_PREFERRED_ENCODINGS if e in candidates), best.encoding)
+            # EUC-KR로 판정되어도 상위 호환인 CP949로 디코딩 (확장 한글 포함)
+            if encoding == "euc_kr":
+                encoding = "cp949"
+            if decodes(encoding):
+                return encoding, "detector"
+    except ImportError:
+        pass
+    
+    for encoding in TXT_FALLBACK_ENCODINGS:
+        if decodes(encoding):
+            return encoding, "fallback"
+    return "latin-1", "fallback"
 
-def clean_text(text: str) -> str:
-    """텍스트 정리 및 정규화 - 고급 정제 기능 추가"""
-    if not text:
-        return ""
+def parse_txt(path: str) -> ParseResult:
+    """
+    TXT 파일에서 텍스트 추출 - 앞부분 샘플로 인코딩을 정한 뒤 한 번만 디코딩
+    
+    TXT_MMAP_MIN_BYTES 이상인 파일은 mmap으로 읽어 바이트 사본을 메모리에 올리지 않습니다.
+    
+    Args:
+        path: TXT 파일 경로
         
-    # 여러 줄바꿈 정리
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    
-    # 불필요한 공백 제거
-    text = re.sub(r'\s{2,}', ' ', text)
-    
-    # 일반적인 쓸모없는 텍스트 제거 (예: 쿠키 정책, 구독 안내 등)
-    patterns_to_remove = [
-        r'쿠키를 사용.*?동의',
-        r'Subscribe to.*?newsletter',
-        r'구독.*?뉴스레터',
-        r'Published:.*?\d{4}',
-        r'Last modified on.*?\d{4}',
-        r'Share on (?:Twitter|Facebook|LinkedIn)',
-        r'\d+ shares',
-        r'©.*?All rights reserved',
-        r'Terms of (?:use|service)',
-        r'Privacy Policy',
-        r'All Rights Reserved',
-        r'Please enable JavaScript',
-        r'You need to enable JavaScript',
-        r'ADVERTISEMENT',
-        r'Advertisement',
-        r'Sponsored Content',
-        r'Click here to view'
-    ]
+    Returns:
+        파싱 결과
+    """
+    started = time.time()
+    logger.info(f"📄 TXT 파싱 시작: {os.path.basename(path)}")
     
-    for pattern in patterns_to_remove:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    try:
+        size = os.path.getsize(path)
+        with open(path, 'rb') as file:
+            sample = file.read(TXT_SNIFF_BYTES)
+            encoding, method = detect_text_encoding(sample)
+            
+            if size >= TXT_MMAP_MIN_BYTES:
+                # 대용량 파일은 mmap 버퍼를 바로 디코딩 (한 번의 패스)
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    try:
+                        content = str(mapped, encoding)
+                    except UnicodeDecodeError as e:
+                        logger.warning(f"⚠️ 샘플 이후 {encoding} 디코딩 오류, 잘못된 바이트는 대체합니다: {str(e)}")
+                        content = str(mapped, encoding, errors='replace')
+            else:
+                data = sample + file.read()
+                try:
+                    content = data.decode(encoding)
+                except UnicodeDecodeError as e:
+                    logger.warning(f"⚠️ 샘플 이후 {encoding} 디코딩 오류, 잘못된 바이트는 대체합니다: {str(e)}")
+                    content = data.decode(encoding, errors='replace')
+                del data
+    except Exception as e:
+        logger.error(f"❌ TXT 파싱 오류 ({path}): {str(e)}")
+        return ParseResult.failure(path, "txt", f"TXT 파싱 오류: {str(e)}", started)
+    
+    logger.info(f"✅ TXT 파싱 완료 ({encoding} 인코딩, {method}): {os.path.basename(path)}")
     
+    # 파일 기본 정보 추가
+    file_info = f"파일명: {os.path.basename(path)}\n"
+    file_info += f"크기: {size / 1024:.1f} KB\n\n"
+    
+    return ParseResult.from_text(path, "txt", file_info + content, started,
+                                 metadata={"encoding": encoding, "encoding_source": method,
+                                           "mmap": size >= TXT_MMAP_MIN_BYTES})
+
+def clean_text(text: str) -> str:
+    """
+    텍스트 정리 및 정규화 - 미리 컴파일한 패턴으로 한 번씩만 훑어 처리
+
+    Args:
+        text: 정리할 텍스트
+
+    Returns:
+        공백 정리, 상투 문구 제거, 중복 줄 제거를 마친 텍스트
+    """
+    if not text:
+        return ""
+
+    # 연속 공백/줄바꿈 정리 (두 칸 이상의 공백 문자는 한 칸으로)
+    text = WHITESPACE_RUN_PATTERN.sub(' ', text)
+
+    # 일반적인 쓸모없는 텍스트 제거 (모든 패턴을 하나의 정규식으로 한 번에 처리)
+    text = BOILERPLATE_PATTERN.sub('', text)
+
     # 중복된 텍스트 블록 제거 (특히 PDF에서 자주 발생)
-    lines = text.split('\n')
     unique_lines = []
-    seen_chunks = set()
-    
-    for line in lines:
+    seen_fingerprints = set()  # 청크 문자열 대신 해시값만 보관
+
+    for line in text.split('\n'):
         line = line.strip()
-        if len(line) > 20:  # 긴 줄에 대해서만 중복 검사
-            # 줄을 청크로 나누어 체크 (아주 긴 줄인 경우 일부만 중복될 수도 있음)
-            chunk_size = 50
-            chunks = [line[i:i+chunk_size] for i in range(0, len(line), chunk_size)]
-            
-            # 첫 번째 청크가 중복되면 건너뜀
-            if chunks and chunks[0] in seen_chunks:
+        line_len = len(line)
+        if line_len > DEDUP_MIN_LINE_CHARS:  # 긴 줄에 대해서만 중복 검사
+            # 첫 번째 청크가 이미 본 청크면 건너뜀
+            if hash(line[:DEDUP_CHUNK_CHARS]) in seen_fingerprints:
                 continue
-            
-            # 청크 추가
-            for chunk in chunks:
-                if len(chunk) >= 20:  # 의미 있는 크기의 청크만 체크
-                    seen_chunks.add(chunk)
-        
+
+            # 의미 있는 크기(DEDUP_MIN_CHUNK_CHARS 이상)의 청크 해시 기록
+            seen_fingerprints.update(
+                hash(line[i:i + DEDUP_CHUNK_CHARS])
+                for i in range(0, line_len - DEDUP_MIN_CHUNK_CHARS + 1, DEDUP_CHUNK_CHARS)
+            )
+
         unique_lines.append(line)
-    
+
     # 정리된 텍스트 반환
     cleaned_text = '\n'.join(unique_lines)
-    cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)  # 최종 줄바꿈 정리
-    
+    cleaned_text = BLANK_LINES_PATTERN.sub('\n\n', cleaned_text)  # 최종 줄바꿈 정리
+
     return cleaned_text.strip()
 
-def parse_youtube_content(url: str) -> str:
+def parse_youtube_content(url: str) -> ParseResult:
     """YouTube 영상 콘텐츠 추출 - 동적 임포트 처리"""
     global youtube_parser
+    started = time.time()
     
     # 필요시 유튜브 파서 모듈 임포트
     if youtube_parser is None:
@@ -554,36 +1885,273 @@ def parse_youtube_content(url: str) -> str:
             logger.info("✅ YouTube 파서 모듈 로드 성공")
         except ImportError:
             logger.error("❌ YouTube 파서 모듈을 찾을 수 없습니다.")
-            return f"YouTube 영상 파싱 오류 ({url}): YouTube 파서 모듈을 찾을 수 없습니다."
+            return ParseResult.failure(url, "youtube", "YouTube 파서 모듈을 찾을 수 없습니다.", started)
     
     try:
-        return youtube_parser.parse_youtube(url)
+        text = youtube_parser.parse_youtube(url)
     except Exception as e:
         logger.error(f"❌ YouTube 영상 파싱 오류 ({url}): {str(e)}")
-        return f"YouTube 영상 파싱 오류 ({url}): {str(e)}"
+        return ParseResult.failure(url, "youtube", f"YouTube 영상 파싱 오류: {str(e)}", started)
+    
+    # YouTube 파서 모듈은 오류를 문자열로 반환
+    if is_parse_error(text):
+        return ParseResult.failure(url, "youtube", text, started)
+    return ParseResult.from_text(url, "youtube", text, started)
+
+def parse_image(path: str, engine: str = "google") -> ParseResult:
+    """
+    이미지 파일에서 클라우드 OCR로 텍스트 추출
+    
+    Args:
+        path: 이미지 파일 경로
+        engine: OCR 엔진 ('google', 'aws', 'azure', 'naver')
+        
+    Returns:
+        파싱 결과
+    """
+    started = time.time()
+    
+    # 이미지 전처리(CPU)는 프로세스 풀에서, OCR API 호출(I/O)은 현재 스레드에서 실행
+    preprocessed_path = os.path.join(OCR_TEMP_DIR, f"prep_{uuid.uuid4().hex}.png")
+    try:
+        run_cpu_job(prepare_ocr_image, path, preprocessed_path)
+        text = parse_cloud_ocr(path, engine=engine, preprocessed_path=preprocessed_path)
+    except Exception as e:
+        logger.error(f"❌ 이미지 파싱 오류 ({path}): {str(e)}")
+        return ParseResult.failure(path, "image", f"이미지 파싱 오류: {str(e)}", started, metadata={"ocr_engine": engine})
+    finally:
+        # OCR 엔진을 쓸 수 없어 조기 반환한 경우 남은 전처리 파일 정리
+        if os.path.exists(preprocessed_path):
+            os.remove(preprocessed_path)
+    
+    # OCR 모듈은 오류를 문자열로 반환
+    if is_parse_error(text):
+        return ParseResult.failure(path, "image", text, started, metadata={"ocr_engine": engine})
+    return ParseResult.from_text(path, "image", text, started, metadata={"ocr_engine": engine})
 
-# source_parser_updated.py 파일에 추가 또는 수정할 부분
+def get_source_cache_key(path: str, src_type: str, ocr_engine: Optional[str] = None) -> str:
+    """
+    파일 소스의 캐시 키 생성 - 파일 내용 해시와 파서 버전 기반
+    
+    TXT/이미지 파싱 결과의 머리글에는 파일 이름이 들어가므로 파일 이름도 키에 포함합니다.
+    (내용이 같은 파일을 이름만 바꾸거나 복사한 경우 이전 이름이 분석 프롬프트에 들어가지 않도록)
+    
+    Args:
+        path: 파일 경로
+        src_type: 소스 유형 (pdf, docx, txt, 이미지 확장자)
+        ocr_engine: 이미지/PDF 소스의 OCR 엔진 (엔진마다 결과가 다르므로 키에 포함)
+        
+    Returns:
+        캐시 키 문자열
+    """
+    parts = [f"v{PARSER_VERSION}", src_type]
+    if ocr_engine:
+        parts.append(ocr_engine)
+    parts.append(file_sha256(path))
+    parts.append(os.path.basename(path))
+    return ":".join(parts)
+
+def is_parse_error(text: str) -> bool:
+    """외부 파서 모듈(YouTube, OCR)이 반환한 텍스트가 오류 메시지인지 확인 (첫 줄 기준)"""
+    first_line = text.split("\n", 1)[0] if text else ""
+    return any(marker in first_line for marker in PARSE_ERROR_MARKERS)
+
+class SourcePrefetcher:
+    """
+    대화형 입력 중 소스를 미리 파싱하는 백그라운드 실행기
+    
+    입력 검증을 통과한 소스를 바로 파싱하기 시작하고, 입력이 끝난 뒤 parse_sources가
+    완료된(또는 진행 중인) 작업을 넘겨받아 다시 파싱하지 않습니다. 확정 전에 제거된
+    소스는 작업을 취소합니다 (이미 실행 중이면 결과를 버림).
+    
+    과금되는 OCR API를 호출하는 소스(이미지, OCR 엔진을 지정한 PDF)는 입력이 확정되기 전에는
+    미리 파싱하지 않습니다.
+    """
+    
+    def __init__(self, use_cache: bool = True, max_workers: int = PREFETCH_WORKERS,
+                 parse_options: Optional[Dict[str, Any]] = None):
+        """
+        초기화
+        
+        Args:
+            use_cache: 파싱 결과 디스크 캐시 사용 여부
+            max_workers: 동시에 미리 파싱할 소스 수
+            parse_options: parse_sources에 그대로 넘길 다운로드 설정
+                (max_in_flight, per_host_limit, http2, max_download_bytes - 본 파싱과 같은 값)
+        """
+        self.use_cache = use_cache
+        self.parse_options = parse_options or {}
+        # 대용량 PDF 스트리밍 기록 위치 (넘겨받은 결과는 parse_source_content가 프로젝트 sources/로 옮김)
+        self._spool_root = os.path.join(PREFETCH_SPOOL_DIR, uuid.uuid4().hex)
+        # 미리 파싱과 본 파싱이 함께 쓰는 비동기 다운로드 엔진 (연결 재사용, 전체/호스트별 동시 요청 수 공유)
+        self._fetcher = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+        self._jobs = {}  # 소스 키 -> Future[ParseResult]
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def source_key(src: SourceType) -> str:
+        """소스 식별 키 (URL 문자열 또는 파일 소스 딕셔너리의 JSON)"""
+        return src if isinstance(src, str) else json.dumps(src, sort_keys=True, ensure_ascii=False)
+    
+    def submit(self, src: SourceType) -> bool:
+        """
+        소스 미리 파싱 시작
+        
+        Args:
+            src: 검증을 마친 소스 (폴더는 파일 수와 OCR 비용 때문에 미리 파싱하지 않음)
+            
+        Returns:
+            새 작업을 시작했는지 여부
+        """
+        if isinstance(src, dict) and src.get("type") in ("image_folder", "folder"):
+            return False
+        if self.uses_billed_ocr(src):
+            return False
+        key = self.source_key(src)
+        with self._lock:
+            if self._executor is None or key in self._jobs:
+                return False
+            self._jobs[key] = self._executor.submit(self._parse, src)
+        logger.info(f"⚡ 백그라운드 파싱 시작: {key[:60]}")
+        return True
+    
+    @staticmethod
+    def uses_billed_ocr(src: SourceType) -> bool:
+        """OCR API를 호출하는 파일 소스인지 확인 (이미지, OCR 엔진을 지정한 PDF)"""
+        if not isinstance(src, dict):
+            return False
+        path = src.get("path", "").lower()
+        src_type = src.get("type", "").lower() or os.path.splitext(path)[1].lstrip('.')
+        if src_type in IMAGE_TYPES or src_type == "jpeg":
+            return True
+        return src_type == "pdf" and bool(src.get("ocr_engine", PDF_OCR_ENGINE))
+    
+    def get_fetcher(self) -> AsyncFetcher:
+        """공유 비동기 다운로드 엔진 (처음 사용할 때 생성, close()에서 종료)"""
+        with self._lock:
+            if self._fetcher is None:
+                max_in_flight = self.parse_options.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)
+                per_host_limit = self.parse_options.get("per_host_limit", DEFAULT_PER_HOST_LIMIT)
+                self._fetcher = AsyncFetcher(
+                    max_in_flight=max_in_flight,
+                    per_host_limit=per_host_limit,
+                    http2=self.parse_options.get("http2", False),
+                    headers=DEFAULT_REQUEST_HEADERS,
+                    max_bytes=self.parse_options.get("max_download_bytes", DEFAULT_MAX_BYTES)
+                )
+                self._fetcher.start()
+                logger.info(f"🌐 비동기 다운로드 엔진 사용 (전체 {max_in_flight}개, 호스트별 {per_host_limit}개 동시 요청)")
+            return self._fetcher
+    
+    def _parse(self, src: SourceType) -> ParseResult:
+        # 작업마다 별도 폴더에 스트리밍 기록 (parse_sources의 파일 이름은 소스 순서 기준이라 겹치지 않도록)
+        spool_dir = os.path.join(self._spool_root, uuid.uuid4().hex)
+        os.makedirs(spool_dir, exist_ok=True)
+        fetcher = self.get_fetcher() if is_web_url(src) and get_wikipedia_api_target(src) is None else None
+        return parse_sources([src], max_workers=1, use_cache=self.use_cache, spool_dir=spool_dir,
+                             source_timeout=None, fetcher=fetcher, **self.parse_options)[0]
+    
+    def cancel(self, src: SourceType) -> None:
+        """제거된 소스의 미리 파싱 작업 취소"""
+        with self._lock:
+            future = self._jobs.pop(self.source_key(src), None)
+        if future is not None and not future.cancel():
+            logger.info(f"ℹ️ 실행 중인 백그라운드 파싱은 결과를 버립니다: {self.source_key(src)[:60]}")
+    
+    def claim(self, src: SourceType) -> Optional[concurrent.futures.Future]:
+        """
+        소스의 미리 파싱 작업 넘겨받기 (같은 소스를 여러 번 넣으면 첫 번째만 넘겨받음)
+        
+        Returns:
+            ParseResult를 담는 Future 또는 None (미리 파싱하지 않은 소스)
+        """
+        with self._lock:
+            future = self._jobs.pop(self.source_key(src), None)
+        return None if future is None or future.cancelled() else future
+    
+    def close(self) -> None:
+        """넘겨받지 않은 작업 취소 및 실행기 종료 (실행 중인 작업은 기다리지 않음)"""
+        with self._lock:
+            futures = list(self._jobs.values())
+            self._jobs.clear()
+            executor, self._executor = self._executor, None
+            fetcher, self._fetcher = self._fetcher, None
+        for future in futures:
+            future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if fetcher is not None:
+            fetcher.close()
+        # 넘겨받은 결과는 이미 프로젝트 폴더로 옮겨졌으므로 남은 스트리밍 파일 정리
+        shutil.rmtree(self._spool_root, ignore_errors=True)
 
-def parse_sources(sources: List[SourceType], max_workers: int = 4) -> List[str]:
+def parse_sources(
+    sources: List[SourceType],
+    max_workers: int = 4,
+    use_cache: bool = True,
+    async_fetch: bool = True,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+    http2: bool = False,
+    max_download_bytes: int = DEFAULT_MAX_BYTES,
+    spool_dir: Optional[str] = None,
+    source_timeout: Optional[float] = None,
+    web_source_timeout: Optional[float] = DEFAULT_WEB_SOURCE_TIMEOUT,
+    stage_timeout: Optional[float] = None,
+    prefetcher: Optional[SourcePrefetcher] = None,
+    fetcher: Optional[AsyncFetcher] = None
+) -> List[ParseResult]:
     """
     URL 또는 파일 목록 전체 처리 - 병렬 처리 및 오류 처리 강화
     
+    소스마다 작업 유형을 나누어 실행합니다. 웹 URL은 비동기 다운로드 엔진(AsyncFetcher)에서
+    동시에 받고, 다운로드·YouTube·OCR API 호출 같은 I/O 작업은 큰 스레드 풀에서,
+    PDF/DOCX 파싱·HTML 본문 추출·OCR 이미지 전처리 같은 CPU 작업은 코어 수만큼의
+    공유 프로세스 풀에서 실행합니다. 두 풀이 동시에 돌아가므로 전체 시간은 가장 느린
+    소스 하나에 가깝게 줄어듭니다.
+    
+    제한 시간을 넘긴 소스는 취소(시작 전 작업, 다운로드 중인 URL)하거나 결과를 기다리지 않고
+    STATUS_TIMEOUT 결과로 보고하며, 나머지 소스의 결과는 그대로 반환합니다.
+    
     Args:
         sources: URL 또는 파일 경로 목록
-        max_workers: 병렬 처리 작업자 수
+        max_workers: I/O 스레드 최소 수 (소스 수에 맞춰 IO_THREAD_WORKERS까지 늘어남)
+        use_cache: 파싱 결과 디스크 캐시 사용 여부 (파일 내용 해시 캐시 및 URL 조건부 요청 캐시)
+        async_fetch: 웹 URL에 비동기 다운로드 엔진 사용 여부
+        max_in_flight: 비동기 엔진의 전체 동시 요청 수
+        per_host_limit: 비동기 엔진의 호스트별 동시 요청 수
+        http2: HTTP/2 사용 여부 (h2 패키지 필요)
+        max_download_bytes: 웹 응답 본문 최대 크기 (압축 해제 후, 초과분은 잘라냄)
+        spool_dir: 대용량 PDF(PDF_STREAM_MIN_PAGES 이상)를 스트리밍 기록할 디렉토리.
+            지정하면 해당 소스의 텍스트는 문자열 대신 SpooledText
+        source_timeout: 모든 소스에 적용할 소스 하나의 제한 시간 (초, 작업 시작 시점부터. None이면 제한 없음)
+        web_source_timeout: source_timeout이 없을 때 웹 URL(YouTube 포함)에만 적용할 제한 시간 (초, None이면 제한 없음)
+        stage_timeout: 파싱 단계 전체의 제한 시간 (초, None이면 제한 없음)
+        prefetcher: 대화형 입력 중 미리 파싱을 시작한 실행기 (해당 소스는 그 결과를 넘겨받고,
+            나머지 웹 URL도 그 실행기의 다운로드 엔진을 함께 사용)
+        fetcher: 호출한 쪽이 관리하는 비동기 다운로드 엔진 (지정하면 새로 만들지 않고 종료하지도 않음)
         
     Returns:
-        파싱된 텍스트 목록
+        소스 순서대로의 파싱 결과 목록 (성공 여부는 ParseResult.ok로 확인)
     """
-    parsed_texts = []
     successful_sources = 0
     failed_sources = 0
     
     # 폴더 처리를 위한 소스 확장 (추가된 부분)
     expanded_sources = []
     for src in sources:
-        # 이미지 폴더 처리
-        if isinstance(src, dict) and src.get("type") == "image_folder":
+        # 폴더 처리 (하위 폴더까지 스캔한 파일 목록을 큰 파일부터 개별 소스로 추가)
+        if isinstance(src, dict) and src.get("type") == "folder":
+            try:
+                folder_sources = expand_folder_source(src)
+                logger.info(f"📁 폴더 소스 확장: {src.get('path')} → 파일 {len(folder_sources):,}개")
+                expanded_sources.extend(folder_sources)
+            except Exception as e:
+                logger.error(f"❌ 폴더 소스 확장 실패 ({src.get('path')}): {str(e)}")
+                expanded_sources.append(src)  # 실패 결과로 보고되도록 그대로 둠
+        # 이미지 폴더 처리 (이전 설정 호환)
+        elif isinstance(src, dict) and src.get("type") == "image_folder":
             # 폴더 내 각 이미지 파일을 개별 소스로 추가
             for file_path in src.get("files", []):
                 expanded_sources.append({
@@ -599,13 +2167,31 @@ def parse_sources(sources: List[SourceType], max_workers: int = 4) -> List[str]:
     sources = expanded_sources
     total = len(sources)
     
-    logger.info(f"🔄 {total}개 소스 파싱 시작 (병렬 처리: {max_workers}개 작업자)")
+    io_workers = max(1, max_workers, min(IO_THREAD_WORKERS, total))
+    logger.info(f"🔄 {total}개 소스 파싱 시작 (I/O 스레드 {io_workers}개, CPU 프로세스 {CPU_PROCESS_WORKERS}개)")
     
-    # 기존 코드는 그대로 유지...
+    # 작업 비용 추정 후 큰 작업부터 제출 (목록 끝의 큰 PDF 때문에 마지막에 작업자가 노는 시간 감소)
+    stage_started = time.time()
+    web_urls = [src for src in sources if is_web_url(src) and get_wikipedia_api_target(src) is None]
+    # 동시 요청 한도 안에 모두 들어가면 순서가 의미 없으므로 크기 확인 생략
+    content_lengths = preflight_content_lengths(web_urls) if len(web_urls) > (max_in_flight if async_fetch else io_workers) else {}
+    pdf_count = sum(1 for src in sources if isinstance(src, dict) and str(src.get("path", "")).lower().endswith(".pdf"))
+    count_pages = pdf_count <= PREFLIGHT_MAX_PAGE_COUNTS
+    costs = [estimate_source_cost(src, content_lengths.get(src) if isinstance(src, str) else None, count_pages)
+             for src in sources]
+    schedule = longest_first(costs)
+    url_costs = [costs[i] for i in range(total) if is_web_url(sources[i])]
+    other_costs = [costs[i] for i in range(total) if not is_web_url(sources[i])]
+    predicted_seconds = max(predict_makespan(url_costs, max_in_flight if async_fetch else io_workers),
+                            predict_makespan(other_costs, min(io_workers, max(1, CPU_PROCESS_WORKERS))))
+    logger.info(f"📐 작업 비용 추정 완료 ({time.time() - stage_started:.2f}초): 예상 파싱 시간 {predicted_seconds:.1f}초"
+                + (f", 가장 큰 작업 #{schedule[0]+1} ({costs[schedule[0]]:.1f}초)" if schedule else ""))
     
     # 소스 타입에 따른 파싱 함수 매핑
-    def parse_source(src_with_index: Tuple[int, SourceType]) -> Tuple[int, str, bool]:
+    def parse_source(src_with_index: Tuple[int, SourceType]) -> Tuple[int, ParseResult]:
         idx, src = src_with_index
+        started = time.time()
+        source_name = src if isinstance(src, str) else str(src.get("path", "")) if isinstance(src, dict) else repr(src)
         
         try:
             logger.info(f"[{idx+1}/{total}] 소스 파싱 중...")
@@ -613,26 +2199,55 @@ def parse_sources(sources: List[SourceType], max_workers: int = 4) -> List[str]:
             if isinstance(src, str):
                 # URL 확인
                 if src.startswith(('http://', 'https://')):
-                    parsed = parse_url(src)
+                    result = parse_url(src, use_cache=use_cache, max_bytes=max_download_bytes)
                 else:
                     logger.warning(f"⚠️ 인식할 수 없는 소스 형식: {src}")
-                    parsed = f"인식할 수 없는 소스 형식: {src}"
-                    return idx, parsed, False
+                    return idx, ParseResult.failure(src, "unknown", f"인식할 수 없는 소스 형식: {src}",
+                                                    started, status=STATUS_UNSUPPORTED)
             elif isinstance(src, dict):
-                src_type = src.get("type", "").lower()
                 path = src.get("path", "")
+                src_type = src.get("type", "").lower() or os.path.splitext(path)[1].lstrip('.').lower()
                 
                 if not os.path.exists(path):
                     logger.error(f"❌ 파일을 찾을 수 없음: {path}")
-                    return idx, f"파일을 찾을 수 없음: {path}", False
+                    return idx, ParseResult.failure(path, src_type, f"파일을 찾을 수 없음: {path}", started)
+                
+                # 내용 해시 기반 캐시 확인 (동일 파일은 다시 파싱하지 않음)
+                cache_key = None
+                if use_cache:
+                    try:
+                        is_image = src_type in IMAGE_TYPES or any(path.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff'])
+                        ocr_engine = None
+                        if is_image:
+                            ocr_engine = src.get("ocr_engine", "google")
+                        elif src_type == "pdf" or path.lower().endswith(".pdf"):
+                            ocr_engine = src.get("ocr_engine", PDF_OCR_ENGINE)
+                        cache_key = get_source_cache_key(path, src_type, ocr_engine)
+                        cached = source_cache.get(cache_key)
+                        if cached:
+                            logger.info(f"⚡ 캐시에서 파싱 결과 로드: {os.path.basename(path)}")
+                            return idx, ParseResult.from_text(path, src_type, cached, started, metadata={"cache": "hit"})
+                    except Exception as e:
+                        logger.warning(f"⚠️ 파싱 캐시 조회 실패 ({path}): {str(e)}")
+                        cache_key = None
                 
                 if src_type == "pdf" or path.lower().endswith(".pdf"):
-                    parsed = parse_pdf(path)
+                    page_count = get_pdf_page_count(path)
+                    ocr_engine = src.get("ocr_engine", PDF_OCR_ENGINE)
+                    if spool_dir and page_count >= PDF_STREAM_MIN_PAGES:
+                        # 대용량 PDF는 파일로 바로 스트리밍 (전체를 메모리/캐시에 올리지 않음)
+                        result = stream_pdf_to_file(path, os.path.join(spool_dir, f"spooled_source_{idx+1}.txt"),
+                                                    ocr_engine=ocr_engine)
+                        cache_key = None
+                    else:
+                        # 텍스트 추출은 프로세스 풀에서 (큰 PDF는 페이지 범위로 나누어, 작은 PDF는 작업 하나로),
+                        # 스캔 페이지 OCR API 호출은 이 스레드가 관리하는 스레드 풀에서 실행
+                        result = parse_pdf(path, None if page_count >= PDF_PARALLEL_MIN_PAGES else False, ocr_engine)
                 elif src_type == "docx" or path.lower().endswith(".docx"):
-                    parsed = parse_docx(path)
+                    result = run_cpu_job(parse_docx, path)
                 elif src_type == "txt" or path.lower().endswith(".txt"):
-                    parsed = parse_txt(path)
-                elif any(path.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']):
+                    result = parse_txt(path)
+                elif src_type in IMAGE_TYPES or any(path.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff']):
                     # 기본 엔진으로 Google Vision 사용 (옵션으로 변경 가능)
                     engine = src.get("ocr_engine", "google")  # "google", "aws", "azure", "naver" 중 선택
                     
@@ -643,70 +2258,202 @@ def parse_sources(sources: List[SourceType], max_workers: int = 4) -> List[str]:
                         engine = "google"
                     
                     logger.info(f"🔍 이미지 처리 중: {os.path.basename(path)} (OCR 엔진: {engine})")
-                    parsed = parse_cloud_ocr(path, engine=engine)
+                    result = parse_image(path, engine=engine)
                 else:
                     logger.warning(f"⚠️ 지원하지 않는 파일 형식: {src}")
-                    parsed = f"지원하지 않는 파일 형식: {src.get('path', '')}"
-                    return idx, parsed, False
+                    return idx, ParseResult.failure(path, src_type, f"지원하지 않는 파일 형식: {path}",
+                                                    started, status=STATUS_UNSUPPORTED)
+                
+                # 성공한 파싱 결과만 캐시에 저장 (OCR 호출이 실패한 스캔 페이지가 있으면 다음 실행에서 다시 시도,
+                # OCR 엔진이 아예 없어 건너뛴 경우는 다시 시도해도 같으므로 캐시)
+                if cache_key and result.ok and not result.metadata.get("ocr_skipped"):
+                    source_cache.set(cache_key, result.text)
             else:
                 logger.warning(f"⚠️ 알 수 없는 소스 유형: {type(src)}")
-                parsed = ""
-                return idx, parsed, False
-
-            # 성공적으로 파싱된 텍스트 길이 확인
-            success = parsed and len(parsed) > 100  # 최소 길이 기준
-            return idx, parsed, success
+                return idx, ParseResult.failure(source_name, "unknown", f"알 수 없는 소스 유형: {type(src).__name__}",
+                                                started, status=STATUS_UNSUPPORTED)
+            
+            # 캐시 확인 등을 포함한 전체 소요 시간
+            result.elapsed = time.time() - started
+            return idx, result
             
         except Exception as e:
             logger.error(f"❌ 소스 파싱 중 예외 발생: {str(e)}")
-            return idx, f"파싱 중 오류 발생: {str(e)}", False
+            return idx, ParseResult.failure(source_name, "unknown", f"파싱 중 오류 발생: {str(e)}", started)
+    
+    def parse_prefetched_url(idx: int, url: str, cached: Optional[Dict[str, Any]],
+                             fetch_future: concurrent.futures.Future) -> Tuple[int, ParseResult]:
+        """비동기 엔진으로 다운로드를 마친 URL의 본문 추출"""
+        logger.info(f"[{idx+1}/{total}] 소스 파싱 중...")
+        return idx, parse_fetched_url(url, fetch_future.result(), cached, use_cache)
+    
+    # 완료 순서대로 결과를 받는 큐 (URL 작업은 다운로드 완료 시점에 제출되므로 Future 목록 대신 사용)
+    result_queue = queue.Queue()
+    started_at = {}  # 소스 인덱스 -> 작업 시작 시각 (소스별 제한 시간 기준)
+    job_futures = {}  # 소스 인덱스 -> 제한 시간 초과 시 취소할 Future (작업 또는 다운로드)
+    timed_out = set()  # 제한 시간을 넘겨 결과를 기다리지 않는 소스 인덱스
+    
+    def run_job(idx: int, func, *args) -> None:
+        started_at.setdefault(idx, time.time())
+        try:
+            item = func(*args)
+        except Exception as e:
+            logger.error(f"❌ 소스 #{idx+1} 결과 처리 오류: {str(e)}")
+            item = (idx, ParseResult.failure(str(sources[idx]), "unknown", f"파싱 중 예외 발생: {str(e)}"))
+        if idx in timed_out:
+            # 제한 시간 이후 도착한 결과는 버림 (스트리밍 기록 파일도 정리)
+            late_result = item[1]
+            if isinstance(late_result.text, SpooledText) and os.path.exists(late_result.text.path):
+                os.remove(late_result.text.path)
+            logger.info(f"ℹ️ 소스 #{idx+1} 제한 시간 이후 완료되어 결과를 버림 ({time.time() - started_at[idx]:.1f}초)")
+            return
+        result_queue.put(item)
+    
+    def expire_source(idx: int, reason: str) -> ParseResult:
+        """제한 시간을 넘긴 소스의 작업을 취소하고 시간 초과 결과 생성"""
+        timed_out.add(idx)
+        future = job_futures.get(idx)
+        if future is not None:
+            future.cancel()  # 시작 전 작업과 다운로드 중인 URL은 취소, 실행 중인 파싱 작업은 결과만 버림
+        src = sources[idx]
+        if isinstance(src, dict):
+            name, src_type = str(src.get("path", "")), src.get("type", "unknown")
+        else:
+            name, src_type = str(src), "url" if is_web_url(src) else "unknown"
+        logger.warning(f"⏰ 소스 #{idx+1} {reason}: {name[:60]}")
+        return ParseResult.failure(name, src_type, reason, started_at.get(idx), status=STATUS_TIMEOUT)
+    
+    # 웹 URL 비동기 다운로드 엔진 (넘겨받지 않았으면 미리 파싱하지 않은 웹 URL이 있을 때 생성)
+    owns_fetcher = False
     
     # 병렬 처리 실행
     results = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, total)) as executor:
+    finished = set()
+    stage_deadline = time.time() + stage_timeout if stage_timeout else None
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=io_workers)
+    try:
         # 작업 제출
-        future_to_idx = {executor.submit(parse_source, (i, src)): i for i, src in enumerate(sources)}
+        prefetched_count = 0
+        for i in schedule:
+            src = sources[i]
+            prefetched = prefetcher.claim(src) if prefetcher else None
+            if prefetched is not None:
+                # 입력 중 미리 시작한 파싱 결과 사용 (제한 시간은 넘겨받은 시점부터)
+                def on_prefetched(future, idx=i, src=src):
+                    if future.cancelled():
+                        return  # 제한 시간 초과로 취소된 작업
+                    try:
+                        result_queue.put((idx, future.result()))
+                    except Exception as e:
+                        result_queue.put((idx, ParseResult.failure(str(src), "unknown", f"파싱 중 예외 발생: {str(e)}")))
+                
+                prefetched_count += 1
+                started_at[i] = time.time()
+                job_futures[i] = prefetched
+                prefetched.add_done_callback(on_prefetched)
+            elif async_fetch and is_web_url(src) and get_wikipedia_api_target(src) is None:
+                if fetcher is None and prefetcher is not None:
+                    fetcher = prefetcher.get_fetcher()
+                elif fetcher is None:
+                    fetcher = AsyncFetcher(
+                        max_in_flight=max_in_flight,
+                        per_host_limit=per_host_limit,
+                        http2=http2,
+                        headers=DEFAULT_REQUEST_HEADERS,
+                        max_bytes=max_download_bytes
+                    )
+                    owns_fetcher = True
+                    logger.info(f"🌐 비동기 다운로드 엔진 사용 (전체 {max_in_flight}개, 호스트별 {per_host_limit}개 동시 요청)")
+                
+                cached, cached_result = lookup_url_cache(src, use_cache)
+                if cached_result is not None:
+                    result_queue.put((i, cached_result))
+                    continue
+                
+                # 다운로드가 끝나면 본문 추출 작업을 작업자 풀에 제출
+                def on_fetched(future, idx=i, url=src, cached=cached):
+                    if future.cancelled():
+                        return  # 제한 시간 초과로 취소된 다운로드
+                    try:
+                        job_futures[idx] = executor.submit(run_job, idx, parse_prefetched_url, idx, url, cached, future)
+                    except Exception as e:
+                        result_queue.put((idx, ParseResult.failure(url, "url", f"파싱 중 예외 발생: {str(e)}")))
+                
+                started_at[i] = time.time()  # URL은 다운로드 요청 시점부터 제한 시간 적용
+                job_futures[i] = fetcher.submit(src, build_url_request_headers(cached))
+                job_futures[i].add_done_callback(on_fetched)
+            else:
+                job_futures[i] = executor.submit(run_job, i, parse_source, (i, src))
         
-        # 결과 수집
-        for future in concurrent.futures.as_completed(future_to_idx):
+        if prefetched_count:
+            logger.info(f"⚡ 미리 파싱한 소스 {prefetched_count}개의 결과를 사용합니다")
+        
+        # 결과 수집 (제한 시간을 넘긴 소스는 기다리지 않음)
+        while len(finished) < total:
+            wait = None
+            if source_timeout or web_source_timeout or stage_deadline:
+                wait = DEADLINE_POLL_SECONDS
+                if stage_deadline:
+                    wait = min(wait, max(0.0, stage_deadline - time.time()))
+            
             try:
-                idx, parsed_text, success = future.result()
-                results.append((idx, parsed_text, success))
-                
-                if success:
+                idx, result = result_queue.get(timeout=wait)
+            except queue.Empty:
+                idx, result = None, None
+            
+            if result is not None and idx not in finished:
+                finished.add(idx)
+                results.append((idx, result))
+                if result.ok:
                     successful_sources += 1
-                    logger.info(f"✅ 소스 #{idx+1} 파싱 성공")
+                    logger.info(f"✅ 소스 #{idx+1} 파싱 성공 ({result.elapsed:.2f}초)")
                 else:
                     failed_sources += 1
-                    logger.warning(f"⚠️ 소스 #{idx+1} 파싱 결과 불충분")
-                
-            except Exception as e:
-                idx = future_to_idx[future]
-                logger.error(f"❌ 소스 #{idx+1} 결과 처리 오류: {str(e)}")
-                results.append((idx, f"파싱 중 예외 발생: {str(e)}", False))
-                failed_sources += 1
+                    logger.warning(f"⚠️ 소스 #{idx+1} 파싱 실패 ({result.status}): {result.error}")
+            
+            # 제한 시간 확인
+            now = time.time()
+            if stage_deadline and now >= stage_deadline:
+                for i in range(total):
+                    if i not in finished:
+                        finished.add(i)
+                        failed_sources += 1
+                        results.append((i, expire_source(i, f"파싱 단계 제한 시간({stage_timeout:.0f}초) 초과")))
+                break
+            if source_timeout or web_source_timeout:
+                for i, started in list(started_at.items()):
+                    limit = source_timeout or (web_source_timeout if isinstance(sources[i], str) else None)
+                    if i not in finished and limit and now - started >= limit:
+                        finished.add(i)
+                        failed_sources += 1
+                        results.append((i, expire_source(i, f"소스 제한 시간({limit:.0f}초) 초과")))
+    finally:
+        # 제한 시간을 넘긴 작업이 있으면 끝나기를 기다리지 않음 (결과는 run_job에서 버림)
+        executor.shutdown(wait=not timed_out, cancel_futures=bool(timed_out))
+        if owns_fetcher:
+            fetcher.close()
     
     # 원래 순서대로 정렬
     results.sort(key=lambda x: x[0])
-    parsed_texts = [result[1] for result in results]
     
     logger.info(f"🏁 소스 파싱 완료: 성공 {successful_sources}개, 실패 {failed_sources}개")
+    logger.info(format_stage_timing("소스 파싱", predicted_seconds, time.time() - stage_started))
     
-    return parsed_texts
+    return [result for _, result in results]
 
 if __name__ == "__main__":
     # 테스트 코드
     test_url = "https://en.wikipedia.org/wiki/Artificial_intelligence"
     logger.info("위키피디아 URL 테스트 중...")
     wiki_content = parse_url(test_url)
-    logger.info(f"파싱된 내용 일부:\n{wiki_content[:500]}...")
+    logger.info(f"파싱된 내용 일부:\n{str(wiki_content.text)[:500]}...")
     
     # YouTube 테스트
     youtube_url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
     logger.info("\nYouTube URL 테스트 중...")
     try:
         yt_content = parse_url(youtube_url)
-        logger.info(f"파싱된 내용 일부:\n{yt_content[:500]}...")
+        logger.info(f"파싱된 내용 일부:\n{str(yt_content.text)[:500]}...")
     except Exception as e:
         logger.error(f"YouTube 테스트 오류: {str(e)}")
     
@@ -719,4 +2466,4 @@ if __name__ == "__main__":
     
     parsed_results = parse_sources(test_sources)
     for i, result in enumerate(parsed_results):
-        logger.info(f"소스 #{i+1} 결과 일부:\n{result[:200]}...")
\ No newline at end of file
+        logger.info(f"소스 #{i+1} {result.describe()}\n{str(result.text)[:200]}...")
\ No newline at end of file
@@ -0,0 +1,124 @@
+import os
+from typing import Iterator, Optional, Union
+
+# 기본 설정
+DEFAULT_CHUNK_CHARS = 1024 * 1024  # 지연 읽기 단위 (약 100만 자)
+
+class SpooledText:
+    """
+    디스크 파일에 저장된 대용량 소스 텍스트
+
+    전체 내용을 메모리에 올리지 않고 파일 경로와 글자 수만 보관하며,
+    하위 단계에서는 필요한 만큼만 read()/iter_chunks()로 읽습니다.
+    """
+
+    def __init__(self, path: str, char_count: int):
+        """
+        초기화
+
+        Args:
+            path: UTF-8 텍스트 파일 경로
+            char_count: 파일에 저장된 글자 수
+        """
+        self.path = path
+        self.char_count = char_count
+
+    def __len__(self) -> int:
+        return self.char_count
+
+    def __repr__(self) -> str:
+        return f"SpooledText(path={self.path!r}, chars={self.char_count})"
+
+    def __str__(self) -> str:
+        # 전체 문자열이 꼭 필요한 경우에만 사용 (메모리에 모두 로드됨)
+        return self.read()
+
+    def read(self, limit: Optional[int] = None) -> str:
+        """
+        앞에서부터 최대 limit 글자 읽기
+
+        Args:
+            limit: 읽을 최대 글자 수 (None이면 전체)
+
+        Returns:
+            읽은 텍스트
+        """
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return f.read() if limit is None else f.read(limit)
+
+    def iter_chunks(self, chunk_chars: int = DEFAULT_CHUNK_CHARS) -> Iterator[str]:
+        """
+        파일을 일정 크기 조각으로 나누어 순서대로 반환
+
+        Args:
+            chunk_chars: 조각당 글자 수
+
+        Yields:
+            텍스트 조각
+        """
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for chunk in iter(lambda: f.read(chunk_chars), ''):
+                yield chunk
+
+    def iter_lines(self) -> Iterator[str]:
+        """파일을 한 줄씩 반환 (줄바꿈 제외)"""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield line.rstrip('\n')
+
+    def move_to(self, new_path: str) -> None:
+        """저장 파일을 다른 경로로 이동 (예: 프로젝트 sources/ 폴더의 최종 파일명)"""
+        if os.path.abspath(new_path) != os.path.abspath(self.path):
+            os.replace(self.path, new_path)
+            self.path = new_path
+
+class SpooledTextWriter:
+    """텍스트를 받는 즉시 파일에 기록하고 글자 수를 세는 작성기"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.char_count = 0
+        self._file = None
+        self._started = False
+
+    def __enter__(self) -> "SpooledTextWriter":
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._file.close()
+        if exc_type is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def write_line(self, line: str) -> None:
+        """한 줄 기록 (첫 줄이 아니면 앞에 줄바꿈 추가 - '\\n'.join과 같은 결과)"""
+        if self._started:
+            self._file.write('\n')
+            self.char_count += 1
+        self._started = True
+        self._file.write(line)
+        self.char_count += len(line)
+
+    def result(self) -> SpooledText:
+        """기록된 파일을 SpooledText로 반환"""
+        return SpooledText(self.path, self.char_count)
+
+def text_prefix(text: Union[str, SpooledText], limit: int) -> str:
+    """문자열 또는 SpooledText의 앞부분 limit 글자 반환"""
+    if isinstance(text, SpooledText):
+        return text.read(limit)
+    return text[:limit]
+
+def is_blank(text: Union[str, SpooledText]) -> bool:
+    """비어 있거나 공백만 있는 텍스트인지 확인 (SpooledText는 앞부분만 확인)"""
+    if isinstance(text, SpooledText):
+        return not text.read(4096).strip() and len(text) <= 4096
+    return not text.strip()
+
+def iter_text_lines(text: Union[str, SpooledText]) -> Iterator[str]:
+    """문자열 또는 SpooledText를 한 줄씩 반환 (줄바꿈 제외, SpooledText는 파일에서 순차적으로 읽음)"""
+    if isinstance(text, SpooledText):
+        yield from text.iter_lines()
+    else:
+        yield from text.split('\n')
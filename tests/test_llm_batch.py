@@ -0,0 +1,155 @@
+import itertools
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import llm_batch
+from llm_batch import chat_request, request_custom_id, run_chat_batch, batch_state_path
+
+
+class BatchStubServer:
+    """OPENAI_BATCH_BASE_URL로 지정할 로컬 배치 API 대역 (파일 업로드, 배치 생성/조회, 결과 파일)"""
+
+    def __init__(self, fail_once_prefix=None, polls_to_complete=2):
+        self.files = {}
+        self.batches = {}
+        self.created = []
+        self.fail_once_prefix = fail_once_prefix
+        self.failed = set()
+        self.polls_to_complete = polls_to_complete
+        self._ids = itertools.count(1)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, body, content_type="application/json"):
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                data = self.rfile.read(int(self.headers["Content-Length"])).decode("utf-8")
+                if self.path.endswith("/files"):
+                    lines = [line for line in data.splitlines() if line.startswith('{"custom_id"')]
+                    file_id = f"file-{next(stub._ids)}"
+                    stub.files[file_id] = "\n".join(lines)
+                    return self._send(json.dumps({"id": file_id, "object": "file", "bytes": len(data),
+                                                  "created_at": 0, "filename": "input.jsonl",
+                                                  "purpose": "batch", "status": "processed"}))
+                request = json.loads(data)
+                batch_id = f"batch-{next(stub._ids)}"
+                stub.created.append(batch_id)
+                stub.batches[batch_id] = {"id": batch_id, "object": "batch", "endpoint": request["endpoint"],
+                                          "input_file_id": request["input_file_id"], "completion_window": "24h",
+                                          "status": "in_progress", "created_at": 0, "polls": 0}
+                return self._send(json.dumps(stub._public(batch_id)))
+
+            def do_GET(self):
+                match = re.search(r"/batches/([^/]+)$", self.path)
+                if match:
+                    stub._poll(match.group(1))
+                    return self._send(json.dumps(stub._public(match.group(1))))
+                match = re.search(r"/files/([^/]+)/content$", self.path)
+                return self._send(stub.files[match.group(1)], "application/octet-stream")
+
+        return Handler
+
+    def _public(self, batch_id):
+        return {key: value for key, value in self.batches[batch_id].items() if key != "polls"}
+
+    def _poll(self, batch_id):
+        batch = self.batches[batch_id]
+        batch["polls"] += 1
+        if batch["status"] == "completed" or batch["polls"] < self.polls_to_complete:
+            return
+        output = []
+        for line in self.files[batch["input_file_id"]].splitlines():
+            item = json.loads(line)
+            custom_id = item["custom_id"]
+            if self.fail_once_prefix and custom_id.startswith(self.fail_once_prefix) and custom_id not in self.failed:
+                self.failed.add(custom_id)
+                output.append({"custom_id": custom_id, "error": None,
+                               "response": {"status_code": 500, "body": {"error": "boom"}}})
+                continue
+            content = f" answer:{item['body']['messages'][0]['content']} "
+            output.append({"custom_id": custom_id, "error": None,
+                           "response": {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}}})
+        output_id = f"file-{next(self._ids)}"
+        self.files[output_id] = "\n".join(json.dumps(item) for item in output)
+        batch.update(status="completed", output_file_id=output_id)
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def batch_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(llm_batch, "BATCH_STATE_DIR", str(tmp_path / "llm_batches"))
+    monkeypatch.setattr(llm_batch, "is_llm_cache_enabled", lambda: False)
+    monkeypatch.setattr(llm_batch, "_batch_client", None)
+
+    def use_server(server):
+        monkeypatch.setattr(llm_batch, "BATCH_BASE_URL", server.base_url)
+        monkeypatch.setattr(llm_batch, "_batch_client", None)
+
+    return use_server
+
+
+def make_requests(*prompts):
+    requests = {}
+    for number, prompt in enumerate(prompts, 1):
+        body = chat_request(prompt, "gpt-4o-mini", 0.2, 100)
+        requests[request_custom_id(f"source-{number}", body)] = body
+    return requests
+
+
+def test_run_chat_batch_maps_results_and_resubmits_failures(batch_env):
+    requests = make_requests("first", "second", "third")
+    with BatchStubServer(fail_once_prefix="source-2-") as server:
+        batch_env(server)
+        results = run_chat_batch(requests, poll_seconds=0.01)
+
+    assert len(server.created) == 2  # 실패한 요청 하나만 다시 제출
+    assert [results[custom_id] for custom_id in requests] == ["answer:first", "answer:second", "answer:third"]
+
+
+def test_run_chat_batch_resumes_in_flight_batch_from_request_keyed_state(batch_env):
+    requests = make_requests("first", "second")
+    with BatchStubServer(polls_to_complete=5) as server:
+        batch_env(server)
+        # 첫 실행은 배치가 끝나기 전에 대기 시간이 끝남 - 배치 ID만 상태 파일에 남음
+        assert run_chat_batch(requests, poll_seconds=0.01, max_wait=0.02) == {}
+        with open(batch_state_path(requests), encoding="utf-8") as f:
+            assert json.load(f)["batch_id"] == server.created[0]
+
+        # 다른 출력 폴더에서 다시 실행해도 같은 요청 묶음이면 새로 제출하지 않고 이어서 기다림
+        results = run_chat_batch(requests, poll_seconds=0.01)
+
+    assert server.created == [server.created[0]]
+    assert sorted(results.values()) == ["answer:first", "answer:second"]
+
+
+def test_batch_state_path_depends_on_request_bodies():
+    requests = make_requests("first")
+    changed = {custom_id: dict(body, temperature=0.9) for custom_id, body in requests.items()}
+
+    assert batch_state_path(requests) == batch_state_path(dict(requests))
+    assert batch_state_path(requests) != batch_state_path(changed)
@@ -0,0 +1,100 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+import source_parser_updated
+from disk_cache import DiskCache
+from source_parser_updated import clean_text, format_wikipedia_extract, parse_wikipedia_api
+
+EXTRACT = """Intro paragraph about the rifle.
+
+== History ==
+Designed in 1947.
+
+=== Production ===
+Built in many countries.
+
+== References ==
+Some citation.
+"""
+
+
+class WikipediaStubServer:
+    """WIKIPEDIA_API_BASE로 지정할 로컬 MediaWiki API 대역 (action=query, formatversion=2 응답)"""
+
+    def __init__(self, revision=1001):
+        self.revision = revision
+        self.queries = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.api_base = f"http://127.0.0.1:{self.server.server_address[1]}/w/api.php"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                params = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+                stub.queries.append(params)
+                page = {"pageid": 1, "ns": 0, "title": params["titles"], "lastrevid": stub.revision}
+                if "extracts" in params["prop"].split("|"):
+                    page["extract"] = EXTRACT
+                data = json.dumps({"query": {"pages": [page]}}).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def wikipedia_stub(tmp_path, monkeypatch):
+    monkeypatch.setattr(source_parser_updated, "http_cache", DiskCache(str(tmp_path / "http")))
+    with WikipediaStubServer() as server:
+        monkeypatch.setattr(source_parser_updated, "WIKIPEDIA_API_BASE", server.api_base)
+        yield server
+
+
+def test_parse_wikipedia_api_formats_title_toc_and_body_in_one_query(wikipedia_stub):
+    result = parse_wikipedia_api("https://en.wikipedia.org/wiki/AK-47")
+
+    layout = format_wikipedia_extract("AK-47", EXTRACT)
+    assert layout == ("AK-47\n\n"
+                      "목차: History, Production\n\n"
+                      "Intro paragraph about the rifle.\nDesigned in 1947.\nBuilt in many countries.")
+    assert result.ok
+    assert result.text == clean_text(layout)
+    assert result.metadata["revision"] == 1001
+    assert len(wikipedia_stub.queries) == 1
+    assert wikipedia_stub.queries[0]["prop"] == "info|extracts"
+
+
+def test_parse_wikipedia_api_uses_revision_keyed_cache(wikipedia_stub):
+    url = "https://en.wikipedia.org/wiki/AK-47"
+    first = parse_wikipedia_api(url)
+    second = parse_wikipedia_api(url)
+
+    assert second.metadata.get("cache") == "revision"
+    assert second.text == first.text
+    assert len(wikipedia_stub.queries) == 2  # 캐시 적중 시에도 요청은 한 번뿐
+
+    # 문서가 수정되면 새 리비전으로 다시 변환
+    wikipedia_stub.revision = 1002
+    third = parse_wikipedia_api(url)
+    assert third.metadata.get("cache") is None
+    assert third.metadata["revision"] == 1002